@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+
+# Authored by Amelia Thurdekoos
+# Email: ameliathurdekoos@gmail.com
+#
+# Any cares, concerns, compliments, or enhancements are always welcome!
+
+"""
+Benchmark suite for the OpenTeams PPTX generator.
+
+Micro benchmarks time single calls — hex_to_rgbcolor, make_gradient_rect,
+SlideBuilder.add_card / add_body / add_bullet_list and every renderer in
+RENDERERS — on a fresh presentation per repeat. Macro benchmarks run
+generate() end to end at several deck sizes, each in its own process so
+peak RSS is per run: the demo deck cycled (generate_N) and a text-heavy
+synthetic deck of agenda, content and metrics slides (generate_text_N).
+
+Usage:
+  python benchmarks/bench.py run --out results.json
+  python benchmarks/bench.py run --out quick.json --sizes 10 100 --repeat 3
+  python benchmarks/bench.py run --out text.json --skip-micro --sizes --text-sizes 500
+  python benchmarks/bench.py compare baseline.json results.json --fail-over 10
+
+Results are JSON: per-call times in microseconds for micro benchmarks and
+wall time, peak RSS and output size for macro benchmarks.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPTS_DIR = os.path.join(BENCH_DIR, "..", "scripts")
+BRAND_JSON = os.path.join(BENCH_DIR, "..", "references", "brand.json")
+sys.path.insert(0, SCRIPTS_DIR)
+sys.path.insert(0, BENCH_DIR)
+
+DEFAULT_SIZES = [10, 100, 1000, 10000]
+DEFAULT_TEXT_SIZES = [100, 1000]
+# List items and body lines per slide in the text-heavy decks
+TEXT_HEAVY_LINES = 20
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _quiet() -> None:
+    logging.disable(logging.WARNING)
+
+
+def make_spec(n_slides: int) -> dict:
+    """A deck of ``n_slides`` cycling through every demo slide type."""
+    from generate_deck import DEMO_SPEC
+
+    demo = DEMO_SPEC["slides"]
+    return {"title": f"Benchmark {n_slides}",
+            "slides": [dict(demo[i % len(demo)]) for i in range(n_slides)]}
+
+
+def make_text_spec(n_slides: int) -> dict:
+    """A deck of ``n_slides`` long agenda, content and metrics slides."""
+    from synthetic import synthetic_spec
+
+    return synthetic_spec(n_slides, mix={"agenda": 1, "content": 1, "metrics": 1},
+                          items=TEXT_HEAVY_LINES, body_lines=TEXT_HEAVY_LINES)
+
+
+def _peak_rss_mb() -> Optional[float]:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return round(rss / (1 << 20 if sys.platform == "darwin" else 1 << 10), 1)
+
+
+# ---------------------------------------------------------------------------
+# Micro benchmarks
+# ---------------------------------------------------------------------------
+
+def time_calls(setup: Callable[[], Callable[[], object]], number: int,
+               repeat: int) -> Dict[str, float]:
+    """Time ``number`` calls per repeat; ``setup`` returns a fresh callable each repeat."""
+    per_call = []
+    for _ in range(repeat):
+        fn = setup()
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        per_call.append((time.perf_counter() - start) / number * 1e6)
+    return {"median_us": round(statistics.median(per_call), 2),
+            "min_us": round(min(per_call), 2), "calls": number, "repeat": repeat}
+
+
+def micro_cases() -> Dict[str, tuple]:
+    """name -> (setup, calls per repeat). Each setup builds its own presentation."""
+    from pptx.util import Inches
+    from brand_engine import load_brand, build_theme
+    from generate_deck import DEMO_SPEC, new_presentation
+    from pptx_helpers import hex_to_rgbcolor, make_gradient_rect
+    from slide_builder import SlideBuilder
+    from slide_renderers import RENDERERS
+    from spec_models import SLIDE_MODELS, parse_slide
+
+    theme = build_theme(load_brand(BRAND_JSON))
+
+    def builder():
+        return SlideBuilder(new_presentation(theme), theme)
+
+    def on_slide(call):
+        def setup():
+            sb = builder()
+            slide = sb.new_slide()
+            return lambda: call(sb, slide)
+        return setup
+
+    cases = {
+        "hex_to_rgbcolor": (lambda: lambda: hex_to_rgbcolor("#4D75FE"), 20000),
+        "make_gradient_rect": (on_slide(lambda sb, s: make_gradient_rect(
+            s, 0, 0, sb.W, sb.H, theme.night_navy, theme.day_blue, angle=135)), 200),
+        "SlideBuilder.add_card": (on_slide(lambda sb, s: sb.add_card(
+            s, Inches(1), Inches(1), Inches(3), Inches(2))), 200),
+        "SlideBuilder.add_body": (on_slide(lambda sb, s: sb.add_body(
+            s, "Benchmark body text\nwith a second line", font_size=14)), 200),
+        "SlideBuilder.add_bullet_list": (on_slide(lambda sb, s: sb.add_bullet_list(
+            s, [f"Benchmark item {i}" for i in range(TEXT_HEAVY_LINES)])), 100),
+    }
+
+    examples = {s["type"]: s for s in DEMO_SPEC["slides"]}
+    for stype, renderer in RENDERERS.items():
+        spec = (parse_slide(1, examples[stype])[0] if stype in examples
+                else SLIDE_MODELS[stype]())
+
+        def setup(renderer=renderer, spec=spec):
+            sb = builder()
+            return lambda: renderer(sb, spec)
+        cases[f"render_{stype}"] = (setup, 25)
+    return cases
+
+
+def run_micro(repeat: int, only: Optional[List[str]] = None) -> Dict[str, dict]:
+    results = {}
+    for name, (setup, number) in micro_cases().items():
+        if only and not any(pattern in name for pattern in only):
+            continue
+        results[name] = time_calls(setup, number, repeat)
+        print(f"  {name:<28} {results[name]['median_us']:>12,.1f} µs/call", file=sys.stderr)
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Macro benchmarks
+# ---------------------------------------------------------------------------
+
+def macro_child(n_slides: int, kind: str = "demo") -> dict:
+    """Run generate() once in this process and measure it (see run_macro)."""
+    from generate_deck import generate
+
+    spec = make_text_spec(n_slides) if kind == "text" else make_spec(n_slides)
+    with tempfile.TemporaryDirectory() as tmp:
+        out = os.path.join(tmp, "bench.pptx")
+        start = time.perf_counter()
+        generate(spec, BRAND_JSON, out)
+        wall = time.perf_counter() - start
+        size = os.path.getsize(out)
+    return {"slides": n_slides, "wall_s": round(wall, 3),
+            "peak_rss_mb": _peak_rss_mb(), "output_bytes": size}
+
+
+def run_macro(sizes: List[int], repeat: int, kind: str = "demo") -> Dict[str, dict]:
+    """Each size runs in a fresh interpreter so peak RSS isn't shared between runs."""
+    prefix = "generate_text" if kind == "text" else "generate"
+    results = {}
+    for n in sizes:
+        runs = []
+        for _ in range(repeat):
+            proc = subprocess.run([sys.executable, os.path.abspath(__file__),
+                                   "_macro", str(n), kind],
+                                  capture_output=True, text=True, check=True)
+            runs.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+        best = min(runs, key=lambda r: r["wall_s"])
+        best["wall_s_median"] = round(statistics.median(r["wall_s"] for r in runs), 3)
+        best["repeat"] = repeat
+        results[f"{prefix}_{n}"] = best
+        print(f"  {prefix + '_' + str(n):<28} {best['wall_s']:>10.3f} s  "
+              f"{best['peak_rss_mb']} MB  {best['output_bytes']:,} bytes", file=sys.stderr)
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Results
+# ---------------------------------------------------------------------------
+
+def _metadata() -> dict:
+    try:
+        import pptx
+        pptx_version = pptx.__version__
+    except ImportError:
+        pptx_version = None
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=BENCH_DIR,
+                                capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "python_pptx": pptx_version,
+        "commit": commit,
+    }
+
+
+# Metric compared for each section; lower is better for all of them
+_METRICS = {"micro": ["median_us"], "macro": ["wall_s", "peak_rss_mb", "output_bytes"]}
+
+
+def compare(old: dict, new: dict) -> List[dict]:
+    """Per-benchmark, per-metric changes between two result documents."""
+    rows = []
+    for section, metrics in _METRICS.items():
+        old_sec, new_sec = old.get(section, {}), new.get(section, {})
+        for name in sorted(set(old_sec) & set(new_sec)):
+            for metric in metrics:
+                a, b = old_sec[name].get(metric), new_sec[name].get(metric)
+                if a is None or b is None:
+                    continue
+                change = (b - a) / a * 100 if a else 0.0
+                rows.append({"benchmark": name, "metric": metric, "old": a, "new": b,
+                             "change_pct": round(change, 1)})
+    return rows
+
+
+def print_comparison(rows: List[dict], fail_over: Optional[float]) -> int:
+    """Print a comparison table. Returns 1 if any change exceeds ``fail_over`` percent."""
+    regressions = 0
+    print(f"{'benchmark':<28} {'metric':<13} {'old':>14} {'new':>14} {'change':>9}")
+    for r in rows:
+        flag = ""
+        if fail_over is not None and r["change_pct"] > fail_over:
+            flag = "  ✗"
+            regressions += 1
+        print(f"{r['benchmark']:<28} {r['metric']:<13} {r['old']:>14,} {r['new']:>14,} "
+              f"{r['change_pct']:>+8.1f}%{flag}")
+    if fail_over is not None:
+        print(f"\n{regressions} metric(s) regressed by more than {fail_over}%")
+    return 1 if regressions else 0
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def main(argv=None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["_macro"]:
+        _quiet()
+        print(json.dumps(macro_child(int(argv[1]), *argv[2:3])))
+        return 0
+
+    parser = argparse.ArgumentParser(description="OpenTeams PPTX benchmarks")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="Run the benchmarks and write a JSON results file")
+    run.add_argument("--out", required=True, help="Results JSON path")
+    run.add_argument("--sizes", type=int, nargs="*", default=DEFAULT_SIZES,
+                     help="Slide counts for the generate() benchmarks (default: %(default)s)")
+    run.add_argument("--text-sizes", type=int, nargs="*", default=DEFAULT_TEXT_SIZES,
+                     help="Slide counts for the text-heavy generate() benchmarks "
+                          "(default: %(default)s)")
+    run.add_argument("--repeat", type=int, default=5,
+                     help="Repeats per micro benchmark (macro runs use min(repeat, 3))")
+    run.add_argument("--only", nargs="*",
+                     help="Only micro benchmarks whose name contains one of these")
+    run.add_argument("--skip-micro", action="store_true")
+    run.add_argument("--skip-macro", action="store_true")
+
+    cmp_ = sub.add_parser("compare", help="Diff two results files")
+    cmp_.add_argument("old")
+    cmp_.add_argument("new")
+    cmp_.add_argument("--fail-over", type=float, metavar="PCT",
+                      help="Exit 1 if any metric got worse by more than PCT percent")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "compare":
+        with open(args.old) as f:
+            old = json.load(f)
+        with open(args.new) as f:
+            new = json.load(f)
+        return print_comparison(compare(old, new), args.fail_over)
+
+    _quiet()
+    results = {"meta": _metadata(), "micro": {}, "macro": {}}
+    if not args.skip_micro:
+        print("Micro benchmarks:", file=sys.stderr)
+        results["micro"] = run_micro(args.repeat, args.only)
+    if not args.skip_macro and (args.sizes or args.text_sizes):
+        print("Macro benchmarks:", file=sys.stderr)
+        results["macro"] = run_macro(args.sizes, min(args.repeat, 3))
+        results["macro"].update(run_macro(args.text_sizes, min(args.repeat, 3), "text"))
+    with open(args.out, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"Results → {args.out}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+
+# Authored by Amelia Thurdekoos
+# Email: ameliathurdekoos@gmail.com
+#
+# Any cares, concerns, compliments, or enhancements are always welcome!
+
+"""
+Scalability harness — fail when generate() grows faster than linearly.
+
+Runs generate() on synthetic specs (synthetic.py) at increasing sizes along
+one axis, fits how wall time and peak memory grow with N, and exits 1 when
+the fitted exponent exceeds 1 + tolerance:
+
+  slides  N slides per deck (relationship / part-name bookkeeping per deck)
+  items   a fixed number of slides with N agenda items, metrics and body
+          lines each (shape-ID allocation and lookups as a slide fills up)
+
+The fit is on the marginal cost — y(N) - y(N_min) against N - N_min on a
+log-log scale — so fixed costs (imports, theme, the save) don't flatten the
+slope. Each point runs in a fresh process so peak RSS belongs to that run.
+No network is used.
+
+Usage:
+  python benchmarks/scalability.py --axis slides
+  python benchmarks/scalability.py --axis items --sizes 20 40 80 160 --tolerance 0.2
+  python benchmarks/scalability.py --axis slides --mix agenda=1,metrics=2 --json out.json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import math
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field, asdict
+from typing import Dict, List, Optional
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BENCH_DIR)
+sys.path.insert(0, os.path.join(BENCH_DIR, "..", "scripts"))
+BRAND_JSON = os.path.join(BENCH_DIR, "..", "references", "brand.json")
+
+DEFAULT_SIZES = {"slides": [250, 500, 1000, 2000], "items": [10, 20, 40, 80]}
+# Deck size for the items axis
+ITEMS_AXIS_SLIDES = 12
+# Memory growth smaller than this at the largest size is allocator noise
+MIN_MEMORY_DELTA_MB = 8.0
+
+
+@dataclass
+class Fit:
+    """Growth of one metric along the axis."""
+    metric: str
+    exponent: Optional[float]       # None when the growth is too small to fit
+    limit: float
+    points: List[List[float]] = field(default_factory=list)   # [N, value]
+
+    @property
+    def ok(self) -> bool:
+        return self.exponent is None or self.exponent <= self.limit
+
+
+# ---------------------------------------------------------------------------
+# Fitting
+# ---------------------------------------------------------------------------
+
+def growth_exponent(sizes: List[float], values: List[float]) -> Optional[float]:
+    """Least-squares slope of log(marginal value) against log(marginal N).
+
+    Marginal = relative to the smallest size, which cancels fixed costs.
+    Returns None if fewer than two points have positive marginal values.
+    """
+    base_n, base_v = sizes[0], values[0]
+    xs, ys = [], []
+    for n, v in zip(sizes[1:], values[1:]):
+        if n > base_n and v > base_v:
+            xs.append(math.log(n - base_n))
+            ys.append(math.log(v - base_v))
+    if len(xs) < 2:
+        return None
+    mx, my = sum(xs) / len(xs), sum(ys) / len(ys)
+    sxx = sum((x - mx) ** 2 for x in xs)
+    return sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / sxx
+
+
+# ---------------------------------------------------------------------------
+# Measuring
+# ---------------------------------------------------------------------------
+
+def _max_rss_mb() -> float:
+    import resource
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1 << 20 if sys.platform == "darwin" else 1 << 10)
+
+
+def spec_for(axis: str, n: int, mix: Optional[Dict[str, float]], items: int) -> dict:
+    from synthetic import synthetic_spec
+
+    if axis == "slides":
+        return synthetic_spec(n, mix=mix, items=items)
+    return synthetic_spec(ITEMS_AXIS_SLIDES,
+                          mix=mix or {"agenda": 1, "metrics": 1, "content": 1},
+                          items=n, body_lines=n)
+
+
+def measure_point(axis: str, n: int, mix: Optional[Dict[str, float]], items: int) -> dict:
+    """Generate one synthetic deck in this process (see measure)."""
+    from generate_deck import generate
+
+    spec = spec_for(axis, n, mix, items)
+    with tempfile.TemporaryDirectory() as tmp:
+        out = os.path.join(tmp, "scale.pptx")
+        rss_before = _max_rss_mb()
+        start = time.perf_counter()
+        generate(spec, BRAND_JSON, out)
+        wall = time.perf_counter() - start
+    return {"n": n, "wall_s": wall, "memory_mb": _max_rss_mb() - rss_before}
+
+
+def measure(axis: str, sizes: List[int], mix: Optional[Dict[str, float]] = None,
+            items: int = 5, repeat: int = 2) -> List[dict]:
+    """One fresh process per point; the fastest of ``repeat`` runs is kept."""
+    points = []
+    for n in sizes:
+        runs = []
+        for _ in range(repeat):
+            args = json.dumps({"axis": axis, "n": n, "mix": mix, "items": items})
+            proc = subprocess.run([sys.executable, os.path.abspath(__file__), "_point", args],
+                                  capture_output=True, text=True, check=True)
+            runs.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+        best = min(runs, key=lambda r: r["wall_s"])
+        best["memory_mb"] = min(r["memory_mb"] for r in runs)
+        points.append(best)
+        print(f"  N={n:<7} {best['wall_s']:>9.3f} s  {best['memory_mb']:>8.1f} MB",
+              file=sys.stderr)
+    return points
+
+
+def fit(points: List[dict], tolerance: float) -> List[Fit]:
+    sizes = [p["n"] for p in points]
+    limit = 1 + tolerance
+    fits = []
+    for metric in ("wall_s", "memory_mb"):
+        values = [p[metric] for p in points]
+        exponent = growth_exponent(sizes, values)
+        if metric == "memory_mb" and values[-1] - values[0] < MIN_MEMORY_DELTA_MB:
+            exponent = None
+        fits.append(Fit(metric, None if exponent is None else round(exponent, 3), limit,
+                        [[n, round(v, 4)] for n, v in zip(sizes, values)]))
+    return fits
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def _parse_mix(text: Optional[str]) -> Optional[Dict[str, float]]:
+    if not text:
+        return None
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        mix[name.strip()] = float(weight or 1)
+    return mix
+
+
+def main(argv=None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    logging.disable(logging.WARNING)
+    if argv[:1] == ["_point"]:
+        print(json.dumps(measure_point(**json.loads(argv[1]))))
+        return 0
+
+    parser = argparse.ArgumentParser(description="Check that generate() scales linearly")
+    parser.add_argument("--axis", choices=sorted(DEFAULT_SIZES), default="slides")
+    parser.add_argument("--sizes", type=int, nargs="+",
+                        help="N values, smallest first (default depends on --axis)")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Allowed exponent above linear (default: %(default)s)")
+    parser.add_argument("--mix", help="Slide-type weights, e.g. agenda=1,metrics=2")
+    parser.add_argument("--items", type=int, default=5,
+                        help="List items per slide on the slides axis (default: %(default)s)")
+    parser.add_argument("--repeat", type=int, default=2)
+    parser.add_argument("--json", help="Write points and fits to this file")
+    args = parser.parse_args(argv)
+
+    sizes = sorted(args.sizes or DEFAULT_SIZES[args.axis])
+    if len(sizes) < 3:
+        parser.error("--sizes needs at least three values to fit")
+    mix = _parse_mix(args.mix)
+
+    print(f"Scaling along '{args.axis}':", file=sys.stderr)
+    fits = fit(measure(args.axis, sizes, mix, args.items, args.repeat), args.tolerance)
+
+    for f in fits:
+        if f.exponent is None:
+            print(f"  – {f.metric}: growth too small to fit")
+        else:
+            mark = "✓" if f.ok else "✗"
+            print(f"  {mark} {f.metric}: O(N^{f.exponent:.2f}) (limit N^{f.limit:.2f})")
+    if args.json:
+        with open(args.json, "w") as fh:
+            json.dump({"axis": args.axis, "mix": mix, "tolerance": args.tolerance,
+                       "fits": [asdict(f) for f in fits]}, fh, indent=2)
+    return 0 if all(f.ok for f in fits) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
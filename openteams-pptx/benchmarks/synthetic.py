@@ -0,0 +1,107 @@
+# Authored by Amelia Thurdekoos
+# Email: ameliathurdekoos@gmail.com
+#
+# Any cares, concerns, compliments, or enhancements are always welcome!
+
+"""
+Synthetic slide specs of any size and slide-type mix.
+
+The demo spec is ten small slides; the slow paths we care about only show
+up with many slides or with a lot on one slide (long agendas, wide metric
+rows, big bodies). synthetic_spec() builds valid specs for both, seeded so
+the same arguments always give the same deck.
+
+  synthetic_spec(5000)                                   # every type, evenly
+  synthetic_spec(200, mix={"agenda": 1}, items=40)       # 200 long agendas
+  synthetic_spec(50, mix={"content": 3, "metrics": 1}, body_lines=60)
+"""
+from __future__ import annotations
+
+import random
+from typing import Dict, Optional
+
+SLIDE_TYPES = ("cover", "section_divider", "agenda", "content", "two_column",
+               "quote", "metrics", "team", "case_study", "closing", "blank")
+
+_WORDS = ("platform", "open", "source", "teams", "delivery", "pipeline", "scale",
+          "data", "model", "insight", "cloud", "secure", "roadmap", "impact",
+          "community", "support", "growth", "review", "launch", "metrics")
+
+
+def _text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words)).capitalize()
+
+
+def _lines(rng: random.Random, count: int, words: int = 9) -> str:
+    return "\n".join(_text(rng, words) for _ in range(count))
+
+
+def make_slide(stype: str, rng: random.Random, items: int = 5,
+               body_lines: int = 4) -> dict:
+    """One slide of type ``stype``.
+
+    ``items`` sizes the list-like fields (agenda items, metrics, team
+    members — the team renderer shows at most 6); ``body_lines`` sizes the
+    free-text fields.
+    """
+    if stype == "cover":
+        return {"type": stype, "title": _text(rng, 4), "subtitle": _text(rng, 8),
+                "date": "Month Year"}
+    if stype == "section_divider":
+        return {"type": stype, "title": _text(rng, 3), "subtitle": _text(rng, 7)}
+    if stype == "agenda":
+        return {"type": stype, "items": [_text(rng, 4) for _ in range(items)]}
+    if stype == "content":
+        return {"type": stype, "title": _text(rng, 4), "body": _lines(rng, body_lines),
+                "image_placeholder": "Visual"}
+    if stype == "two_column":
+        return {"type": stype, "title": _text(rng, 3),
+                "left_title": _text(rng, 2), "left_body": _lines(rng, body_lines, 6),
+                "right_title": _text(rng, 2), "right_body": _lines(rng, body_lines, 6)}
+    if stype == "quote":
+        return {"type": stype, "text": _lines(rng, 2, 6), "attribution": _text(rng, 3)}
+    if stype == "metrics":
+        return {"type": stype, "title": _text(rng, 2),
+                "metrics": [{"value": f"{rng.randint(1, 999)}%", "label": _text(rng, 2)}
+                            for _ in range(items)]}
+    if stype == "team":
+        return {"type": stype, "title": _text(rng, 2),
+                "members": [{"name": _text(rng, 2), "role": _text(rng, 2),
+                             "bio": _lines(rng, 2, 4)} for _ in range(items)]}
+    if stype == "case_study":
+        return {"type": stype, "title": _text(rng, 3),
+                "challenge": _lines(rng, body_lines, 4),
+                "solution": _lines(rng, body_lines, 4),
+                "results": _lines(rng, body_lines, 4)}
+    if stype == "closing":
+        return {"type": stype, "title": "Thank You", "subtitle": _text(rng, 4),
+                "contact": "hello@openteams.com  |  openteams.com", "cta_text": "Contact Us"}
+    if stype == "blank":
+        return {"type": stype}
+    raise ValueError(f"Unknown slide type '{stype}'")
+
+
+def synthetic_spec(n_slides: int, mix: Optional[Dict[str, float]] = None,
+                   items: int = 5, body_lines: int = 4, seed: int = 0) -> dict:
+    """A valid spec with ``n_slides`` slides.
+
+    ``mix`` maps slide types to relative weights (default: every type
+    equally). Types are dealt round-robin in proportion to their weights
+    rather than sampled, so small decks still get the requested mix.
+    """
+    weights = mix or {t: 1 for t in SLIDE_TYPES}
+    unknown = set(weights) - set(SLIDE_TYPES)
+    if unknown:
+        raise ValueError(f"Unknown slide type(s) in mix: {', '.join(sorted(unknown))}")
+    total = sum(weights.values())
+    rng = random.Random(seed)
+    credit = dict.fromkeys(weights, 0.0)
+    slides = []
+    for _ in range(n_slides):
+        # Smooth weighted round-robin: highest accumulated credit goes next
+        for stype, weight in weights.items():
+            credit[stype] += weight
+        stype = max(credit, key=credit.get)
+        credit[stype] -= total
+        slides.append(make_slide(stype, rng, items=items, body_lines=body_lines))
+    return {"title": f"Synthetic {n_slides}", "slides": slides}
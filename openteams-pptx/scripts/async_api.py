@@ -0,0 +1,229 @@
+# Authored by Amelia Thurdekoos
+# Email: ameliathurdekoos@gmail.com
+#
+# Any cares, concerns, compliments, or enhancements are always welcome!
+
+"""
+Asyncio front end for embedding the generator in an async service.
+
+generate() blocks for as long as the deck takes to render. generate_async()
+runs the render in an executor instead, so the event loop keeps serving:
+
+  data = await generate_async(spec, "references/brand.json")
+  await generate_async(spec, "references/brand.json", output=response)
+
+``output`` is anything with a ``write(bytes)`` method, awaited if it returns
+an awaitable (aiohttp's StreamResponse, aiofiles files, ...).
+
+For control over the executor, use an AsyncDeckGenerator (one per brand and
+service, like deck_server's RenderService):
+
+  - ``executor="thread"`` (default) renders in threads of this process;
+    ``"process"`` uses a pool of workers that built the theme at start-up,
+    for CPU parallelism.
+  - At most ``max_concurrency`` decks render at once. Up to ``queue_depth``
+    more wait for a slot, and anything beyond that raises ServiceBusy right
+    away, so the caller can shed load (e.g. answer 503) instead of queueing
+    without bound.
+  - Cancelling the awaiting task (task.cancel(), asyncio.timeout(), a
+    dropped client) stops the render before its next slide. The slot is
+    freed only once the worker has actually stopped.
+
+Standard library only.
+"""
+from __future__ import annotations
+
+import asyncio
+import inspect
+import io
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Optional
+
+import metrics
+from batch import ServiceBusy
+
+log = logging.getLogger(__name__)
+
+EXECUTORS = ("thread", "process")
+
+
+# ---------------------------------------------------------------------------
+# Worker side
+# ---------------------------------------------------------------------------
+
+def _render_in_thread(spec: dict, theme, cache, compression: str, cancel) -> bytes:
+    from generate_deck import render_deck
+
+    buf = io.BytesIO()
+    render_deck(spec, theme, buf, cache=cache, compression=compression, cancel=cancel)
+    return buf.getvalue()
+
+
+# ---------------------------------------------------------------------------
+# Generator (executor + admission control)
+# ---------------------------------------------------------------------------
+
+class AsyncDeckGenerator:
+    """Renders decks for one brand in an executor, with bounded concurrency."""
+
+    def __init__(self, brand_json_path: str, max_concurrency: Optional[int] = None,
+                 queue_depth: int = 16, executor: str = "thread", cache=None,
+                 compression: str = "default"):
+        from batch import _init_worker
+        from brand_engine import load_brand, build_theme
+        from cpu_limits import default_workers
+
+        if executor not in EXECUTORS:
+            raise ValueError(f"Unknown executor '{executor}'. Valid: {', '.join(EXECUTORS)}")
+        self.brand_json_path = brand_json_path
+        self.max_concurrency = max_concurrency or default_workers()
+        self.queue_depth = queue_depth
+        self.executor = executor
+        self.cache = cache
+        self.compression = compression
+        self._theme = build_theme(load_brand(brand_json_path))
+        if executor == "process":
+            self._manager = multiprocessing.Manager()  # cancel events workers can see
+            self._pool = ProcessPoolExecutor(max_workers=self.max_concurrency,
+                                             initializer=_init_worker,
+                                             initargs=(self._theme, cache, compression))
+        else:
+            self._manager = None
+            self._pool = ThreadPoolExecutor(max_workers=self.max_concurrency,
+                                            thread_name_prefix="deck")
+        self._loop = None
+        self._slots = None
+        self._admitted = 0      # rendering + waiting for a slot
+        self.rendered = 0
+        self.failed = 0
+        self.rejected = 0
+        self.cancelled = 0
+
+    async def __aenter__(self) -> "AsyncDeckGenerator":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def generate(self, spec: dict, output=None):
+        """Render ``spec``; return the .pptx bytes, or write them to ``output``.
+
+        With ``output``, returns the number of bytes written. Raises
+        ServiceBusy when ``max_concurrency + queue_depth`` renders are
+        already admitted, and generate_deck.SpecValidationError for a bad spec.
+        """
+        if self._admitted >= self.max_concurrency + self.queue_depth:
+            self.rejected += 1
+            raise ServiceBusy(self.max_concurrency, self.queue_depth)
+        self._admitted += 1
+        try:
+            async with self._slot_semaphore():
+                data = await self._render(spec)
+        finally:
+            self._admitted -= 1
+        if output is None:
+            return data
+        written = output.write(data)
+        if inspect.isawaitable(written):
+            await written
+        return len(data)
+
+    async def _render(self, spec: dict) -> bytes:
+        loop = asyncio.get_running_loop()
+        if self._manager is not None:
+            cancel = self._manager.Event()
+            from deck_server import _render_bytes
+            future = loop.run_in_executor(self._pool, _render_bytes, spec, None, cancel)
+        else:
+            cancel = threading.Event()
+            future = loop.run_in_executor(self._pool, _render_in_thread, spec, self._theme,
+                                          self.cache, self.compression, cancel)
+        try:
+            result = await asyncio.shield(future)
+        except asyncio.CancelledError:
+            # Stop the worker at its next slide and wait for it, so the slot
+            # really is free when this task finishes cancelling
+            cancel.set()
+            self.cancelled += 1
+            log.info("Render cancelled; stopping at the next slide.")
+            try:
+                await future
+            except Exception:
+                pass
+            raise
+        except BaseException:
+            self.failed += 1
+            raise
+        self.rendered += 1
+        if self._manager is not None:
+            data, worker_metrics = result
+            metrics.REGISTRY.merge(worker_metrics)
+            return data
+        return result
+
+    def _slot_semaphore(self) -> asyncio.Semaphore:
+        # asyncio primitives belong to one event loop; make a new one if the
+        # generator is used from another loop (e.g. successive asyncio.run calls)
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop, self._slots = loop, asyncio.Semaphore(self.max_concurrency)
+        return self._slots
+
+    def stats(self) -> dict:
+        return {
+            "executor": self.executor,
+            "max_concurrency": self.max_concurrency,
+            "queue_depth": self.queue_depth,
+            "admitted": self._admitted,
+            "rendered": self.rendered,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "cancelled": self.cancelled,
+        }
+
+    async def close(self) -> None:
+        """Shut the executor down (in a thread, so the loop isn't blocked)."""
+        await asyncio.get_running_loop().run_in_executor(None, self.shutdown)
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=True, cancel_futures=True)
+        if self._manager is not None:
+            self._manager.shutdown()
+
+
+# ---------------------------------------------------------------------------
+# Convenience API
+# ---------------------------------------------------------------------------
+
+# brand.json path -> shared thread-executor generator for generate_async
+_DEFAULT_GENERATORS: Dict[str, AsyncDeckGenerator] = {}
+_DEFAULT_LOCK = threading.Lock()
+
+
+def default_generator(brand_json_path: str) -> AsyncDeckGenerator:
+    """The shared AsyncDeckGenerator (default settings) for a brand.json."""
+    with _DEFAULT_LOCK:
+        gen = _DEFAULT_GENERATORS.get(brand_json_path)
+        if gen is None:
+            gen = _DEFAULT_GENERATORS[brand_json_path] = AsyncDeckGenerator(brand_json_path)
+        return gen
+
+
+async def generate_async(spec: dict, brand_json_path: str, output=None,
+                         generator: Optional[AsyncDeckGenerator] = None):
+    """Render ``spec`` without blocking the event loop.
+
+    Returns the .pptx bytes, or writes them to ``output`` (sync or async
+    ``write``) and returns the byte count. Runs on ``generator``, or on a
+    shared thread-executor generator for ``brand_json_path``. Building that
+    generator (the theme, once) happens off the loop too.
+    """
+    if generator is None:
+        generator = _DEFAULT_GENERATORS.get(brand_json_path)
+        if generator is None:
+            generator = await asyncio.get_running_loop().run_in_executor(
+                None, default_generator, brand_json_path)
+    return await generator.generate(spec, output)
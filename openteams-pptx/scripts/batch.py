@@ -0,0 +1,410 @@
+# Authored by Amelia Thurdekoos
+# Email: ameliathurdekoos@gmail.com
+#
+# Any cares, concerns, compliments, or enhancements are always welcome!
+
+"""
+Batch generation — render many slide specs in one process.
+
+The brand is loaded and the theme built once for the whole batch, and the
+default template bytes stay cached in memory (see generate_deck.new_presentation),
+so each extra deck only pays for rendering and saving.
+
+Specs come from a directory of *.json files or from a JSONL file with one
+spec object per line.
+
+generate_many() spreads the same jobs across a process pool whose workers
+are pre-warmed with the brand and theme; see cpu_limits.default_workers() for
+how the pool is sized.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import signal
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from typing import Iterable, Iterator, List, Optional
+
+from cpu_limits import default_workers
+
+log = logging.getLogger(__name__)
+
+_UNSAFE_NAME_RE = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+# ---------------------------------------------------------------------------
+# Jobs and results
+# ---------------------------------------------------------------------------
+
+@dataclass
+class DeckJob:
+    """One deck to render. ``error`` is set when the spec itself couldn't be loaded."""
+    name: str
+    spec: Optional[dict] = None
+    error: str = ""
+
+
+@dataclass
+class DeckResult:
+    """Outcome of rendering one deck."""
+    name: str
+    output_path: str
+    ok: bool
+    slides: int = 0
+    seconds: float = 0.0
+    error: str = ""
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def _safe_name(name: str) -> str:
+    return _UNSAFE_NAME_RE.sub("_", name).strip("._") or "deck"
+
+
+def _unique_name(name: str, seen: dict[str, int]) -> str:
+    """``name``, or ``name-<n>`` if an earlier deck already took it."""
+    if name not in seen:
+        seen[name] = 1
+        return name
+    while True:
+        seen[name] += 1
+        candidate = f"{name}-{seen[name]}"
+        if candidate not in seen:
+            seen[candidate] = 1
+            return candidate
+
+
+def iter_spec_dir(spec_dir: str) -> Iterator[DeckJob]:
+    """Yield one job per *.json file in ``spec_dir``, sorted by file name.
+
+    Decks are named after the file; names that clash once made file-name
+    safe ("a b.json" and "a_b.json") are de-duplicated.
+    """
+    seen: dict[str, int] = {}
+    for fname in sorted(os.listdir(spec_dir)):
+        if not fname.endswith(".json"):
+            continue
+        name = _unique_name(_safe_name(fname[:-len(".json")]), seen)
+        try:
+            with open(os.path.join(spec_dir, fname)) as f:
+                yield DeckJob(name, json.load(f))
+        except (OSError, ValueError) as e:
+            yield DeckJob(name, error=f"Could not load {fname}: {e}")
+
+
+def iter_spec_jsonl(jsonl_path: str) -> Iterator[DeckJob]:
+    """Yield one job per non-empty line of a JSONL file.
+
+    Decks are named after the spec's optional "title" (de-duplicated), or
+    ``deck-<line>`` when there is none.
+    """
+    seen: dict[str, int] = {}
+    with open(jsonl_path) as f:
+        for lineno, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                spec = json.loads(line)
+            except ValueError as e:
+                yield DeckJob(f"deck-{lineno:05d}", error=f"Line {lineno}: invalid JSON: {e}")
+                continue
+            title = spec.get("title") if isinstance(spec, dict) else None
+            name = _safe_name(title) if isinstance(title, str) else f"deck-{lineno:05d}"
+            yield DeckJob(_unique_name(name, seen), spec)
+
+
+# ---------------------------------------------------------------------------
+# Rendering
+# ---------------------------------------------------------------------------
+
+def _output_path(out_dir: str, job: DeckJob) -> str:
+    return os.path.join(out_dir, f"{job.name}.pptx")
+
+
+class ServiceBusy(Exception):
+    """Raised when every render slot is busy and the wait queue is full.
+
+    Shared by the render daemon (deck_server) and the asyncio API
+    (async_api); carries the limits that were hit.
+    """
+
+    def __init__(self, concurrency: int, queue_depth: int):
+        super().__init__(concurrency, queue_depth)
+        self.concurrency = concurrency
+        self.queue_depth = queue_depth
+
+    def __str__(self) -> str:
+        return (f"At capacity: {self.concurrency} concurrent renders and "
+                f"{self.queue_depth} queued; try again later.")
+
+
+class DeckTimeout(BaseException):
+    """Raised inside a worker when a deck exceeds its time budget.
+
+    Derives from BaseException so the per-slide ``except Exception`` in
+    render_deck can't swallow it and keep rendering.
+    """
+
+
+def render_job(job: DeckJob, theme, out_dir: str, cache=None,
+               compression: str = "default", timeout: Optional[float] = None) -> DeckResult:
+    """Render one job against a pre-built theme, never raising.
+
+    ``cache`` is an optional render_cache.RenderCache; the result records
+    this deck's hits and misses. ``compression`` is the zip compression
+    profile, ``timeout`` the deck's time limit (see deck_deadline). The deck
+    is written to a temporary file and renamed when complete, so a failed
+    or timed-out deck never leaves a partial .pptx behind.
+    """
+    import metrics
+    from generate_deck import render_deck, SpecValidationError
+
+    out_path = _output_path(out_dir, job)
+    if job.error:
+        metrics.VALIDATION_FAILURES.inc()
+        return DeckResult(job.name, out_path, ok=False, error=job.error)
+    if not isinstance(job.spec, dict):
+        metrics.VALIDATION_FAILURES.inc()
+        return DeckResult(job.name, out_path, ok=False, error="Spec must be a JSON object.")
+
+    start = time.perf_counter()
+    before = cache.stats() if cache is not None else None
+    tmp_path = f"{out_path}.partial"
+    error = ""
+    try:
+        with deck_deadline(timeout):
+            slides = render_deck(job.spec, theme, tmp_path, cache=cache, compression=compression)
+        # After the alarm is cleared: a renamed deck is never reported as timed out
+        os.replace(tmp_path, out_path)
+    except DeckTimeout:
+        error = "Timed out."
+    except SpecValidationError as e:
+        error = "; ".join(e.errors)
+    except Exception as e:
+        log.exception("Deck %s failed", job.name)
+        error = f"{type(e).__name__}: {e}"
+    if error:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        return DeckResult(job.name, out_path, ok=False,
+                          seconds=time.perf_counter() - start, error=error)
+    result = DeckResult(job.name, out_path, ok=True, slides=slides,
+                        seconds=time.perf_counter() - start)
+    if cache is not None:
+        result.cache_hits = cache.hits - before["hits"]
+        result.cache_misses = cache.misses - before["misses"]
+    return result
+
+
+def generate_batch(jobs: Iterable[DeckJob], brand_json_path: str,
+                   out_dir: str, cache=None, compression: str = "default",
+                   timeout: Optional[float] = None) -> List[DeckResult]:
+    """Render every job into ``out_dir`` with one shared brand/theme.
+
+    Returns one DeckResult per job, in input order. A failing deck never
+    stops the batch. ``cache`` is an optional RenderCache shared by all decks;
+    ``timeout`` limits each deck (main thread only, see deck_deadline).
+    """
+    from brand_engine import load_brand, build_theme
+
+    os.makedirs(out_dir, exist_ok=True)
+    theme = build_theme(load_brand(brand_json_path))
+
+    results = []
+    for job in jobs:
+        result = render_job(job, theme, out_dir, cache, compression, timeout)
+        _log_result(result)
+        results.append(result)
+    return results
+
+
+def _log_result(result: DeckResult) -> None:
+    if result.ok:
+        log.info(f"✓ {result.name}: {result.slides} slides ({result.seconds:.2f}s)")
+    else:
+        log.error(f"✗ {result.name}: {result.error}")
+
+
+# ---------------------------------------------------------------------------
+# Process-pool rendering
+# ---------------------------------------------------------------------------
+
+_WORKER_THEME = None
+_WORKER_CACHE = None
+_WORKER_COMPRESSION = "default"
+
+
+def _init_worker(theme, cache=None, compression: str = "default") -> None:
+    """Pool initializer: warm the render stack and keep the parent's theme.
+
+    The theme is built in the parent, so a bad brand.json fails there once
+    instead of in every worker's initializer.
+    """
+    global _WORKER_THEME, _WORKER_CACHE, _WORKER_COMPRESSION
+    from generate_deck import warm_up
+
+    warm_up(theme)
+    _WORKER_THEME = theme
+    _WORKER_CACHE = cache
+    _WORKER_COMPRESSION = compression
+
+
+def _on_timeout(signum, frame):
+    raise DeckTimeout()
+
+
+@contextmanager
+def deck_deadline(timeout: Optional[float]):
+    """Raise DeckTimeout in this (worker) process once ``timeout`` seconds pass.
+
+    Uses SIGALRM, so it only works in a process's main thread on POSIX; it is
+    a no-op elsewhere or when ``timeout`` is falsy.
+    """
+    use_alarm = bool(timeout) and hasattr(signal, "setitimer")
+    if use_alarm:
+        signal.signal(signal.SIGALRM, _on_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        yield
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+def _worker_render(job: DeckJob, out_dir: str, timeout: Optional[float]) -> tuple:
+    """Render one job in a pool worker, enforcing the per-deck timeout.
+
+    Returns ``(DeckResult, metrics)`` with this job's drained metrics.
+    """
+    import metrics
+
+    result = render_job(job, _WORKER_THEME, out_dir, _WORKER_CACHE, _WORKER_COMPRESSION, timeout)
+    return result, metrics.REGISTRY.drain()
+
+
+def generate_many(jobs: Iterable[DeckJob], brand_json_path: str, out_dir: str,
+                  workers: Optional[int] = None,
+                  timeout: Optional[float] = None, cache=None,
+                  compression: str = "default") -> List[DeckResult]:
+    """Render jobs across a pool of pre-warmed worker processes.
+
+    Args:
+        jobs: Decks to render; consumed lazily so huge batches aren't held in memory.
+        brand_json_path: Path to brand.json, loaded once here and handed to the workers.
+        out_dir: Directory that receives ``<name>.pptx`` per job.
+        workers: Pool size. None/0 uses default_workers().
+        timeout: Per-deck wall-clock limit in seconds (POSIX only).
+        cache: Optional RenderCache; every worker uses the same directory.
+        compression: Zip compression profile (package_writer.COMPRESSION_PROFILES).
+
+    Returns one DeckResult per job, in input order. Results are also logged
+    in input order as soon as every earlier deck has finished. A deck that
+    crashes its worker process fails on its own: the pool is restarted, and
+    the decks that were in flight with it are rendered again one at a time,
+    so a second crash can only be that deck's.
+    """
+    import metrics
+    from brand_engine import load_brand, build_theme
+
+    theme = build_theme(load_brand(brand_json_path))
+    os.makedirs(out_dir, exist_ok=True)
+    workers = workers or default_workers()
+    max_in_flight = workers * 2
+
+    results: dict[int, DeckResult] = {}
+    next_to_log = 0
+    job_iter = iter(enumerate(jobs))
+    exhausted = False
+
+    def new_pool():
+        return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                   initargs=(theme, cache, compression))
+
+    pool = new_pool()
+    pending = {}    # future -> (index, job)
+    suspects = []   # (index, job) in flight when a worker died, retried alone
+    try:
+        while pending or suspects or not exhausted:
+            solo = bool(suspects)
+            if solo:
+                idx, job = suspects.pop(0)
+                pending[pool.submit(_worker_render, job, out_dir, timeout)] = (idx, job)
+            while not solo and not exhausted and len(pending) < max_in_flight:
+                try:
+                    idx, job = next(job_iter)
+                except StopIteration:
+                    exhausted = True
+                    break
+                future = pool.submit(_worker_render, job, out_dir, timeout)
+                pending[future] = (idx, job)
+            if not pending:
+                break
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            broken = False
+            for future in done:
+                idx, job = pending.pop(future)
+                try:
+                    results[idx], worker_metrics = future.result()
+                    metrics.REGISTRY.merge(worker_metrics)
+                except BrokenProcessPool:
+                    broken = True
+                    if solo:
+                        # It ran alone, so this deck is the one killing workers
+                        results[idx] = DeckResult(job.name, _output_path(out_dir, job),
+                                                  ok=False, error="Worker process died.")
+                    else:
+                        suspects.append((idx, job))
+            if broken:
+                # Any in-flight deck may have been the culprit; retry each alone
+                suspects.extend(pending.values())
+                suspects.sort(key=lambda item: item[0])
+                pending.clear()
+                log.warning(f"Worker process died; restarting the pool and retrying "
+                            f"{len(suspects)} deck(s) one at a time.")
+                pool.shutdown(wait=False, cancel_futures=True)
+                pool = new_pool()
+
+            while next_to_log in results:
+                _log_result(results[next_to_log])
+                next_to_log += 1
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+    return [results[i] for i in range(len(results))]
+
+
+def log_summary(results: List[DeckResult]) -> None:
+    """Log a per-batch success/failure summary."""
+    failed = [r for r in results if not r.ok]
+    log.info(f"\n{'=' * 50}")
+    log.info(f"Batch: {len(results) - len(failed)} succeeded, {len(failed)} failed, "
+             f"{sum(r.slides for r in results)} slides, "
+             f"{sum(r.seconds for r in results):.2f}s rendering")
+    hits, misses = sum(r.cache_hits for r in results), sum(r.cache_misses for r in results)
+    if hits or misses:
+        log.info(f"Render cache: {hits} hits, {misses} misses")
+    for r in failed:
+        log.info(f"  ✗ {r.name}: {r.error}")
+    log.info(f"{'=' * 50}")
+
+
+def write_summary(results: List[DeckResult], path: str) -> None:
+    """Write the per-deck results as a JSON document."""
+    with open(path, "w") as f:
+        json.dump({
+            "succeeded": sum(1 for r in results if r.ok),
+            "failed": sum(1 for r in results if not r.ok),
+            "decks": [r.to_dict() for r in results],
+        }, f, indent=2)
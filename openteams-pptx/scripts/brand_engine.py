@@ -6,16 +6,26 @@
 """
 Brand token loader and theme builder.
 Reads brand.json and produces runtime config objects.
+
+The theme also defines the package's color scheme (THEME_COLOR_SLOTS):
+brand colors that have a scheme slot are written into theme1.xml and
+referenced from slides by slot (ThemeConfig.color_ref), so re-theming a
+deck means rewriting one part.
 """
 from __future__ import annotations
 
 import json
 import os
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, asdict
 from pathlib import Path
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple, Union
 
 from pptx.dml.color import RGBColor
+from pptx.enum.dml import MSO_THEME_COLOR
+from pptx.util import Inches, Pt, Length
+
+from pptx_helpers import hex_to_rgbcolor
 
 
 # ---------------------------------------------------------------------------
@@ -48,8 +58,7 @@ class BrandConfig:
         return self.color(color_name)
 
     def rgb(self, name: str) -> RGBColor:
-        hex_val = self.color(name).lstrip("#")
-        return RGBColor(int(hex_val[:2], 16), int(hex_val[2:4], 16), int(hex_val[4:6], 16))
+        return hex_to_rgbcolor(self.color(name))
 
 
 def load_brand(brand_json_path: str, skill_dir: str = None) -> BrandConfig:
@@ -94,9 +103,38 @@ def load_brand(brand_json_path: str, skill_dir: str = None) -> BrandConfig:
 # Theme Config (runtime config for slide building)
 # ---------------------------------------------------------------------------
 
-@dataclass
+# Theme color scheme: slot -> (brand color name, fallback hex, the slot as
+# slides reference it). Slides go through the master's clrMap, so dk1/lt1
+# are "tx1"/"bg1" there; the hyperlink slots are written but not referenced.
+THEME_COLOR_SLOTS: Tuple[Tuple[str, str, str, Optional[MSO_THEME_COLOR]], ...] = (
+    ("dk1", "black", "#0C0C0C", MSO_THEME_COLOR.TEXT_1),
+    ("lt1", "white", "#FFFFFF", MSO_THEME_COLOR.BACKGROUND_1),
+    ("dk2", "night_navy", "#022791", MSO_THEME_COLOR.TEXT_2),
+    ("lt2", "light_bg", "#F7F8FC", MSO_THEME_COLOR.BACKGROUND_2),
+    ("accent1", "day_blue", "#4D75FE", MSO_THEME_COLOR.ACCENT_1),
+    ("accent2", "salmon", "#FF8A69", MSO_THEME_COLOR.ACCENT_2),
+    ("accent3", "yellow", "#FAA944", MSO_THEME_COLOR.ACCENT_3),
+    ("accent4", "gray", "#262626", MSO_THEME_COLOR.ACCENT_4),
+    ("accent5", "light_blue", "#E8EDFB", MSO_THEME_COLOR.ACCENT_5),
+    ("accent6", "accent_green", "#3AD58E", MSO_THEME_COLOR.ACCENT_6),
+    ("hlink", "day_blue", "#4D75FE", None),
+    ("folHlink", "night_navy", "#022791", None),
+)
+
+
+@dataclass(frozen=True, slots=True)
 class ThemeConfig:
-    """Merged theme: brand tokens + derived layout values."""
+    """Merged theme: brand tokens + derived layout values.
+
+    Frozen, so one theme can be shared by threads and cached against; use
+    dataclasses.replace() to derive a variant. The ``*_emu`` geometry and
+    the color table are computed from the tokens in __post_init__ and are
+    rebuilt rather than pickled, so a theme ships to pool workers as its
+    tokens only.
+
+    Colors that sit in the theme color scheme (``color_scheme``) are
+    emitted as scheme references; see color_ref.
+    """
     brand: BrandConfig = field(default_factory=BrandConfig)
 
     # Shortcut color accessors (populated from brand)
@@ -150,70 +188,201 @@ class ThemeConfig:
     favicon_colored: str = ""
     favicon_white: str = ""
 
+    # --- Derived in __post_init__ (not constructor arguments) ---
+
+    # Slide geometry, EMU
+    slide_width_emu: Length = field(init=False, repr=False)
+    slide_height_emu: Length = field(init=False, repr=False)
+    margin_emu: Length = field(init=False, repr=False)
+    gutter_emu: Length = field(init=False, repr=False)
+    section_pad_emu: Length = field(init=False, repr=False)
+    content_width_emu: Length = field(init=False, repr=False)   # slide width minus margins
+
+    # Type scale, EMU
+    h1_emu: Length = field(init=False, repr=False)
+    h2_emu: Length = field(init=False, repr=False)
+    h3_emu: Length = field(init=False, repr=False)
+    h4_emu: Length = field(init=False, repr=False)
+    body_emu: Length = field(init=False, repr=False)
+    body_lg_emu: Length = field(init=False, repr=False)
+    small_emu: Length = field(init=False, repr=False)
+    caption_emu: Length = field(init=False, repr=False)
+
+    # Standard shapes, EMU
+    card_radius_emu: Length = field(init=False, repr=False)
+    button_radius_emu: Length = field(init=False, repr=False)
+    accent_bar_w_emu: Length = field(init=False, repr=False)
+    accent_bar_h_emu: Length = field(init=False, repr=False)
+    footer_h_emu: Length = field(init=False, repr=False)
+
+    # Precomputed RGBColors for every brand color name and hex (read-only)
+    color_table: Mapping[str, RGBColor] = field(init=False, repr=False, compare=False)
+    # (slot, hex) for theme1.xml's color scheme, and the scheme slot for
+    # every brand color name and hex that has one
+    color_scheme: Tuple[Tuple[str, str], ...] = field(init=False, repr=False)
+    scheme_colors: Mapping[str, MSO_THEME_COLOR] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        derived = {
+            "slide_width_emu": Inches(self.slide_width_inches),
+            "slide_height_emu": Inches(self.slide_height_inches),
+            "margin_emu": Inches(self.margin_inches),
+            "gutter_emu": Inches(self.gutter_inches),
+            "section_pad_emu": Inches(self.section_pad_inches),
+            "h1_emu": Pt(self.h1_size),
+            "h2_emu": Pt(self.h2_size),
+            "h3_emu": Pt(self.h3_size),
+            "h4_emu": Pt(self.h4_size),
+            "body_emu": Pt(self.body_size),
+            "body_lg_emu": Pt(self.body_lg_size),
+            "small_emu": Pt(self.small_size),
+            "caption_emu": Pt(self.caption_size),
+            "card_radius_emu": Pt(self.card_radius_pt),
+            "button_radius_emu": Pt(self.button_radius_pt),
+            "accent_bar_w_emu": Inches(0.8),
+            "accent_bar_h_emu": Inches(0.06),
+            "footer_h_emu": Inches(0.5),
+        }
+        derived["content_width_emu"] = Length(
+            derived["slide_width_emu"] - 2 * derived["margin_emu"])
+        for name, value in derived.items():
+            object.__setattr__(self, name, value)
+        object.__setattr__(self, "color_table", build_color_table(self))
+        scheme, refs = build_color_scheme(self)
+        object.__setattr__(self, "color_scheme", scheme)
+        object.__setattr__(self, "scheme_colors", refs)
+
+    def __reduce__(self):
+        # Tokens only; __post_init__ recomputes the rest on the other side
+        return self.__class__, tuple(getattr(self, f.name) for f in fields(self) if f.init)
+
+    def tokens(self) -> Dict[str, Any]:
+        """The constructor arguments as plain data (what the theme is built from)."""
+        data = {f.name: getattr(self, f.name) for f in fields(self) if f.init}
+        data["brand"] = asdict(self.brand)
+        return data
+
+    def rgb(self, color: str) -> RGBColor:
+        """RGBColor for a brand color name or hex string.
+
+        Brand colors come straight from the precomputed table; anything
+        else goes through the memoized hex_to_rgbcolor.
+        """
+        rgb = self.color_table.get(color)
+        return rgb if rgb is not None else hex_to_rgbcolor(color)
+
+    def color_ref(self, color: str) -> Union[MSO_THEME_COLOR, RGBColor]:
+        """The scheme slot for a brand color name or hex, else its RGBColor.
+
+        Hand the result to the pptx_helpers color functions (set_color,
+        set_shape_fill, paragraph_template, ...).
+        """
+        ref = self.scheme_colors.get(color)
+        return ref if ref is not None else self.rgb(color)
+
 
 def build_theme(brand: BrandConfig) -> ThemeConfig:
     """Build a ThemeConfig from a BrandConfig."""
-    theme = ThemeConfig(brand=brand)
-
-    # Colors
-    theme.night_navy = brand.color("night_navy")
-    theme.day_blue = brand.color("day_blue")
-    theme.salmon = brand.color("salmon")
-    theme.yellow = brand.color("yellow")
-    theme.black = brand.color("black")
-    theme.gray = brand.color("gray")
-    theme.white = brand.color("white")
-
-    # Typography
     typo = brand.typography
-    theme.headline_font = typo.get("headline_font", "Inter Tight")
-    theme.body_font = typo.get("body_font", "Inter Tight")
-    theme.utility_font = typo.get("utility_font", "Roboto")
-    theme.fallback_font = typo.get("fallback", "Arial")
-
-    # Type scale
     ts = brand.type_scale_pt
-    theme.h1_size = ts.get("h1", 44)
-    theme.h2_size = ts.get("h2", 32)
-    theme.h3_size = ts.get("h3", 24)
-    theme.h4_size = ts.get("h4", 18)
-    theme.body_size = ts.get("body", 14)
-    theme.body_lg_size = ts.get("body_lg", 18)
-    theme.small_size = ts.get("small", 11)
-    theme.caption_size = ts.get("caption", 10)
-
-    # Spacing
     sp = brand.spacing_inches
-    theme.margin_inches = sp.get("margin", 0.6)
-    theme.gutter_inches = sp.get("gutter", 0.35)
-    theme.section_pad_inches = sp.get("section_pad", 0.5)
-
-    # Card style
     cs = brand.card_style
-    theme.card_radius_pt = cs.get("radius_pt", 12)
-    theme.card_shadow_alpha = cs.get("shadow_alpha_pct", 15)
-
-    # Button style
     bs = brand.button_style
-    theme.button_radius_pt = bs.get("radius_pt", 20)
-    # Resolve fill_color from brand color name or hex
+    sd = brand.slide_dimensions
+    la = brand.logo_assets
+
+    # Resolve button colors from brand color name or hex
     fill = bs.get("fill_color", "day_blue")
-    theme.button_fill_color = brand.color(fill) if not fill.startswith("#") else fill
     text_c = bs.get("text_color", "white")
-    theme.button_text_color = brand.color(text_c) if not text_c.startswith("#") else text_c
 
-    # Slide dimensions
-    sd = brand.slide_dimensions
-    theme.slide_width_inches = sd.get("width_inches", 13.333)
-    theme.slide_height_inches = sd.get("height_inches", 7.5)
+    return ThemeConfig(
+        brand=brand,
+
+        # Colors
+        night_navy=brand.color("night_navy"),
+        day_blue=brand.color("day_blue"),
+        salmon=brand.color("salmon"),
+        yellow=brand.color("yellow"),
+        black=brand.color("black"),
+        gray=brand.color("gray"),
+        white=brand.color("white"),
+
+        # Typography
+        headline_font=typo.get("headline_font", "Inter Tight"),
+        body_font=typo.get("body_font", "Inter Tight"),
+        utility_font=typo.get("utility_font", "Roboto"),
+        fallback_font=typo.get("fallback", "Arial"),
+
+        # Type scale
+        h1_size=ts.get("h1", 44),
+        h2_size=ts.get("h2", 32),
+        h3_size=ts.get("h3", 24),
+        h4_size=ts.get("h4", 18),
+        body_size=ts.get("body", 14),
+        body_lg_size=ts.get("body_lg", 18),
+        small_size=ts.get("small", 11),
+        caption_size=ts.get("caption", 10),
+
+        # Spacing
+        margin_inches=sp.get("margin", 0.6),
+        gutter_inches=sp.get("gutter", 0.35),
+        section_pad_inches=sp.get("section_pad", 0.5),
+
+        # Card style
+        card_radius_pt=cs.get("radius_pt", 12),
+        card_shadow_alpha=cs.get("shadow_alpha_pct", 15),
+
+        # Button style
+        button_radius_pt=bs.get("radius_pt", 20),
+        button_fill_color=brand.color(fill) if not fill.startswith("#") else fill,
+        button_text_color=brand.color(text_c) if not text_c.startswith("#") else text_c,
+
+        # Slide dimensions
+        slide_width_inches=sd.get("width_inches", 13.333),
+        slide_height_inches=sd.get("height_inches", 7.5),
+
+        # Logo paths
+        logo_colored_horizontal=la.get("colored_horizontal_png", ""),
+        logo_colored_vertical=la.get("colored_vertical_png", ""),
+        logo_white_horizontal=la.get("white_horizontal_png", ""),
+        logo_black_horizontal=la.get("black_horizontal_png", ""),
+        favicon_colored=la.get("favicon_colored_png", ""),
+        favicon_white=la.get("favicon_white_png", ""),
+    )
 
-    # Logo paths
-    la = brand.logo_assets
-    theme.logo_colored_horizontal = la.get("colored_horizontal_png", "")
-    theme.logo_colored_vertical = la.get("colored_vertical_png", "")
-    theme.logo_white_horizontal = la.get("white_horizontal_png", "")
-    theme.logo_black_horizontal = la.get("black_horizontal_png", "")
-    theme.favicon_colored = la.get("favicon_colored_png", "")
-    theme.favicon_white = la.get("favicon_white_png", "")
-
-    return theme
+
+def build_color_table(theme: ThemeConfig) -> Mapping[str, RGBColor]:
+    """Every brand and theme color, by name and by hex (as written and upper-case)."""
+    named = dict(theme.brand.colors)
+    for name in ("night_navy", "day_blue", "salmon", "yellow", "black", "gray", "white",
+                 "button_fill_color", "button_text_color"):
+        named[name] = getattr(theme, name)
+    table = {}
+    for name, hex_val in named.items():
+        if not isinstance(hex_val, str):
+            continue
+        rgb = hex_to_rgbcolor(hex_val)
+        table[name] = table[hex_val] = table[hex_val.upper()] = rgb
+        if not hex_val.startswith("#"):
+            table["#" + hex_val] = table["#" + hex_val.upper()] = rgb
+    return MappingProxyType(table)
+
+
+def build_color_scheme(theme: ThemeConfig):
+    """theme1.xml's (slot, hex) pairs and the color -> scheme slot lookup.
+
+    The lookup covers every color_table key (names and hex spellings) whose
+    color fills a referenced slot; when two slots share a color, the first
+    one in THEME_COLOR_SLOTS wins.
+    """
+    scheme, refs = [], {}
+    for slot, name, fallback, ref in THEME_COLOR_SLOTS:
+        rgb = theme.color_table.get(name) or hex_to_rgbcolor(fallback)
+        scheme.append((slot, str(rgb)))
+        if ref is None:
+            continue
+        refs.setdefault("#" + str(rgb), ref)
+        for key, value in theme.color_table.items():
+            if value == rgb:
+                refs.setdefault(key, ref)
+    return tuple(scheme), MappingProxyType(refs)
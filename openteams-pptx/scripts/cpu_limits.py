@@ -0,0 +1,57 @@
+# Authored by Amelia Thurdekoos
+# Email: ameliathurdekoos@gmail.com
+#
+# Any cares, concerns, compliments, or enhancements are always welcome!
+
+"""
+How many CPUs this process may really use.
+
+Shared by the process pools (batch, parallel_slides, deck_server, async_api)
+and the package writer's compression threads. Nothing is read at import time.
+"""
+from __future__ import annotations
+
+import math
+import os
+from typing import Optional
+
+
+def _cgroup_cpu_quota() -> Optional[float]:
+    """CPUs allowed by the cgroup CPU quota, or None when unlimited/unknown."""
+    # cgroup v2: "<quota> <period>" or "max <period>"
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()[:2]
+        if quota != "max":
+            return int(quota) / int(period)
+        return None
+    except (OSError, ValueError):
+        pass
+    # cgroup v1: quota of -1 means unlimited
+    for base in ("/sys/fs/cgroup/cpu", "/sys/fs/cgroup/cpu,cpuacct"):
+        try:
+            with open(os.path.join(base, "cpu.cfs_quota_us")) as f:
+                quota = int(f.read())
+            with open(os.path.join(base, "cpu.cfs_period_us")) as f:
+                period = int(f.read())
+        except (OSError, ValueError):
+            continue
+        if quota > 0 and period > 0:
+            return quota / period
+    return None
+
+
+def default_workers() -> int:
+    """Worker count for this machine: CPU affinity, capped by the cgroup quota.
+
+    os.cpu_count() reports the host's cores even inside a container limited
+    to a fraction of them, which oversubscribes the quota and slows everything.
+    """
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+    quota = _cgroup_cpu_quota()
+    if quota is not None:
+        cpus = min(cpus, math.ceil(quota))
+    return max(1, cpus)
@@ -0,0 +1,401 @@
+# Authored by Amelia Thurdekoos
+# Email: ameliathurdekoos@gmail.com
+#
+# Any cares, concerns, compliments, or enhancements are always welcome!
+
+"""
+Local render daemon — `generate_deck.py serve`.
+
+Keeps a pre-forked pool of worker processes that have already imported
+python-pptx and built the theme from brand.json, and serves them over
+localhost HTTP or a Unix socket:
+
+  POST /render    body = slide spec JSON  →  .pptx bytes
+  GET  /healthz   →  JSON status (workers, in-flight and queued requests)
+
+With --metrics-file, the generation metrics (metrics.py, merged from every
+worker) are rewritten to that file after each request for node_exporter's
+textfile collector.
+
+At most ``workers`` decks render at once and up to ``queue_depth`` more may
+wait; anything beyond that gets 503 with Retry-After so callers back off
+instead of piling up. Standard library only — no outside services.
+
+Usage:
+  python generate_deck.py serve --brand ../references/brand.json --port 8765
+  python generate_deck.py serve --brand ../references/brand.json --socket /tmp/deck.sock
+  curl --data @slides.json -o deck.pptx http://127.0.0.1:8765/render
+"""
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import ipaddress
+import logging
+import multiprocessing
+import os
+import signal
+import socket
+import socketserver
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+import metrics
+from batch import ServiceBusy
+
+log = logging.getLogger(__name__)
+
+PPTX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
+# Seconds warm() waits for every worker to start and build its theme
+WARM_TIMEOUT = 120.0
+
+
+# ---------------------------------------------------------------------------
+# Worker side
+# ---------------------------------------------------------------------------
+
+def _warm(barrier) -> int:
+    """No-op task used to make the pool fork (and initialize) every worker up front.
+
+    Each task waits at ``barrier`` until one runs in every worker, so no
+    worker can take two of them.
+    """
+    barrier.wait(timeout=WARM_TIMEOUT)
+    return os.getpid()
+
+
+def _render_bytes(spec: dict, timeout: Optional[float], cancel=None) -> tuple:
+    """Render ``spec`` with the worker's pre-built theme.
+
+    Returns ``(pptx_bytes, metrics)`` with this render's drained metrics.
+    ``cancel`` is a multiprocessing Event checked between slides (see
+    async_api).
+    """
+    import batch
+    from generate_deck import render_deck
+
+    buf = io.BytesIO()
+    try:
+        with batch.deck_deadline(timeout):
+            render_deck(spec, batch._WORKER_THEME, buf, cache=batch._WORKER_CACHE,
+                        compression=batch._WORKER_COMPRESSION, cancel=cancel)
+    except BaseException:
+        metrics.REGISTRY.drain()  # don't carry a failed render's counts into the next one
+        raise
+    return buf.getvalue(), metrics.REGISTRY.drain()
+
+
+# ---------------------------------------------------------------------------
+# Render service (pool + admission control)
+# ---------------------------------------------------------------------------
+
+class RenderService:
+    """Process pool with bounded concurrency and a bounded wait queue."""
+
+    def __init__(self, brand_json_path: str, workers: Optional[int] = None,
+                 queue_depth: int = 16, timeout: Optional[float] = 60.0, cache=None,
+                 metrics_file: Optional[str] = None):
+        from batch import _init_worker
+        from brand_engine import load_brand, build_theme
+        from cpu_limits import default_workers
+
+        self.brand_json_path = brand_json_path
+        self.workers = workers or default_workers()
+        self.queue_depth = queue_depth
+        self.timeout = timeout
+        self.metrics_file = metrics_file
+        self._pool_args = dict(max_workers=self.workers, initializer=_init_worker,
+                               initargs=(build_theme(load_brand(brand_json_path)), cache))
+        self._pool = ProcessPoolExecutor(**self._pool_args)
+        self._admit = threading.BoundedSemaphore(self.workers + queue_depth)
+        self._lock = threading.Lock()
+        self._active = 0
+        self._started = time.time()
+        self.rendered = 0
+        self.failed = 0
+        self.rejected = 0
+
+    def warm(self) -> list:
+        """Start every worker now so the first requests don't pay for imports.
+
+        Returns the workers' pids once every one has run its initializer.
+        """
+        with multiprocessing.Manager() as manager:
+            barrier = manager.Barrier(self.workers)
+            futures = [self._pool.submit(_warm, barrier) for _ in range(self.workers)]
+            return [f.result() for f in futures]
+
+    def render(self, spec: dict) -> bytes:
+        """Render one spec in the pool. Raises ServiceBusy when over capacity."""
+        if not self._admit.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            raise ServiceBusy(self.workers, self.queue_depth)
+        with self._lock:
+            self._active += 1
+        try:
+            data = self._submit(spec)
+            with self._lock:
+                self.rendered += 1
+            return data
+        except BaseException:
+            with self._lock:
+                self.failed += 1
+            raise
+        finally:
+            with self._lock:
+                self._active -= 1
+            self._admit.release()
+
+    def _submit(self, spec: dict) -> bytes:
+        try:
+            with self._lock:
+                pool = self._pool
+                future = pool.submit(_render_bytes, spec, self.timeout)
+            data, worker_metrics = future.result()
+            metrics.REGISTRY.merge(worker_metrics)
+            return data
+        except BrokenProcessPool:
+            # A worker died (OOM, segfault): replace the pool for later requests.
+            # Only once: other requests on the dead pool see it broken too, and
+            # must not shut down the replacement another thread already started.
+            with self._lock:
+                if self._pool is pool:
+                    log.error("Worker pool broke; restarting it.")
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    self._pool = ProcessPoolExecutor(**self._pool_args)
+            raise
+
+    def health(self) -> dict:
+        with self._lock:
+            active = self._active
+            return {
+                "status": "ok",
+                "workers": self.workers,
+                "in_flight": min(active, self.workers),
+                "queued": max(active - self.workers, 0),
+                "queue_depth": self.queue_depth,
+                "rendered": self.rendered,
+                "failed": self.failed,
+                "rejected": self.rejected,
+                "uptime_seconds": round(time.time() - self._started, 1),
+            }
+
+    def write_metrics(self) -> None:
+        """Rewrite --metrics-file, if set. Never fails the request."""
+        if not self.metrics_file:
+            return
+        try:
+            metrics.REGISTRY.write_textfile(self.metrics_file)
+        except OSError as e:
+            log.warning(f"Could not write metrics to {self.metrics_file}: {e}")
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=True, cancel_futures=True)
+        self.write_metrics()
+
+
+# ---------------------------------------------------------------------------
+# HTTP front end
+# ---------------------------------------------------------------------------
+
+class RenderRequestHandler(BaseHTTPRequestHandler):
+    server_version = "openteams-pptx"
+    protocol_version = "HTTP/1.1"
+
+    def address_string(self):
+        # Unix-socket peers have no (host, port) pair
+        return self.client_address[0] if self.client_address else "unix"
+
+    def log_message(self, fmt, *args):
+        log.info("%s %s", self.address_string(), fmt % args)
+
+    def _send(self, status: int, body: bytes, content_type: str, headers: dict = None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status: int, payload: dict, headers: dict = None):
+        self._send(status, json.dumps(payload).encode(), "application/json", headers)
+
+    def do_GET(self):
+        if self.path in ("/healthz", "/health"):
+            self._send_json(200, self.server.service.health())
+        else:
+            self._send_json(404, {"error": "Not found."})
+
+    def do_POST(self):
+        from batch import DeckTimeout
+        from generate_deck import validate_spec, SpecValidationError
+
+        if self.path not in ("/render", "/"):
+            self._send_json(404, {"error": "Not found."})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", ""))
+        except ValueError:
+            self._send_json(411, {"error": "Content-Length required."})
+            return
+        if length < 0:
+            # rfile.read(-1) would block until the client closes the connection
+            self.close_connection = True
+            self._send_json(400, {"error": "Invalid Content-Length."})
+            return
+        if length > self.server.max_body_bytes:
+            self.close_connection = True
+            self._send_json(413, {"error": "Spec too large."})
+            return
+        try:
+            spec = json.loads(self.rfile.read(length))
+        except ValueError as e:
+            self._send_json(400, {"error": f"Invalid JSON: {e}"})
+            return
+        if not isinstance(spec, dict):
+            self._send_json(400, {"errors": ["Spec must be a JSON object."]})
+            return
+
+        # Validate here so bad specs never occupy a worker
+        errors = validate_spec(spec)
+        if errors:
+            metrics.VALIDATION_FAILURES.inc()
+            self.server.service.write_metrics()
+            self._send_json(400, {"errors": errors})
+            return
+
+        try:
+            data = self.server.service.render(spec)
+        except ServiceBusy as e:
+            self._send_json(503, {"error": str(e)}, {"Retry-After": "1"})
+        except DeckTimeout:
+            self._send_json(504, {"error": "Render timed out."})
+        except SpecValidationError as e:
+            self._send_json(400, {"errors": e.errors})
+        except Exception as e:
+            log.exception("Render failed")
+            self._send_json(500, {"error": f"{type(e).__name__}: {e}"})
+        else:
+            self._send(200, data, PPTX_CONTENT_TYPE)
+        finally:
+            self.server.service.write_metrics()
+
+
+class DeckHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, service: RenderService, max_body_bytes: int):
+        self.service = service
+        self.max_body_bytes = max_body_bytes
+        if ":" in address[0]:
+            self.address_family = socket.AF_INET6    # ::1
+        super().__init__(address, RenderRequestHandler)
+
+
+class DeckUnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: str, service: RenderService, max_body_bytes: int):
+        self.service = service
+        self.max_body_bytes = max_body_bytes
+        if os.path.exists(path):
+            os.unlink(path)  # stale socket from a previous run
+        super().__init__(path, RenderRequestHandler)
+        os.chmod(path, 0o600)
+
+
+def is_loopback(host: str) -> bool:
+    """True for ``localhost`` and loopback addresses (127.0.0.0/8, ::1)."""
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def make_server(service: RenderService, host: str = "127.0.0.1", port: int = 0,
+                socket_path: Optional[str] = None, max_body_bytes: int = 64 << 20):
+    """Bind a Unix-socket server when ``socket_path`` is given, else localhost HTTP.
+
+    The daemon has no authentication, so ``host`` must be a loopback
+    address; anything else raises ValueError.
+    """
+    if socket_path:
+        return DeckUnixServer(socket_path, service, max_body_bytes)
+    if not is_loopback(host):
+        raise ValueError(f"Refusing to listen on {host}: the render daemon is "
+                         f"localhost-only (use 127.0.0.1, ::1 or a Unix socket)")
+    return DeckHTTPServer((host, port), service, max_body_bytes)
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="generate_deck.py serve",
+                                     description="OpenTeams PPTX render daemon")
+    parser.add_argument("--brand", required=True, help="Path to brand.json")
+    where = parser.add_mutually_exclusive_group()
+    where.add_argument("--socket", help="Listen on this Unix socket path")
+    where.add_argument("--port", type=int, default=8765,
+                       help="Listen on this localhost TCP port (default 8765)")
+    parser.add_argument("--host", default="127.0.0.1",
+                        help="Loopback address for --port (default 127.0.0.1; "
+                             "other interfaces are refused)")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="Worker processes = max concurrent renders "
+                             "(0 = one per CPU allowed by the cgroup quota)")
+    parser.add_argument("--queue-depth", type=int, default=16,
+                        help="Requests allowed to wait for a worker before 503")
+    parser.add_argument("--timeout", type=float, default=60.0,
+                        help="Per-deck render time limit in seconds")
+    parser.add_argument("--max-body-mb", type=float, default=64,
+                        help="Largest accepted spec body in MB")
+    parser.add_argument("--cache-dir",
+                        help="Share rendered slides through this render cache directory")
+    parser.add_argument("--cache-max-mb", type=float, default=512,
+                        help="Render cache size cap in MB (default 512)")
+    parser.add_argument("--metrics-file",
+                        help="Keep generation metrics in this Prometheus textfile "
+                             "(for node_exporter's textfile collector)")
+    args = parser.parse_args(argv)
+    if not args.socket and not is_loopback(args.host):
+        parser.error(f"--host must be a loopback address (127.0.0.1, ::1 or localhost), "
+                     f"not {args.host}")
+
+    cache = None
+    if args.cache_dir:
+        from render_cache import RenderCache
+        cache = RenderCache(args.cache_dir, max_bytes=int(args.cache_max_mb * (1 << 20)))
+    service = RenderService(args.brand, workers=args.workers, queue_depth=args.queue_depth,
+                            timeout=args.timeout, cache=cache, metrics_file=args.metrics_file)
+    service.warm()
+    server = make_server(service, args.host, args.port, args.socket,
+                         max_body_bytes=int(args.max_body_mb * (1 << 20)))
+
+    def _stop(signum, frame):
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, _stop)
+    where = args.socket or "http://%s:%d" % server.server_address[:2]
+    log.info(f"Serving on {where} with {service.workers} warm workers "
+             f"(queue depth {service.queue_depth})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        log.info("Shutting down...")
+    finally:
+        server.server_close()
+        service.close()
+        if args.socket and os.path.exists(args.socket):
+            os.unlink(args.socket)
+    return 0
@@ -12,25 +12,39 @@ Usage:
   python generate_deck.py --spec slides.json --brand ../references/brand.json --out output.pptx
   echo '{"slides":[...]}' | python generate_deck.py --brand ../references/brand.json --out output.pptx
   python generate_deck.py --demo --brand ../references/brand.json --out demo.pptx
+  python generate_deck.py --spec-dir specs/ --brand ../references/brand.json --out decks/
+  python generate_deck.py --spec-jsonl specs.jsonl --brand ../references/brand.json --out decks/
+  python generate_deck.py serve --brand ../references/brand.json --port 8765
+  produce_slides | python generate_deck.py --stream jsonl --brand ../references/brand.json --out big.pptx
+  python generate_deck.py --spec slides.json --brand ../references/brand.json --out deck.pptx --incremental deck.pptx
+  python generate_deck.py --demo --brand ../references/brand.json --out demo.pptx --trace trace.json
+  python generate_deck.py --schema > slides.schema.json
 """
 from __future__ import annotations
 
 import argparse
+import io
 import json
 import logging
 import sys
 import os
 import textwrap
+import time
+from typing import TYPE_CHECKING
 
 # Ensure same-directory imports work when invoked as a script
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from pptx import Presentation
-from pptx.util import Inches, Emu
+import metrics
+import tracing
+# Typed slide models, their converters and the JSON Schema (standard library only)
+from spec_models import parse_slide, parse_spec, spec_schema
 
-from brand_engine import load_brand, build_theme
-from slide_builder import SlideBuilder
-from slide_renderers import RENDERERS
+# python-pptx, lxml and PIL are imported inside the functions that render, so
+# --help and --validate-only start with the standard library alone.
+if TYPE_CHECKING:
+    from pptx.presentation import Presentation
+    from slide_builder import SlideBuilder
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s  %(message)s")
 log = logging.getLogger("generate_deck")
@@ -40,39 +54,26 @@ log = logging.getLogger("generate_deck")
 # Spec validation
 # ---------------------------------------------------------------------------
 
-REQUIRED_FIELDS = {
-    "cover":           ["title"],
-    "section_divider": ["title"],
-    "agenda":          ["items"],
-    "content":         ["title"],
-    "two_column":      ["title", "left_title", "right_title"],
-    "quote":           ["text"],
-    "metrics":         ["title", "metrics"],
-    "team":            ["title", "members"],
-    "case_study":      ["title", "challenge", "solution", "results"],
-    "closing":         ["title"],
-    "blank":           [],
-}
-
-
 def validate_spec(spec: dict) -> list[str]:
     """Return a list of human-readable error strings. Empty list = valid."""
-    errors = []
-    if "slides" not in spec or not isinstance(spec["slides"], list):
-        return ["Spec must contain a 'slides' array."]
-    for i, slide in enumerate(spec["slides"], 1):
-        stype = slide.get("type")
-        if not stype:
-            errors.append(f"Slide {i}: missing 'type' field.")
-            continue
-        if stype not in REQUIRED_FIELDS:
-            errors.append(f"Slide {i}: unknown type '{stype}'. "
-                          f"Valid types: {', '.join(REQUIRED_FIELDS)}")
-            continue
-        for field in REQUIRED_FIELDS[stype]:
-            if field not in slide:
-                errors.append(f"Slide {i} ({stype}): missing required field '{field}'.")
-    return errors
+    return parse_spec(spec)[1]
+
+
+def validate_slide(i: int, slide: dict) -> list[str]:
+    """Validate one slide spec (``i`` is its 1-based position, for messages)."""
+    return parse_slide(i, slide)[1]
+
+
+def load_slides(spec: dict) -> list:
+    """Validate ``spec`` and convert its slides to typed models (spec_models).
+
+    Raises SpecValidationError with every error found.
+    """
+    slides, errors = parse_spec(spec)
+    if errors:
+        metrics.VALIDATION_FAILURES.inc()
+        raise SpecValidationError(errors)
+    return slides
 
 
 # ---------------------------------------------------------------------------
@@ -164,47 +165,388 @@ DEMO_SPEC = {
 # Main generation logic
 # ---------------------------------------------------------------------------
 
-def generate(spec: dict, brand_json_path: str, output_path: str) -> None:
-    """Generate a .pptx file from a slide spec and brand config."""
-    # Validate spec
-    errors = validate_spec(spec)
-    if errors:
-        print("❌ Spec validation failed:", file=sys.stderr)
-        for err in errors:
-            print(f"   • {err}", file=sys.stderr)
-        sys.exit(1)
+class SpecValidationError(ValueError):
+    """Raised when a slide spec fails validation. ``errors`` holds every message."""
 
-    # Load brand and build theme
-    log.info("Loading brand config...")
-    brand = load_brand(brand_json_path)
-    theme = build_theme(brand)
+    def __init__(self, errors: list[str]):
+        super().__init__(f"Spec validation failed ({len(errors)} error(s))")
+        self.errors = errors
+
+    def __reduce__(self):
+        # Keep ``errors`` intact when the exception crosses a process boundary
+        return (type(self), (self.errors,))
 
-    # Create presentation
-    prs = Presentation()
+
+class DeckCancelled(Exception):
+    """Raised between slides once a render's ``cancel`` event is set."""
+
+
+_TEMPLATE_BYTES: bytes | None = None
+# Name of the color and font schemes written into theme1.xml
+THEME_NAME = "OpenTeams"
+# incremental.theme_key -> base .pptx bytes; see base_template. Keyed on the
+# theme's values, so the fresh ThemeConfig each generate() call builds from
+# the same brand.json hits, and bounded for long-lived processes.
+_BASE_TEMPLATES: dict = {}
+_MAX_BASE_TEMPLATES = 4
+
+
+def base_template(theme) -> bytes:
+    """The branded starting package for ``theme``, as .pptx bytes.
+
+    Built on first use from python-pptx's default template (read from disk
+    once per process) and cached per brand, so a batch builds it once:
+
+      - the slide size is the theme's;
+      - the theme's colors and headline/body fonts are theme1.xml's color
+        and font schemes, which the slides reference;
+      - the body text style is the default that text boxes build on;
+      - only the blank layout is left. The branded layouts are added to
+        each deck as its slides need them (SlideBuilder.layout).
+
+    The zip is stored uncompressed, since it is only ever read back from memory.
+    """
+    from incremental import theme_key
+
+    key = theme_key(theme)
+    blob = _BASE_TEMPLATES.get(key)
+    if blob is not None:
+        return blob
+
+    from pptx import Presentation
+    from pptx.util import Inches, Emu
+    from package_writer import save_presentation
+    from pptx_helpers import (blank_layout, remove_unused_layouts,
+                              set_default_text_style, set_theme)
+    from slide_builder import default_text_style
+
+    global _TEMPLATE_BYTES
+    if _TEMPLATE_BYTES is None:
+        from pptx.api import _default_pptx_path
+        with open(_default_pptx_path(), "rb") as f:
+            _TEMPLATE_BYTES = f.read()
+
+    prs = Presentation(io.BytesIO(_TEMPLATE_BYTES))
     prs.slide_width = Emu(int(Inches(theme.slide_width_inches)))
     prs.slide_height = Emu(int(Inches(theme.slide_height_inches)))
-
+    set_theme(prs, THEME_NAME, theme.color_scheme, theme.headline_font, theme.body_font)
+    set_default_text_style(prs, *default_text_style(theme))
+    remove_unused_layouts(prs, keep=[blank_layout(prs)])
+
+    buf = io.BytesIO()
+    save_presentation(prs, buf, compression="store", threads=1)
+    blob = buf.getvalue()
+    if len(_BASE_TEMPLATES) >= _MAX_BASE_TEMPLATES:
+        del _BASE_TEMPLATES[next(iter(_BASE_TEMPLATES))]  # oldest
+    _BASE_TEMPLATES[key] = blob
+    return blob
+
+
+def new_presentation(theme) -> Presentation:
+    """Create an empty presentation from the theme's base_template."""
+    from pptx import Presentation
+
+    return Presentation(io.BytesIO(base_template(theme)))
+
+
+def warm_up(theme) -> None:
+    """Load the render stack and build ``theme``'s per-process caches.
+
+    For pool initializers: imports python-pptx, lxml, the renderers and the
+    package writer, builds the base template and every branded layout's
+    chrome, and saves the resulting deck to memory, so a worker's first
+    real render costs what later ones do. Records no metrics.
+    """
+    import slide_renderers  # noqa: F401 — registers the branded layouts
+    from package_writer import save_presentation
+    from slide_builder import LAYOUT_BUILDERS, SlideBuilder
+
+    sb = SlideBuilder(new_presentation(theme), theme)
+    for name in LAYOUT_BUILDERS:
+        sb.new_slide(name)
+    save_presentation(sb.prs, io.BytesIO(), threads=1)
+
+
+def render_deck(spec: dict, theme, output, stream_output: bool = False,
+                previous=None, cache=None, compression: str = "default",
+                cancel=None) -> int:
+    """Render a validated spec with an already-built theme.
+
+    ``output`` is a path or a writable binary file object. Returns the number
+    of slides written. Raises SpecValidationError instead of exiting, so
+    library callers (batch mode) can carry on with the next deck.
+
+    With ``stream_output``, each finished slide is written to the zip and
+    released right away (package_writer), keeping memory flat for huge decks.
+    ``previous`` (incremental.PreviousDeck) and ``cache``
+    (render_cache.RenderCache) supply already rendered slides. ``compression``
+    is a package_writer.COMPRESSION_PROFILES name. Setting ``cancel`` (a
+    threading or multiprocessing Event) stops the render before the next
+    slide with DeckCancelled; nothing more is written to ``output``.
+    """
+    from slide_builder import SlideBuilder
+    from package_writer import save_presentation
+
+    slides = load_slides(spec)
+    prs = new_presentation(theme)
     sb = SlideBuilder(prs, theme)
-
-    # Render slides
-    for i, slide_spec in enumerate(spec["slides"], 1):
-        stype = slide_spec["type"]
-        renderer = RENDERERS.get(stype)
-        if renderer is None:
-            log.error(f"Slide {i}: unknown type '{stype}' — skipping.")
-            continue
+    start = _output_offset(output)
+    if stream_output:
+        from package_writer import StreamingPackageWriter
+        with StreamingPackageWriter(prs, output, compression) as writer:
+            render_slides(sb, slides, after_slide=writer.flush,
+                          previous=previous, cache=cache, cancel=cancel)
+        record_deck(output, start)
+        return writer.slide_count
+
+    render_slides(sb, slides, previous=previous, cache=cache, cancel=cancel)
+    with tracing.span("save", slides=len(prs.slides)):
+        save_presentation(prs, output, compression)
+    record_deck(output, start)
+    return len(prs.slides)
+
+
+def render_deck_stream(slides, theme, output, stream_output: bool = False,
+                       previous=None, cache=None, compression: str = "default",
+                       cancel=None) -> int:
+    """Validate and render slides one at a time as ``slides`` yields them.
+
+    For streamed input (spec_stream) where the whole spec never sits in
+    memory. Once a slide fails validation, rendering stops but the rest of
+    the stream is still validated, so SpecValidationError reports every
+    error, as render_deck does. ``stream_output``, ``previous``, ``cache``,
+    ``compression`` and ``cancel`` work as in render_deck; streaming both
+    ways keeps memory bounded.
+    """
+    from slide_builder import SlideBuilder
+    from package_writer import save_presentation
+
+    prs = new_presentation(theme)
+    sb = SlideBuilder(prs, theme)
+    start = _output_offset(output)
+    writer = None
+    if stream_output:
+        from package_writer import StreamingPackageWriter
+        writer = StreamingPackageWriter(prs, output, compression)
+    try:
+        errors = []
+        for i, slide_spec in enumerate(slides, 1):
+            slide, slide_errors = parse_slide(i, slide_spec)
+            if slide_errors:
+                errors.extend(slide_errors)
+            elif not errors:
+                render_slides(sb, [slide], start=i,
+                              after_slide=writer.flush if writer else None,
+                              previous=previous, cache=cache, cancel=cancel)
+        if errors:
+            metrics.VALIDATION_FAILURES.inc()
+            raise SpecValidationError(errors)
+    except BaseException:
+        if writer:
+            writer.abort()
+        raise
+
+    with tracing.span("save"):
+        if writer:
+            count = writer.close()
+        else:
+            save_presentation(prs, output, compression)
+            count = len(prs.slides)
+    record_deck(output, start)
+    return count
+
+
+def _output_offset(output) -> int:
+    """Current position of a file-object output (0 for paths)."""
+    if isinstance(output, (str, os.PathLike)):
+        return 0
+    try:
+        return output.tell()
+    except (AttributeError, OSError):
+        return 0
+
+
+def record_deck(output, start: int = 0) -> None:
+    """Count a finished deck and the bytes written to ``output`` since ``start``."""
+    metrics.DECKS.inc()
+    try:
+        if isinstance(output, (str, os.PathLike)):
+            size = os.path.getsize(output)
+        else:
+            size = output.tell() - start
+    except (AttributeError, OSError):
+        return
+    metrics.BYTES_WRITTEN.inc(size)
+
+
+def _reuse_slide(sb: SlideBuilder, key: str, previous, cache) -> str:
+    """Add an already rendered copy of slide ``key`` if there is one.
+    Returns where it came from, or "" when the slide must be rendered."""
+    if previous is not None and key in previous:
+        sb.add_exported_slide(*previous.get(key))
+        return "unchanged"
+    cached = cache.get(key) if cache is not None else None
+    if cached is not None:
+        sb.add_exported_slide(*cached)
+        return "cached"
+    return ""
+
+
+def render_slides(sb: SlideBuilder, slides, start: int = 1, after_slide=None,
+                  previous=None, cache=None, cancel=None) -> None:
+    """Dispatch each slide to its renderer. ``slides`` are spec_models
+    slides (raw slide dicts are converted first). ``start`` is the 1-based
+    index of the first slide, used in log messages; ``after_slide`` is called
+    once each slide is done (e.g. StreamingPackageWriter.flush).
+
+    Every rendered slide is stamped with its content hash. Slides whose hash
+    is in ``previous`` (an incremental.PreviousDeck) or in ``cache`` (a
+    render_cache.RenderCache) are copied from there; new renders are added
+    to ``cache``. Once ``cancel`` (an Event) is set, DeckCancelled is raised
+    before the next slide."""
+    from incremental import slide_key, stamp_slide
+    from pptx_helpers import export_slide
+    from slide_renderers import RENDERERS
+
+    for i, slide in enumerate(slides, start):
+        if cancel is not None and cancel.is_set():
+            raise DeckCancelled(f"Render cancelled before slide {i}")
+        if isinstance(slide, dict):
+            slide, errors = parse_slide(i, slide)
+            if errors:
+                log.error(f"  ✗ {errors[0]} Skipping.")
+                continue
+        stype = slide.type
+        renderer = RENDERERS[stype]
+        key = slide_key(sb.theme, slide)
         try:
-            renderer(sb, slide_spec)
-            log.info(f"  ✓ Slide {i}: {stype}")
+            with tracing.slide_span(renderer.__name__, i, stype):
+                source = _reuse_slide(sb, key, previous, cache)
+                if source:
+                    log.info(f"  ✓ Slide {i}: {stype} ({source})")
+                else:
+                    if cache is not None:
+                        metrics.CACHE_MISSES.inc()
+                    t0 = time.perf_counter()
+                    renderer(sb, slide)
+                    metrics.RENDER_SECONDS.observe(time.perf_counter() - t0,
+                                                   renderer=renderer.__name__)
+                    rendered = sb.prs.slides[-1]
+                    stamp_slide(rendered, key)
+                    if cache is not None:
+                        with tracing.span("cache.put", "helper"):
+                            cache.put(key, *export_slide(rendered))
+                    log.info(f"  ✓ Slide {i}: {stype}")
+                    source = "rendered"
+                if source == "cached":
+                    metrics.CACHE_HITS.inc()
+                shapes, pictures = sb.shape_counts(sb.prs.slides[-1])
+                metrics.SLIDES.inc(type=stype, source=source)
+                metrics.SHAPES.inc(shapes, type=stype)
+                metrics.PICTURES.inc(pictures, type=stype)
         except Exception as e:
             log.error(f"  ✗ Slide {i} ({stype}): {e}")
             import traceback
             traceback.print_exc()
+        if after_slide is not None:
+            with tracing.span("flush", slide=i):
+                after_slide()
+
+
+def open_previous(path: str | None, output_path: str):
+    """Open ``path`` for --incremental; None (full render) if it isn't there yet."""
+    if path is None:
+        return None
+    if not os.path.exists(path):
+        log.warning(f"No previous deck at {path} — rendering every slide.")
+        return None
+    from incremental import PreviousDeck
+    return PreviousDeck(path, output_path)
+
+
+def log_cache_stats(cache) -> None:
+    """Log a RenderCache's hit/miss counters (no-op without a cache)."""
+    if cache is not None:
+        st = cache.stats()
+        log.info(f"Render cache: {st['hits']} hits, {st['misses']} misses, "
+                 f"{st['stores']} stored, {st['evictions']} evicted")
+
+
+def generate(spec: dict, brand_json_path: str, output_path: str,
+             slide_workers: int | None = None, stream_output: bool = False,
+             incremental: str | None = None, cache=None,
+             compression: str = "default") -> None:
+    """Generate a .pptx file from a slide spec and brand config.
+
+    With ``slide_workers`` set, slide ranges are rendered in that many
+    worker processes and merged (0 = one per available CPU).
+    ``stream_output`` writes slides to disk as they finish (see render_deck).
+    ``incremental`` is the path of a previous output to reuse unchanged
+    slides from; ``cache`` is a render_cache.RenderCache shared across runs.
+    ``compression`` picks the zip compression profile (store/fast/default/max).
+
+    The spec is parsed once, by the renderer, before anything is written;
+    validation errors are printed and exit with status 1.
+    """
+    # Load brand and build theme
+    from brand_engine import load_brand, build_theme
+    log.info("Loading brand config...")
+    with tracing.span("load brand"):
+        brand = load_brand(brand_json_path)
+        theme = build_theme(brand)
+
+    # Validate, render and save
+    previous = None
+    try:
+        if slide_workers is not None:
+            from parallel_slides import render_deck_parallel
+            count = render_deck_parallel(spec, theme, output_path, workers=slide_workers,
+                                         stream_output=stream_output, cache=cache,
+                                         compression=compression)
+        else:
+            previous = open_previous(incremental, output_path)
+            count = render_deck(spec, theme, output_path, stream_output=stream_output,
+                                previous=previous, cache=cache, compression=compression)
+    except SpecValidationError as e:
+        _print_errors(e.errors)
+        sys.exit(1)
+    finally:
+        if previous is not None:
+            previous.close()
+    if previous is not None:
+        log.info(f"Reused {previous.reused} of {count} slides from {incremental}")
+    log_cache_stats(cache)
+    log.info(f"\n{'=' * 50}")
+    log.info(f"Generated {count} slides → {output_path}")
+    log.info(f"{'=' * 50}")
+
 
-    # Save
-    prs.save(output_path)
+def generate_stream(slides, brand_json_path: str, output_path: str,
+                    stream_output: bool = False, incremental: str | None = None,
+                    cache=None, compression: str = "default") -> None:
+    """Generate a .pptx from an iterator of slide specs (see spec_stream)."""
+    from brand_engine import load_brand, build_theme
+    log.info("Loading brand config...")
+    with tracing.span("load brand"):
+        theme = build_theme(load_brand(brand_json_path))
+    previous = open_previous(incremental, output_path)
+    try:
+        count = render_deck_stream(slides, theme, output_path, stream_output=stream_output,
+                                   previous=previous, cache=cache, compression=compression)
+    except SpecValidationError as e:
+        _print_errors(e.errors)
+        sys.exit(1)
+    except ValueError as e:
+        print(f"❌ Could not parse spec: {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        if previous is not None:
+            previous.close()
+    if previous is not None:
+        log.info(f"Reused {previous.reused} of {count} slides from {incremental}")
+    log_cache_stats(cache)
     log.info(f"\n{'=' * 50}")
-    log.info(f"Generated {len(prs.slides)} slides → {output_path}")
+    log.info(f"Generated {count} slides → {output_path}")
     log.info(f"{'=' * 50}")
 
 
@@ -212,7 +554,108 @@ def generate(spec: dict, brand_json_path: str, output_path: str) -> None:
 # CLI
 # ---------------------------------------------------------------------------
 
+def make_cache(args):
+    """RenderCache for --cache-dir, or None."""
+    if not args.cache_dir:
+        return None
+    from render_cache import RenderCache
+    return RenderCache(args.cache_dir, max_bytes=int(args.cache_max_mb * (1 << 20)))
+
+
+def run_batch(args) -> int:
+    """Run --spec-dir / --spec-jsonl batch mode. Returns the process exit code."""
+    from batch import (
+        iter_spec_dir, iter_spec_jsonl, generate_batch, generate_many,
+        log_summary, write_summary,
+    )
+
+    jobs = iter_spec_dir(args.spec_dir) if args.spec_dir else iter_spec_jsonl(args.spec_jsonl)
+    cache = make_cache(args)
+    if args.workers is not None:
+        results = generate_many(jobs, args.brand, args.out,
+                                workers=args.workers, timeout=args.timeout, cache=cache,
+                                compression=args.compression)
+    else:
+        results = generate_batch(jobs, args.brand, args.out, cache=cache,
+                                 compression=args.compression, timeout=args.timeout)
+    log_summary(results)
+    if args.summary:
+        write_summary(results, args.summary)
+    return 0 if all(r.ok for r in results) else 1
+
+
+def _read_spec(args, parser) -> dict:
+    """The whole spec from --demo, --spec or stdin."""
+    if args.demo:
+        return DEMO_SPEC
+    if args.spec:
+        with open(args.spec) as f:
+            return json.load(f)
+    if not sys.stdin.isatty():
+        return json.load(sys.stdin)
+    parser.error("Provide --spec <file>, --demo, or pipe JSON to stdin.")
+
+
+def _print_errors(errors, header: str = "❌ Spec validation failed:") -> None:
+    print(header, file=sys.stderr)
+    for err in errors:
+        print(f"   • {err}", file=sys.stderr)
+
+
+def validate_only(args, spec) -> int:
+    """--validate-only: check specs without importing the renderer stack.
+
+    Standard library only (json, batch / spec_stream readers), so a
+    pre-commit hook doesn't pay for python-pptx, lxml or PIL. Returns the
+    process exit code.
+    """
+    if args.spec_dir or args.spec_jsonl:
+        from batch import iter_spec_dir, iter_spec_jsonl
+        jobs = iter_spec_dir(args.spec_dir) if args.spec_dir else iter_spec_jsonl(args.spec_jsonl)
+        failed = 0
+        for job in jobs:
+            if job.error:
+                errors = [job.error]
+            elif not isinstance(job.spec, dict):
+                errors = ["Spec must be a JSON object."]
+            else:
+                errors = validate_spec(job.spec)
+            if errors:
+                failed += 1
+                _print_errors(errors, f"❌ {job.name}:")
+            else:
+                log.info(f"✓ {job.name}: {len(job.spec['slides'])} slides valid")
+        return 1 if failed else 0
+
+    if args.stream:
+        from spec_stream import iter_json_slides, iter_jsonl_slides
+        errors, count = [], 0
+        src = open(args.spec) if args.spec else sys.stdin
+        with src:
+            slides = iter_jsonl_slides(src) if args.stream == "jsonl" else iter_json_slides(src)
+            try:
+                for count, slide_spec in enumerate(slides, 1):
+                    errors.extend(validate_slide(count, slide_spec))
+            except ValueError as e:
+                print(f"❌ Could not parse spec: {e}", file=sys.stderr)
+                return 1
+    elif not isinstance(spec, dict):
+        errors, count = ["Spec must be a JSON object."], 0
+    else:
+        errors = validate_spec(spec)
+        count = len(spec.get("slides") or [])
+    if errors:
+        _print_errors(errors)
+        return 1
+    log.info(f"✓ Spec valid: {count} slides")
+    return 0
+
+
 def main():
+    if sys.argv[1:2] == ["serve"]:
+        from deck_server import main as serve_main
+        sys.exit(serve_main(sys.argv[2:]))
+
     parser = argparse.ArgumentParser(
         description="OpenTeams PPTX Generator",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -220,13 +663,63 @@ def main():
             Examples:
               python generate_deck.py --spec slides.json --brand ../references/brand.json --out deck.pptx
               python generate_deck.py --demo --brand ../references/brand.json --out demo.pptx
+              python generate_deck.py --spec-dir specs/ --brand ../references/brand.json --out decks/
+              python generate_deck.py serve --brand ../references/brand.json --port 8765
         """)
     )
     parser.add_argument("--spec", help="Path to slide spec JSON file")
-    parser.add_argument("--brand", required=True, help="Path to brand.json")
-    parser.add_argument("--out", required=True, help="Output .pptx file path")
+    parser.add_argument("--brand", help="Path to brand.json (required unless --validate-only)")
+    parser.add_argument("--out",
+                        help="Output .pptx file path (output directory in batch mode; "
+                             "required unless --validate-only)")
     parser.add_argument("--demo", action="store_true",
                         help="Generate demo deck with all slide types")
+    parser.add_argument("--spec-dir",
+                        help="Batch mode: render every *.json spec in this directory")
+    parser.add_argument("--spec-jsonl",
+                        help="Batch mode: render one spec per line of this JSONL file")
+    parser.add_argument("--summary",
+                        help="Batch mode: also write per-deck results to this JSON file")
+    parser.add_argument("--workers", type=int, metavar="N",
+                        help="Batch mode: render decks in N worker processes "
+                             "(0 = one per CPU allowed by the cgroup quota)")
+    parser.add_argument("--timeout", type=float, metavar="SECONDS",
+                        help="Batch mode: per-deck time limit")
+    parser.add_argument("--slide-workers", type=int, metavar="N",
+                        help="Render one large deck's slides in N worker processes "
+                             "and merge them (0 = one per available CPU)")
+    parser.add_argument("--stream", choices=["json", "jsonl"],
+                        help="Read the spec (--spec file or stdin) incrementally and render "
+                             "each slide as it arrives: 'json' parses the slides array of a "
+                             "normal spec, 'jsonl' takes one slide object per line")
+    parser.add_argument("--stream-output", action="store_true",
+                        help="Write each slide into the .pptx as soon as it is rendered and "
+                             "release it, so memory stays flat for very large decks")
+    parser.add_argument("--compression", choices=["store", "fast", "default", "max"],
+                        default="default",
+                        help="Zip compression: 'store' (none, fastest), 'fast', 'default' "
+                             "(as python-pptx) or 'max'. Images are always stored as is")
+    parser.add_argument("--incremental", metavar="PREV_PPTX",
+                        help="Copy slides whose spec, theme and renderer are unchanged from "
+                             "this earlier output instead of rendering them again")
+    parser.add_argument("--cache-dir",
+                        help="Reuse rendered slides across runs, decks and processes "
+                             "through this render cache directory")
+    parser.add_argument("--cache-max-mb", type=float, default=512,
+                        help="Render cache size cap in MB; least recently used "
+                             "slides are evicted (default 512)")
+    parser.add_argument("--validate-only", action="store_true",
+                        help="Only validate the spec(s) and exit; never loads python-pptx")
+    parser.add_argument("--schema", action="store_true",
+                        help="Print the JSON Schema for slide specs and exit")
+    parser.add_argument("--trace", metavar="TRACE_JSON",
+                        help="Write Chrome/Perfetto trace events (spec/brand load, each "
+                             "renderer and its SlideBuilder helpers, save) to this file")
+    parser.add_argument("--profile", metavar="PSTATS",
+                        help="Run under cProfile and write the stats to this file")
+    parser.add_argument("--metrics-file",
+                        help="Write generation metrics (decks, slides per type, shapes, "
+                             "renderer latency, cache hits...) to this Prometheus textfile")
     parser.add_argument("-v", "--verbose", action="store_true",
                         help="Enable debug logging")
 
@@ -235,17 +728,55 @@ def main():
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
-    if args.demo:
-        spec = DEMO_SPEC
-    elif args.spec:
-        with open(args.spec) as f:
-            spec = json.load(f)
-    elif not sys.stdin.isatty():
-        spec = json.load(sys.stdin)
-    else:
-        parser.error("Provide --spec <file>, --demo, or pipe JSON to stdin.")
-
-    generate(spec, args.brand, args.out)
+    if args.schema:
+        print(json.dumps(spec_schema(), indent=2, ensure_ascii=False))
+        sys.exit(0)
+    if args.validate_only:
+        spec = None
+        if not (args.spec_dir or args.spec_jsonl or args.stream):
+            try:
+                spec = _read_spec(args, parser)
+            except ValueError as e:
+                print(f"❌ Could not parse spec: {e}", file=sys.stderr)
+                sys.exit(1)
+        sys.exit(validate_only(args, spec))
+    if not args.brand or not args.out:
+        parser.error("--brand and --out are required.")
+
+    if not (args.spec_dir or args.spec_jsonl):
+        if args.workers is not None or args.timeout is not None:
+            parser.error("--workers/--timeout need --spec-dir or --spec-jsonl.")
+        if args.incremental and args.slide_workers is not None:
+            parser.error("--incremental can't be combined with --slide-workers.")
+
+    try:
+        with tracing.session(args.trace, args.profile):
+            run(args, parser)
+    finally:
+        if args.metrics_file:
+            metrics.REGISTRY.write_textfile(args.metrics_file)
+
+
+def run(args, parser) -> None:
+    """Generate the deck(s) for already checked CLI arguments."""
+    if args.spec_dir or args.spec_jsonl:
+        sys.exit(run_batch(args))
+
+    if args.stream:
+        from spec_stream import iter_json_slides, iter_jsonl_slides
+        src = open(args.spec) if args.spec else sys.stdin
+        with src:
+            slides = iter_jsonl_slides(src) if args.stream == "jsonl" else iter_json_slides(src)
+            generate_stream(slides, args.brand, args.out, stream_output=args.stream_output,
+                            incremental=args.incremental, cache=make_cache(args),
+                            compression=args.compression)
+        return
+
+    with tracing.span("load spec"):
+        spec = _read_spec(args, parser)
+    generate(spec, args.brand, args.out, slide_workers=args.slide_workers,
+             stream_output=args.stream_output, incremental=args.incremental,
+             cache=make_cache(args), compression=args.compression)
 
 
 if __name__ == "__main__":
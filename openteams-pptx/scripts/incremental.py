@@ -0,0 +1,165 @@
+# Authored by Amelia Thurdekoos
+# Email: ameliathurdekoos@gmail.com
+#
+# Any cares, concerns, compliments, or enhancements are always welcome!
+
+"""
+Incremental rebuilds — reuse unchanged slides from the previous output.
+
+Every rendered slide is stamped with a content hash over its slide spec, the
+theme and the renderer code (stored in the slide's <p:extLst>, which
+PowerPoint ignores). With `--incremental prev.pptx`, slides whose hash is
+found in the previous package are copied over (XML + media) instead of being
+rendered again, so an edit-regenerate cycle costs roughly what the changed
+slides cost.
+
+Slides never depend on their position in the deck, so a reused slide can
+move freely when slides are inserted or removed.
+"""
+from __future__ import annotations
+
+import datetime
+import hashlib
+import io
+import json
+import logging
+import os
+import posixpath
+import re
+import zipfile
+from typing import Dict, Optional, Tuple
+
+from lxml import etree
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+
+from pptx_helpers import P_NS
+from spec_models import slide_to_dict
+
+log = logging.getLogger(__name__)
+
+_EXT_URI = "{5C6B0B4B-4F4B-4E8E-9C3E-6F70656E7465}"
+_OT_NS = "urn:openteams-pptx:render"
+_HASH_RE = re.compile(rb'renderHash\b[^>]*?\sval="([0-9a-f]{40})"')
+_SLIDE_RE = re.compile(r"^ppt/slides/slide\d+\.xml$")
+_LAYOUT_NAME_RE = re.compile(rb'<p:cSld\b[^>]*?\sname="([^"]*)"')
+
+# Modules whose code decides what a slide looks like
+_RENDER_MODULES = ("slide_renderers.py", "slide_builder.py", "pptx_helpers.py",
+                   "brand_engine.py", "spec_models.py")
+
+_renderer_version: Optional[str] = None
+_theme_key: Tuple[object, str] = (None, "")
+
+
+# ---------------------------------------------------------------------------
+# Hashing
+# ---------------------------------------------------------------------------
+
+def renderer_version() -> str:
+    """Hash of the rendering code (plus the year printed on covers)."""
+    global _renderer_version
+    if _renderer_version is None:
+        h = hashlib.sha1(str(datetime.date.today().year).encode())
+        here = os.path.dirname(os.path.abspath(__file__))
+        for name in _RENDER_MODULES:
+            with open(os.path.join(here, name), "rb") as f:
+                h.update(f.read())
+        _renderer_version = h.hexdigest()
+    return _renderer_version
+
+
+def theme_key(theme) -> str:
+    """Hash of every theme value, including the contents of the logo files."""
+    global _theme_key
+    if _theme_key[0] is theme:
+        return _theme_key[1]
+    h = hashlib.sha1(renderer_version().encode())
+    h.update(json.dumps(theme.tokens(), sort_keys=True, default=str).encode())
+    for path in sorted(theme.brand.logo_assets.values()):
+        if os.path.isfile(path):
+            with open(path, "rb") as f:
+                h.update(hashlib.sha1(f.read()).digest())
+    _theme_key = (theme, h.hexdigest())
+    return _theme_key[1]
+
+
+def slide_key(theme, slide) -> str:
+    """Content hash identifying the rendered output of one slide (a spec_models slide)."""
+    h = hashlib.sha1(theme_key(theme).encode())
+    h.update(json.dumps(slide_to_dict(slide), sort_keys=True, separators=(",", ":")).encode())
+    return h.hexdigest()
+
+
+def stamp_slide(slide, key: str) -> None:
+    """Record ``key`` in the slide's extension list."""
+    sld = slide.part._element
+    ext_lst = sld.find(f"{{{P_NS}}}extLst")
+    if ext_lst is None:
+        ext_lst = etree.SubElement(sld, f"{{{P_NS}}}extLst")
+    ext = etree.SubElement(ext_lst, f"{{{P_NS}}}ext", uri=_EXT_URI)
+    marker = etree.SubElement(ext, f"{{{_OT_NS}}}renderHash", nsmap={"ot": _OT_NS})
+    marker.set("val", key)
+
+
+# ---------------------------------------------------------------------------
+# Previous package
+# ---------------------------------------------------------------------------
+
+class PreviousDeck:
+    """Index of the stamped slides in a previously generated .pptx.
+
+    Only the slide XML is scanned up front (a regex, no XML parsing); rels
+    and media are read for the slides that are actually reused.
+    """
+
+    def __init__(self, path: str, output=None):
+        if isinstance(output, (str, os.PathLike)) and os.path.exists(output) \
+                and os.path.samefile(path, output):
+            # Rebuilding in place: the output will truncate the file under us
+            with open(path, "rb") as f:
+                source = io.BytesIO(f.read())
+        else:
+            source = path
+        self._zip = zipfile.ZipFile(source)
+        self._slides: Dict[str, str] = {}
+        self._media: Dict[str, bytes] = {}
+        self._layout_names: Dict[str, Optional[str]] = {}
+        self.reused = 0
+        for name in self._zip.namelist():
+            if _SLIDE_RE.match(name):
+                m = _HASH_RE.search(self._zip.read(name))
+                if m:
+                    self._slides.setdefault(m.group(1).decode(), name)
+        log.debug("Previous deck %s: %d reusable slides", path, len(self._slides))
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._slides
+
+    def get(self, key: str) -> Tuple[bytes, Dict[str, bytes], Optional[str]]:
+        """Return ``(slide_xml, {rId: image_blob}, layout_name)`` as
+        pptx_helpers.export_slide does."""
+        name = self._slides[key]
+        rels_name = posixpath.join(posixpath.dirname(name), "_rels",
+                                   posixpath.basename(name) + ".rels")
+        images, layout = {}, None
+        for rel in etree.fromstring(self._zip.read(rels_name)):
+            if rel.get("TargetMode") == "External":
+                continue
+            member = posixpath.normpath(posixpath.join(posixpath.dirname(name), rel.get("Target")))
+            if rel.get("Type") == RT.SLIDE_LAYOUT:
+                layout = self._layout_name(member)
+            elif rel.get("Type") == RT.IMAGE:
+                if member not in self._media:
+                    self._media[member] = self._zip.read(member)
+                images[rel.get("Id")] = self._media[member]
+        self.reused += 1
+        return self._zip.read(name), images, layout
+
+    def _layout_name(self, member: str) -> Optional[str]:
+        if member not in self._layout_names:
+            m = _LAYOUT_NAME_RE.search(self._zip.read(member))
+            self._layout_names[member] = m.group(1).decode() if m else None
+        return self._layout_names[member]
+
+    def close(self) -> None:
+        self._zip.close()
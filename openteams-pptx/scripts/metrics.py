@@ -0,0 +1,250 @@
+# Authored by Amelia Thurdekoos
+# Email: ameliathurdekoos@gmail.com
+#
+# Any cares, concerns, compliments, or enhancements are always welcome!
+
+"""
+Generation metrics — counters and latency histograms for batch and daemon runs.
+
+Everything is recorded in the process-wide REGISTRY (standard library only,
+so importing this costs nothing). Read it from Python with
+REGISTRY.snapshot(), or dump it in the Prometheus text format for
+node_exporter's textfile collector:
+
+  python generate_deck.py --spec-dir specs/ ... --metrics-file /var/lib/node_exporter/openteams_pptx.prom
+  python generate_deck.py serve ... --metrics-file /var/lib/node_exporter/openteams_pptx.prom
+
+write_textfile() replaces the file atomically, so the collector never scrapes
+a half-written file.
+
+Pool workers count into their own registry. After each job they hand the
+increments back with REGISTRY.drain() and the parent merges them, so the
+totals cover every process.
+"""
+from __future__ import annotations
+
+import logging
+import math
+import os
+import tempfile
+import threading
+from typing import Dict, List, Sequence, Tuple
+
+log = logging.getLogger(__name__)
+
+# Renderer latencies, in seconds
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+
+class Counter:
+    """Monotonic counter, optionally split by labels."""
+    kind = "counter"
+
+    def __init__(self, registry: "Registry", name: str, help: str,
+                 labelnames: Sequence[str] = ()):
+        self._registry = registry
+        self.name, self.help, self.labelnames = name, help, tuple(labelnames)
+        self.values: Dict[Tuple[str, ...], float] = {}
+
+    def _key(self, labels: dict) -> Tuple[str, ...]:
+        return tuple(str(labels.get(n, "")) for n in self.labelnames)
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._registry.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        return self.values.get(self._key(labels), 0)
+
+    # --- snapshot / merge ---
+
+    def _dump(self) -> dict:
+        return dict(self.values)
+
+    def _merge(self, data: dict) -> None:
+        for key, amount in data.items():
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def _lines(self) -> List[str]:
+        if not self.values and not self.labelnames:
+            return [f"{self.name} 0"]   # plain counters exist from the start
+        return [f"{self.name}{_labels(self.labelnames, key)} {_num(v)}"
+                for key, v in sorted(self.values.items())]
+
+
+class Histogram:
+    """Bucketed observations (cumulative on export), with a sum and count per label set."""
+    kind = "histogram"
+
+    def __init__(self, registry: "Registry", name: str, help: str,
+                 labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self._registry = registry
+        self.name, self.help, self.labelnames = name, help, tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self.values: Dict[Tuple[str, ...], list] = {}   # key -> [bucket counts..., +Inf, sum]
+
+    def _key(self, labels: dict) -> Tuple[str, ...]:
+        return tuple(str(labels.get(n, "")) for n in self.labelnames)
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._registry.lock:
+            row = self.values.get(key)
+            if row is None:
+                row = self.values[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    row[i] += 1
+                    break
+            else:
+                row[len(self.buckets)] += 1
+            row[-1] += value
+
+    def count(self, **labels) -> int:
+        row = self.values.get(self._key(labels))
+        return sum(row[:-1]) if row else 0
+
+    # --- snapshot / merge ---
+
+    def _dump(self) -> dict:
+        return {key: list(row) for key, row in self.values.items()}
+
+    def _merge(self, data: dict) -> None:
+        for key, row in data.items():
+            mine = self.values.get(key)
+            if mine is None:
+                self.values[key] = list(row)
+            else:
+                self.values[key] = [a + b for a, b in zip(mine, row)]
+
+    def _lines(self) -> List[str]:
+        lines = []
+        for key, row in sorted(self.values.items()):
+            cumulative = 0
+            for bound, n in zip(self.buckets + (math.inf,), row[:-1]):
+                cumulative += n
+                le = "+Inf" if bound == math.inf else _num(bound)
+                lines.append(f"{self.name}_bucket"
+                             f"{_labels(self.labelnames + ('le',), key + (le,))} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, key)} {_num(row[-1])}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, key)} {cumulative}")
+        return lines
+
+
+class Registry:
+    """A named set of metrics."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self._metrics: Dict[str, Counter | Histogram] = {}
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._add(Counter(self, name, help, labelnames))
+
+    def histogram(self, name: str, help: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._add(Histogram(self, name, help, labelnames, buckets))
+
+    def _add(self, metric):
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def get(self, name: str) -> Counter | Histogram:
+        return self._metrics[name]
+
+    def snapshot(self) -> Dict[str, dict]:
+        """Every metric's current values, as plain (picklable) data."""
+        with self.lock:
+            return {name: m._dump() for name, m in self._metrics.items() if m.values}
+
+    def drain(self) -> Dict[str, dict]:
+        """snapshot() and reset to zero — how workers report to the parent."""
+        with self.lock:
+            data = {name: m._dump() for name, m in self._metrics.items() if m.values}
+            for m in self._metrics.values():
+                m.values.clear()
+        return data
+
+    def merge(self, data: Dict[str, dict]) -> None:
+        """Add a snapshot (typically another process's drain()) into this registry."""
+        if not data:
+            return
+        with self.lock:
+            for name, values in data.items():
+                metric = self._metrics.get(name)
+                if metric is not None:
+                    metric._merge(values)
+
+    def reset(self) -> None:
+        with self.lock:
+            for m in self._metrics.values():
+                m.values.clear()
+
+    def exposition(self) -> str:
+        """The registry in the Prometheus text exposition format (0.0.4)."""
+        lines = []
+        with self.lock:
+            for m in self._metrics.values():
+                lines.append(f"# HELP {m.name} {m.help}")
+                lines.append(f"# TYPE {m.name} {m.kind}")
+                lines.extend(m._lines())
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path: str) -> None:
+        """Write exposition() to ``path`` atomically (temp file + rename)."""
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".metrics-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(self.exposition())
+            os.chmod(tmp, 0o644)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{n}="{_escape(v)}"' for n, v in zip(names, values)) + "}"
+
+
+def _num(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+# ---------------------------------------------------------------------------
+# Generator metrics
+# ---------------------------------------------------------------------------
+
+REGISTRY = Registry()
+
+DECKS = REGISTRY.counter(
+    "openteams_pptx_decks_rendered_total", "Decks written.")
+SLIDES = REGISTRY.counter(
+    "openteams_pptx_slides_total",
+    "Slides added to decks, by slide type and source (rendered, unchanged, cached).",
+    ("type", "source"))
+SHAPES = REGISTRY.counter(
+    "openteams_pptx_shapes_created_total", "Top-level shapes on added slides.", ("type",))
+PICTURES = REGISTRY.counter(
+    "openteams_pptx_pictures_embedded_total", "Pictures on added slides.", ("type",))
+BYTES_WRITTEN = REGISTRY.counter(
+    "openteams_pptx_bytes_written_total", "Bytes of .pptx output written.")
+RENDER_SECONDS = REGISTRY.histogram(
+    "openteams_pptx_render_seconds", "Time spent in each slide renderer.", ("renderer",))
+CACHE_HITS = REGISTRY.counter(
+    "openteams_pptx_render_cache_hits_total", "Slides copied from the render cache.")
+CACHE_MISSES = REGISTRY.counter(
+    "openteams_pptx_render_cache_misses_total", "Render cache lookups that had to render.")
+VALIDATION_FAILURES = REGISTRY.counter(
+    "openteams_pptx_validation_failures_total", "Specs rejected by validation.")
@@ -0,0 +1,287 @@
+# Authored by Amelia Thurdekoos
+# Email: ameliathurdekoos@gmail.com
+#
+# Any cares, concerns, compliments, or enhancements are always welcome!
+
+"""
+.pptx output: a parallel zip writer and a streaming writer with bounded memory.
+
+save_presentation() replaces prs.save(). It serializes the parts in a thread
+pool, ahead of the calling thread, which writes each finished one into the
+zip through zipfile, in python-pptx's order. Compression itself stays on the
+calling thread: zipfile has no public way to add an entry deflated elsewhere.
+Inside a pool worker process (batch, deck_server) it runs single-threaded,
+since those pools already take every core. Both writers take a compression
+profile:
+
+  store    no compression
+  fast     deflate level 1
+  default  zlib's default level (what prs.save() uses)
+  max      deflate level 9
+
+Already-compressed media (PNG, JPEG, GIF, ...) is always stored as is.
+
+StreamingPackageWriter: python-pptx keeps every slide's lxml tree alive until prs.save(), so peak
+memory grows with the deck. StreamingPackageWriter instead serializes each
+finished slide (and any new media) straight into the output zip, then detaches
+it from the presentation so it can be garbage-collected. presentation.xml,
+its relationships, the masters/layouts/theme and [Content_Types].xml are
+written last, in close().
+
+Renderers don't change: they keep adding slides through SlideBuilder and the
+render loop calls flush() after each one.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import multiprocessing
+import os
+import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+from pptx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+from pptx.opc.oxml import CT_Relationships
+from pptx.opc.packuri import PackURI, PACKAGE_URI, CONTENT_TYPES_URI
+
+from cpu_limits import default_workers
+from pptx_compat import content_types_xml, package_rels, slide_id_list
+
+log = logging.getLogger(__name__)
+
+# Profile -> deflate level (None = store)
+COMPRESSION_PROFILES = {
+    "store": None,
+    "fast": 1,
+    "default": zlib.Z_DEFAULT_COMPRESSION,
+    "max": 9,
+}
+# Part extensions whose content is already compressed
+STORED_EXTENSIONS = frozenset({"png", "jpg", "jpeg", "jpe", "jfif", "gif", "webp",
+                               "mp3", "m4a", "mp4", "m4v", "wdp"})
+
+
+def _level(compression: str):
+    try:
+        return COMPRESSION_PROFILES[compression]
+    except KeyError:
+        raise ValueError(f"Unknown compression profile '{compression}'. "
+                         f"Valid profiles: {', '.join(COMPRESSION_PROFILES)}") from None
+
+
+def _is_stored(membername: str) -> bool:
+    return membername.rpartition(".")[2].lower() in STORED_EXTENSIONS
+
+
+# ---------------------------------------------------------------------------
+# Parallel writer
+# ---------------------------------------------------------------------------
+
+def _serialize(blob) -> bytes:
+    """Runs in a pool thread: ``blob`` may be a callable (part serialization)."""
+    return blob() if callable(blob) else blob
+
+
+def _compress_type(membername: str, level) -> int:
+    if level is None or _is_stored(membername):
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+def _default_threads() -> int:
+    # Pool workers share the machine with their siblings: don't add threads
+    if multiprocessing.parent_process() is not None:
+        return 1
+    return min(8, default_workers())
+
+
+def save_presentation(prs, output, compression: str = "default",
+                      threads: int | None = None) -> None:
+    """Write ``prs`` to ``output`` (path or binary file object) like prs.save().
+
+    Same members, order and content as python-pptx. Parts are serialized in
+    ``threads`` threads (default: min(8, default_workers()), or 1 in a worker
+    process); this thread compresses and writes them in order.
+    """
+    level = _level(compression)
+    package = prs.part.package
+    parts = tuple(package.iter_parts())
+    members = [(CONTENT_TYPES_URI.membername, content_types_xml(parts)),
+               (PACKAGE_URI.rels_uri.membername, package_rels(package).xml)]
+    for part in parts:
+        members.append((part.partname.membername, lambda part=part: part.blob))
+        if part.rels:
+            members.append((part.partname.rels_uri.membername,
+                            lambda part=part: part.rels.xml))
+
+    threads = threads or _default_threads()
+    with zipfile.ZipFile(output, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        def write(membername, data):
+            zf.writestr(membername, data, compress_type=_compress_type(membername, level),
+                        compresslevel=level)
+
+        if threads == 1:
+            for membername, blob in members:
+                write(membername, _serialize(blob))
+            return
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            # map() yields in submission order, so entries keep python-pptx's order
+            blobs = pool.map(_serialize, [blob for _, blob in members])
+            for (membername, _), data in zip(members, blobs):
+                write(membername, data)
+
+
+# ---------------------------------------------------------------------------
+# Streaming writer
+# ---------------------------------------------------------------------------
+
+def _rId_order(rId: str) -> int:
+    return int(rId[3:]) if rId.startswith("rId") and rId[3:].isdigit() else 0
+
+
+class StreamingPackageWriter:
+    """Write a presentation's slides to ``output`` as they are finished.
+
+    Use as a context manager around the render loop::
+
+        with StreamingPackageWriter(prs, "big.pptx") as writer:
+            for ...:
+                renderer(sb, slide_spec)
+                writer.flush()
+        # close() on exit writes the remaining package parts
+
+    If the block raises, the partial file is removed instead.
+    """
+
+    def __init__(self, prs, output, compression: str = "default"):
+        self.prs = prs
+        self.output = output
+        level = _level(compression)
+        self._zip = zipfile.ZipFile(
+            output, "w", compression=zipfile.ZIP_STORED if level is None else zipfile.ZIP_DEFLATED,
+            compresslevel=None if level is None else level)
+        self._slide_partnames: list[PackURI] = []
+        self._media: dict[str, PackURI] = {}        # sha1 -> written partname
+        self._media_parts: set = set()              # image parts already remapped
+        self._written: list[SimpleNamespace] = []   # partname/content_type pairs
+        self._closed = False
+
+    @property
+    def slide_count(self) -> int:
+        return len(self._slide_partnames)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+        return False
+
+    # --- writing ---
+
+    def _write(self, partname: PackURI, blob: bytes, content_type: str | None = None) -> None:
+        if _is_stored(partname.membername):
+            self._zip.writestr(partname.membername, blob, compress_type=zipfile.ZIP_STORED)
+        else:
+            self._zip.writestr(partname.membername, blob)
+        if content_type is not None:
+            self._written.append(SimpleNamespace(partname=partname, content_type=content_type))
+
+    def _write_media(self, image_part) -> PackURI:
+        """Write an image once per distinct blob; return its partname in the output."""
+        blob = image_part.blob
+        sha1 = hashlib.sha1(blob).hexdigest()
+        self._media_parts.add(image_part)
+        partname = self._media.get(sha1)
+        if partname is None:
+            # Own numbering: python-pptx reuses image1.png once earlier slides are detached
+            partname = PackURI(f"/ppt/media/image{len(self._media) + 1}.{image_part.partname.ext}")
+            self._write(partname, blob, image_part.content_type)
+            self._media[sha1] = partname
+        return partname
+
+    def _rels_xml(self, rels, base_uri: str, extra=(), slide: bool = False) -> bytes:
+        """Serialize ``rels`` with image targets pointed at the written media."""
+        rels_elm = CT_Relationships.new()
+        for rId in sorted(rels.keys(), key=_rId_order):
+            rel = rels[rId]
+            if rel.is_external:
+                target = rel.target_ref
+            elif rel.reltype == RT.IMAGE:
+                target = self._write_media(rel.target_part).relative_ref(base_uri)
+            elif slide and rel.reltype != RT.SLIDE_LAYOUT:
+                raise ValueError(f"Streaming output can't write slide relationship "
+                                 f"type {rel.reltype}")
+            else:
+                target = rel.target_part.partname.relative_ref(base_uri)
+            rels_elm.add_rel(rId, rel.reltype, target, rel.is_external)
+        for rId, reltype, target in extra:
+            rels_elm.add_rel(rId, reltype, target, False)
+        return rels_elm.xml_file_bytes
+
+    def flush(self) -> None:
+        """Write out and detach every slide currently in the presentation."""
+        prs_part = self.prs.part
+        sldIdLst = slide_id_list(self.prs)
+        for sldId in list(sldIdLst):
+            rId = sldId.rId
+            slide_part = prs_part.related_part(rId)
+            partname = PackURI(f"/ppt/slides/slide{self.slide_count + 1}.xml")
+            self._write(partname, slide_part.blob, CT.PML_SLIDE)
+            self._write(partname.rels_uri,
+                        self._rels_xml(slide_part.rels, partname.baseURI, slide=True))
+            self._slide_partnames.append(partname)
+
+            sldIdLst.remove(sldId)
+            prs_part.drop_rel(rId)
+
+    def close(self) -> int:
+        """Write the remaining package parts. Returns the number of slides written."""
+        if self._closed:
+            return self.slide_count
+        self.flush()
+        prs_part = self.prs.part
+        package = prs_part.package
+
+        # presentation.xml: list every streamed slide, related under fresh rIds
+        next_rId = max((_rId_order(r) for r in prs_part.rels.keys()), default=0) + 1
+        sldIdLst = slide_id_list(self.prs)
+        slide_rels = []
+        for n, partname in enumerate(self._slide_partnames):
+            rId = f"rId{next_rId + n}"
+            sldIdLst.add_sldId(rId)     # flush() emptied it, so ids run from 256
+            slide_rels.append((rId, RT.SLIDE, partname.relative_ref(prs_part.partname.baseURI)))
+
+        # Rels first: that's where layout/master images get remapped into /ppt/media
+        parts = list(package.iter_parts())
+        part_rels = {}
+        for part in parts:
+            if part.rels:
+                extra = slide_rels if part is prs_part else ()
+                part_rels[part] = self._rels_xml(part.rels, part.partname.baseURI, extra)
+
+        for part in parts:
+            if part in self._media_parts:
+                continue
+            self._write(part.partname, part.blob, part.content_type)
+            if part in part_rels:
+                self._write(part.partname.rels_uri, part_rels[part])
+        self._write(PACKAGE_URI.rels_uri, package_rels(package).xml)
+        self._write(CONTENT_TYPES_URI, content_types_xml(self._written))
+        self._zip.close()
+        self._closed = True
+        return self.slide_count
+
+    def abort(self) -> None:
+        """Close and, for path outputs, delete the partial file."""
+        if self._closed:
+            return
+        self._zip.close()
+        self._closed = True
+        if isinstance(self.output, (str, os.PathLike)) and os.path.exists(self.output):
+            os.unlink(self.output)
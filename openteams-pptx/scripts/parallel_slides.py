@@ -0,0 +1,124 @@
+# Authored by Amelia Thurdekoos
+# Email: ameliathurdekoos@gmail.com
+#
+# Any cares, concerns, compliments, or enhancements are always welcome!
+
+"""
+Intra-deck parallel rendering — split one big deck across worker processes.
+
+Each worker renders a contiguous range of slides into its own throwaway
+Presentation (own SlideBuilder, shared theme) and sends back every slide as
+serialized XML plus its image blobs and layout name
+(pptx_helpers.export_slide). The parent then merges the ranges in order
+into a single package with SlideBuilder.add_exported_slide, which puts each
+slide on the same branded layout, re-creates relationship IDs and shares
+one media part per distinct image.
+"""
+from __future__ import annotations
+
+import logging
+import math
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
+
+from spec_models import Slide
+
+log = logging.getLogger(__name__)
+
+# Ranges per worker: a few per process keeps the pool busy when some slide
+# types are much slower than others.
+CHUNKS_PER_WORKER = 4
+
+_THEME = None
+_CACHE = None
+
+
+def _init_slide_worker(theme, cache=None) -> None:
+    """Pool initializer: keep the parent's theme/cache and warm the render stack."""
+    global _THEME, _CACHE
+    from generate_deck import warm_up
+
+    warm_up(theme)
+    _THEME = theme
+    _CACHE = cache
+
+
+def _render_range(slides: List[Slide], start: int) -> tuple:
+    """Render ``slides`` (spec_models slides, 1-based index ``start``) and export each slide.
+
+    Returns ``(exported_slides, cache_stats, metrics)``; the stats and the
+    drained metrics cover this range only.
+    """
+    import metrics
+    from generate_deck import new_presentation, render_slides
+    from pptx_helpers import export_slide
+    from slide_builder import SlideBuilder
+
+    before = _CACHE.stats() if _CACHE is not None else {}
+    prs = new_presentation(_THEME)
+    sb = SlideBuilder(prs, _THEME)
+    render_slides(sb, slides, start=start, cache=_CACHE)
+    stats = {k: v - before[k] for k, v in _CACHE.stats().items()} if _CACHE is not None else {}
+    return [export_slide(slide) for slide in prs.slides], stats, metrics.REGISTRY.drain()
+
+
+def render_deck_parallel(spec: dict, theme, output, workers: Optional[int] = None,
+                         chunk_size: Optional[int] = None,
+                         stream_output: bool = False, cache=None,
+                         compression: str = "default") -> int:
+    """Render one deck across ``workers`` processes and merge the result.
+
+    Same contract as generate_deck.render_deck: validates first (raising
+    SpecValidationError), writes ``output`` and returns the slide count.
+    ``chunk_size`` defaults to an even split into CHUNKS_PER_WORKER ranges
+    per worker. With ``stream_output`` each merged range is flushed to the
+    zip before the next is imported. Workers share ``cache`` (a RenderCache);
+    their hit/miss counts are added to it. ``compression`` is the zip
+    compression profile, as in render_deck.
+    """
+    import metrics
+    from cpu_limits import default_workers
+    from generate_deck import new_presentation, record_deck, load_slides
+    from package_writer import save_presentation
+    from slide_builder import SlideBuilder
+
+    slides = load_slides(spec)
+    workers = workers or default_workers()
+    if chunk_size is None:
+        chunk_size = max(1, math.ceil(len(slides) / (workers * CHUNKS_PER_WORKER)))
+    starts = range(0, len(slides), chunk_size)
+
+    prs = new_presentation(theme)
+    sb = SlideBuilder(prs, theme)
+    writer = None
+    if stream_output:
+        from package_writer import StreamingPackageWriter
+        writer = StreamingPackageWriter(prs, output, compression)
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_slide_worker,
+                                 initargs=(theme, cache)) as pool:
+            futures = [pool.submit(_render_range, slides[s:s + chunk_size], s + 1)
+                       for s in starts]
+            # Merge strictly in range order so slide order matches the spec
+            for future in futures:
+                exported, stats, worker_metrics = future.result()
+                for slide_xml, images, layout in exported:
+                    sb.add_exported_slide(slide_xml, images, layout)
+                if cache is not None:
+                    cache.add_stats(stats)
+                metrics.REGISTRY.merge(worker_metrics)
+                if writer:
+                    writer.flush()
+    except BaseException:
+        if writer:
+            writer.abort()
+        raise
+
+    if writer:
+        count = writer.close()
+    else:
+        log.debug("Merged %d slides from %d ranges", len(prs.slides), len(futures))
+        save_presentation(prs, output, compression)
+        count = len(prs.slides)
+    record_deck(output)
+    return count
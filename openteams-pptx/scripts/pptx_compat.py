@@ -0,0 +1,62 @@
+# Authored by Amelia Thurdekoos
+# Email: ameliathurdekoos@gmail.com
+#
+# Any cares, concerns, compliments, or enhancements are always welcome!
+
+"""
+The python-pptx internals the generator relies on, in one place.
+
+python-pptx has no public API for writing a package part by part, adding a
+slide layout, copying shapes into one or styling text outside a shape, so
+package_writer, pptx_helpers and slide_builder reach into it here and
+nowhere else. requirements.txt
+allows any python-pptx 1.x; tests/test_core.py (TestPptxCompat) fails
+loudly if one of these hooks goes away.
+"""
+from __future__ import annotations
+
+from pptx.opc.oxml import serialize_part_xml
+from pptx.opc.serialized import _ContentTypesItem
+
+
+def content_types_xml(parts) -> bytes:
+    """[Content_Types].xml for ``parts`` (objects with partname and content_type)."""
+    return serialize_part_xml(_ContentTypesItem.xml_for(parts))
+
+
+def package_rels(package):
+    """The package-level relationships (the source of /_rels/.rels)."""
+    return package._rels
+
+
+def slide_id_list(prs):
+    """presentation.xml's <p:sldIdLst>, listing the deck's slides in order."""
+    return prs.slides._sldIdLst
+
+
+def add_layout_id(master):
+    """Append a <p:sldLayoutId> to ``master``'s layout list; the caller sets id and r:id."""
+    return master._element.get_or_add_sldLayoutIdLst()._add_sldLayoutId()
+
+
+def set_background(cSld, bg) -> None:
+    """Replace ``cSld``'s <p:bg> with ``bg``, keeping schema order."""
+    cSld._remove_bg()
+    cSld._insert_bg(bg)
+
+
+def next_shape_id(shapes) -> int:
+    """The next free shape id in a slide's or layout's shape tree."""
+    return shapes._next_shape_id
+
+
+def paragraph_proxy(p):
+    """A python-pptx paragraph over a detached ``<a:p>``, for its font setters."""
+    from pptx.text.text import _Paragraph
+
+    return _Paragraph(p, None)
+
+
+def run_element(run):
+    """The ``<a:r>`` behind a python-pptx run."""
+    return run._r
@@ -9,44 +9,79 @@ Extracted from build_template.py Section 5.
 """
 from __future__ import annotations
 
+import copy
+import functools
+import hashlib
+import io
 import logging
 import re
 
 from pptx.util import Inches, Pt, Emu
 from pptx.dml.color import RGBColor
+from pptx.enum.dml import MSO_THEME_COLOR
 from pptx.enum.text import PP_ALIGN
 from pptx.enum.shapes import MSO_SHAPE
+from pptx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+from pptx.opc.package import XmlPart
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
+from pptx.oxml.xmlchemy import OxmlElement
+from pptx.parts.slide import SlideLayoutPart
 from lxml import etree
 
+from pptx_compat import add_layout_id, paragraph_proxy, run_element
+
 log = logging.getLogger(__name__)
 
 _HEX_RE = re.compile(r'^#?([0-9a-fA-F]{6})$')
 _FALLBACK_COLOR = "#000000"
+# Parsed colors kept by hex_to_rgbcolor / luminance; specs rarely use more
+_COLOR_CACHE_SIZE = 1024
+_warned_colors: set = set()
+_A_R, _A_T = qn("a:r"), qn("a:t")
+# Control characters XML can't hold (tab and line feed can), as _xHHHH_ escapes
+_CTRL_CHAR_RE = re.compile(r"[\x00-\x08\x0B-\x1F]")
+
+# Theme font references: the typefaces of the theme's major (headings) and
+# minor (body) fonts, as written by set_theme
+MAJOR_FONT = "+mj-lt"
+MINOR_FONT = "+mn-lt"
+
+# PresentationML namespace, and the attribute holding a picture's image rId
+P_NS = "http://schemas.openxmlformats.org/presentationml/2006/main"
+R_EMBED = qn("r:embed")
 
 
 # ---------------------------------------------------------------------------
 # Color utilities
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=_COLOR_CACHE_SIZE)
 def hex_to_rgbcolor(hex_val: str) -> RGBColor:
     """Convert a hex color string to an RGBColor.
 
-    Validates input and falls back to black with a warning on bad values.
+    Validates input and falls back to black with a warning on bad values
+    (once per value). Results are memoized; RGBColor is immutable, so
+    callers can share them. Theme colors are precomputed in
+    ThemeConfig.color_table (see ThemeConfig.rgb).
     """
     m = _HEX_RE.match(hex_val.strip())
     if not m:
-        log.warning("Invalid hex color '%s' — falling back to %s", hex_val, _FALLBACK_COLOR)
-        hex_val = _FALLBACK_COLOR
-    h = hex_val.lstrip("#")
-    return RGBColor(int(h[:2], 16), int(h[2:4], 16), int(h[4:6], 16))
+        if hex_val not in _warned_colors:
+            if len(_warned_colors) < _COLOR_CACHE_SIZE:
+                _warned_colors.add(hex_val)
+            log.warning("Invalid hex color '%s' — falling back to %s", hex_val, _FALLBACK_COLOR)
+        return RGBColor.from_string(_FALLBACK_COLOR[1:])
+    return RGBColor.from_string(m.group(1))
 
 
+@functools.lru_cache(maxsize=_COLOR_CACHE_SIZE)
 def luminance(hex_val: str) -> float:
     """Relative luminance for WCAG contrast check."""
     m = _HEX_RE.match(hex_val.strip())
     if not m:
         return 0.0
-    h = hex_val.lstrip("#")
+    h = m.group(1)
     r, g, b = int(h[:2], 16) / 255, int(h[2:4], 16) / 255, int(h[4:6], 16) / 255
 
     def linearize(c):
@@ -61,6 +96,32 @@ def contrast_ratio(c1: str, c2: str) -> float:
     return (lighter + 0.05) / (darker + 0.05)
 
 
+def set_color(color_format, color) -> None:
+    """Set a python-pptx ColorFormat to a color.
+
+    ``color`` is a scheme color (MSO_THEME_COLOR, written as
+    ``<a:schemeClr>``), an RGBColor or a hex string. Brand colors come as
+    ThemeConfig.color_ref(...); the other color helpers take the same values.
+    """
+    if isinstance(color, MSO_THEME_COLOR):
+        color_format.theme_color = color
+    elif isinstance(color, str):
+        color_format.rgb = hex_to_rgbcolor(color)
+    else:
+        color_format.rgb = color
+
+
+def _color_element(parent, color):
+    """Append ``<a:schemeClr>`` or ``<a:srgbClr>`` for ``color`` (see set_color)."""
+    if isinstance(color, MSO_THEME_COLOR):
+        elem = etree.SubElement(parent, qn("a:schemeClr"))
+        elem.set("val", color.xml_value)
+    else:
+        elem = etree.SubElement(parent, qn("a:srgbClr"))
+        elem.set("val", str(hex_to_rgbcolor(color) if isinstance(color, str) else color))
+    return elem
+
+
 def auto_text_color(bg_hex: str) -> str:
     """Pick white or black text for best contrast on given background."""
     cr_white = contrast_ratio(bg_hex, "#FFFFFF")
@@ -72,10 +133,10 @@ def auto_text_color(bg_hex: str) -> str:
 # Shape fill / border helpers
 # ---------------------------------------------------------------------------
 
-def set_shape_fill(shape, hex_color: str):
-    """Set solid fill on a shape."""
+def set_shape_fill(shape, color):
+    """Set solid fill on a shape (``color`` as for set_color)."""
     shape.fill.solid()
-    shape.fill.fore_color.rgb = hex_to_rgbcolor(hex_color)
+    set_color(shape.fill.fore_color, color)
 
 
 def set_shape_rounded_rect_radius(shape, radius_emu: int):
@@ -103,12 +164,12 @@ def set_no_border(shape):
     shape.line.fill.background()
 
 
-def add_slide_bg_color(slide, hex_color: str):
-    """Set slide background to a solid color."""
+def add_slide_bg_color(slide, color):
+    """Set slide background to a solid color (``color`` as for set_color)."""
     bg = slide.background
     fill = bg.fill
     fill.solid()
-    fill.fore_color.rgb = hex_to_rgbcolor(hex_color)
+    set_color(fill.fore_color, color)
 
 
 def get_spPr(shape):
@@ -129,14 +190,17 @@ def get_spPr(shape):
 _get_spPr = get_spPr
 
 
-def make_gradient_rect(slide, left, top, width, height, color1_hex, color2_hex, angle=0):
-    """Add a rectangle with gradient fill using XML manipulation."""
+def make_gradient_rect(slide, left, top, width, height, color1, color2, angle=0):
+    """Add a rectangle with gradient fill using XML manipulation.
+
+    The stop colors are scheme colors, RGBColors or hex strings (see set_color).
+    """
     shape = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, left, top, width, height)
     set_no_border(shape)
 
     sp_pr = get_spPr(shape)
     if sp_pr is None:
-        set_shape_fill(shape, color1_hex)
+        set_shape_fill(shape, color1)
         return shape
 
     for child in list(sp_pr):
@@ -151,13 +215,11 @@ def make_gradient_rect(slide, left, top, width, height, color1_hex, color2_hex,
 
     gs1 = etree.SubElement(gsLst, f'{{{nsuri}}}gs')
     gs1.set('pos', '0')
-    srgb1 = etree.SubElement(gs1, f'{{{nsuri}}}srgbClr')
-    srgb1.set('val', color1_hex.lstrip('#'))
+    _color_element(gs1, color1)
 
     gs2 = etree.SubElement(gsLst, f'{{{nsuri}}}gs')
     gs2.set('pos', '100000')
-    srgb2 = etree.SubElement(gs2, f'{{{nsuri}}}srgbClr')
-    srgb2.set('val', color2_hex.lstrip('#'))
+    _color_element(gs2, color2)
 
     lin = etree.SubElement(gradFill, f'{{{nsuri}}}lin')
     lin.set('ang', str(angle * 60000))
@@ -187,7 +249,336 @@ def set_shape_alpha(shape, alpha_pct_str: str):
     gradFill = spPr.find(f'{{{nsuri}}}gradFill')
     if gradFill is not None:
         for gs in gradFill.findall(f'.//{{{nsuri}}}gs'):
-            color_elem = gs.find(f'{{{nsuri}}}srgbClr')
+            color_elem = gs[0] if len(gs) else None
             if color_elem is not None:
                 alpha = etree.SubElement(color_elem, f'{{{nsuri}}}alpha')
                 alpha.set('val', alpha_pct_str)
+
+
+# ---------------------------------------------------------------------------
+# Text frames (pre-built paragraph templates)
+# ---------------------------------------------------------------------------
+#
+# Setting font.size / bold / color / name / alignment through python-pptx
+# costs several XPath lookups and element creations per paragraph. The
+# templates below are built once per distinct style *with those same
+# setters*, so copies of them serialize exactly as before, and then
+# deep-copied for every paragraph.
+#
+# Better still, a text box's style can sit once in its ``<a:lstStyle>``
+# (list_style) on top of the deck's default text style
+# (set_default_text_style): paragraphs and runs then carry nothing, or only
+# what differs, e.g. a bullet glyph's size and color.
+
+_TXBODY_XML = (f'<p:txBody {nsdecls("a", "p")}><a:bodyPr/><a:lstStyle/><a:p/></p:txBody>')
+# Characters python-pptx turns into <a:br/> or _xHHHH_ escapes
+_SPECIAL_TEXT_RE = re.compile(r"[\x00-\x08\x0A-\x1F]")
+
+
+def _scratch_paragraph():
+    txBody = parse_xml(_TXBODY_XML)
+    return txBody.p_lst[0], paragraph_proxy(txBody.p_lst[0])
+
+
+@functools.lru_cache(maxsize=256)
+def paragraph_template(size_pt=None, bold=None, color=None, font: str = None,
+                       align=None, space_after_pt=None):
+    """An empty ``<a:p>`` whose paragraph properties carry the given style.
+
+    Shared and cached: deep-copy it (see fill_text_frame), never edit it.
+    Arguments left as None are not set; ``color`` is as for set_color and
+    ``font`` may be MAJOR_FONT / MINOR_FONT.
+    """
+    p_elm, p = _scratch_paragraph()
+    if size_pt is not None:
+        p.font.size = Pt(size_pt)
+    if bold is not None:
+        p.font.bold = bold
+    if color is not None:
+        set_color(p.font.color, color)
+    if font is not None:
+        p.font.name = font
+    if align is not None:
+        p.alignment = align
+    if space_after_pt is not None:
+        p.space_after = Pt(space_after_pt)
+    return p_elm
+
+
+@functools.lru_cache(maxsize=256)
+def run_template(size_pt=None, color=None, font: str = None):
+    """An ``<a:r>`` with character properties and empty text (deep-copy it).
+
+    Arguments left as None are not set (inherited from the list style).
+    """
+    _p_elm, p = _scratch_paragraph()
+    run = p.add_run()
+    if size_pt is not None:
+        run.font.size = Pt(size_pt)
+    if color is not None:
+        set_color(run.font.color, color)
+    if font is not None:
+        run.font.name = font
+    return run_element(run)
+
+
+@functools.lru_cache(maxsize=256)
+def list_style(size_pt=None, bold=None, color=None, font: str = None,
+               align=None, space_after_pt=None):
+    """An ``<a:lstStyle>`` whose first level carries the given style.
+
+    Takes paragraph_template's arguments; pass only what differs from the
+    deck's default text style. Shared and cached: fill_text_frame and
+    fill_run_list copy it into the text box.
+    """
+    pPr = paragraph_template(size_pt, bold, color, font, align, space_after_pt).find(qn("a:pPr"))
+    lst = parse_xml(f'<a:lstStyle {nsdecls("a")}/>')
+    if pPr is not None:
+        lvl1 = etree.SubElement(lst, qn("a:lvl1pPr"), dict(pPr.attrib))
+        lvl1.extend(copy.deepcopy(child) for child in pPr)
+    return lst
+
+
+def set_default_text_style(prs, size_pt, color, font: str) -> None:
+    """Make ``size_pt``/``color``/``font`` the deck's default first-level text.
+
+    Written to the presentation's defaultTextStyle (text boxes on slides)
+    and the first master's otherStyle (text in layouts and the master).
+    ``color`` is as for set_color; ``font`` may be MAJOR_FONT / MINOR_FONT.
+    """
+    from pptx.text.text import Font
+
+    styles = (prs.part._element.find(qn("p:defaultTextStyle")),
+              prs.slide_master._element.find(f'{qn("p:txStyles")}/{qn("p:otherStyle")}'))
+    for style in styles:
+        if style is None:
+            continue
+        lvl1 = style.find(qn("a:lvl1pPr"))
+        if lvl1 is None:
+            lvl1 = etree.SubElement(style, qn("a:lvl1pPr"))
+        defRPr = lvl1.find(qn("a:defRPr"))
+        if defRPr is None:
+            defRPr = OxmlElement("a:defRPr")
+            lvl1.append(defRPr)
+        font_props = Font(defRPr)
+        font_props.size = Pt(size_pt)
+        set_color(font_props.color, color)
+        font_props.name = font
+
+
+def _append_paragraph(txBody, template, text: str):
+    p = copy.deepcopy(template)
+    if _SPECIAL_TEXT_RE.search(text):
+        p.append_text(text)         # line breaks / control characters: python-pptx's way
+    elif text:
+        r = etree.SubElement(p, _A_R)
+        etree.SubElement(r, _A_T).text = text
+    txBody.append(p)
+    return p
+
+
+def _set_list_style(txBody, lst_style) -> None:
+    if lst_style is not None and len(lst_style):
+        txBody.replace(txBody.find(qn("a:lstStyle")), copy.deepcopy(lst_style))
+
+
+def fill_text_frame(shape, lines, template, lst_style=None) -> None:
+    """Replace a new textbox's text with one ``template`` paragraph per line.
+
+    Same XML as setting word_wrap and then ``p.text`` plus the template's
+    font properties on each paragraph through python-pptx. ``lst_style``
+    (see list_style) replaces the box's list style; with it, ``template``
+    is usually the bare ``paragraph_template()``.
+    """
+    txBody = shape._element.txBody
+    txBody.bodyPr.set("wrap", "square")
+    _set_list_style(txBody, lst_style)
+    txBody.remove(txBody.p_lst[0])
+    for line in lines:
+        _append_paragraph(txBody, template, line)
+
+
+def _escape_ctrl_chars(text: str) -> str:
+    """``text`` with each control character written as PowerPoint's ``_xHHHH_`` escape,
+    as python-pptx does when setting run text."""
+    return _CTRL_CHAR_RE.sub(lambda m: f"_x{ord(m.group()):04X}_", text)
+
+
+def fill_run_list(shape, paragraphs, template, lst_style=None) -> None:
+    """Like fill_text_frame, with paragraphs built from run templates.
+
+    ``paragraphs`` yields ``[(run_template, text), ...]`` per paragraph.
+    """
+    txBody = shape._element.txBody
+    txBody.bodyPr.set("wrap", "square")
+    _set_list_style(txBody, lst_style)
+    txBody.remove(txBody.p_lst[0])
+    for runs in paragraphs:
+        p = copy.deepcopy(template)
+        for r_template, text in runs:
+            r = copy.deepcopy(r_template)
+            r[-1].text = _escape_ctrl_chars(text)
+            p.append(r)
+        txBody.append(p)
+
+
+# ---------------------------------------------------------------------------
+# Theme part (color and font schemes)
+# ---------------------------------------------------------------------------
+
+def _write_theme(theme, name: str, colors: tuple, major_font: str, minor_font: str) -> None:
+    """Give the <a:theme> element ``theme`` a new color scheme and major/minor latin fonts.
+
+    ``colors`` is ``((slot, hex), ...)`` for the clrScheme slots (dk1, lt1,
+    ..., folHlink).
+    """
+    theme.set("name", name)
+    elements = theme.find(qn("a:themeElements"))
+    clr_scheme = elements.find(qn("a:clrScheme"))
+    clr_scheme.set("name", name)
+    for slot, hex_val in colors:
+        holder = clr_scheme.find(qn(f"a:{slot}"))
+        if holder is None:
+            holder = etree.SubElement(clr_scheme, qn(f"a:{slot}"))
+        holder[:] = []
+        _color_element(holder, hex_val)
+    font_scheme = elements.find(qn("a:fontScheme"))
+    font_scheme.set("name", name)
+    for tag, typeface in (("a:majorFont", major_font), ("a:minorFont", minor_font)):
+        font_scheme.find(qn(tag)).find(qn("a:latin")).set("typeface", typeface)
+
+
+def set_theme(prs, name: str, colors: tuple, major_font: str, minor_font: str) -> None:
+    """Write a color scheme and fonts into the first master's theme part.
+
+    Slides that use scheme colors (set_color with an MSO_THEME_COLOR) and
+    MAJOR_FONT / MINOR_FONT pick these up; see _write_theme for the arguments.
+    python-pptx loads the theme as an opaque blob, so it is replaced by an
+    XmlPart with the same name, parsed from that blob and edited, and every
+    relationship to the old part is pointed at the new one.
+    """
+    old = prs.slide_master.part.part_related_by(RT.THEME)
+    theme = parse_xml(old.blob)
+    _write_theme(theme, name, colors, major_font, minor_font)
+    part = XmlPart(old.partname, old.content_type, old.package, theme)
+    # The master and presentation.xml relate to it implicitly (no r:id in their XML)
+    for source in list(old.package.iter_parts()):
+        for rId in [rId for rId, rel in source.rels.items()
+                    if not rel.is_external and rel.target_part is old]:
+            source.drop_rel(rId)
+            source.relate_to(part, RT.THEME)
+
+
+# ---------------------------------------------------------------------------
+# Slide export / import (moving rendered slides between packages)
+# ---------------------------------------------------------------------------
+
+def export_slide(slide) -> tuple[bytes, dict[str, bytes], str]:
+    """Serialize a rendered slide to ``(slide_xml, {rId: image_blob}, layout_name)``.
+
+    The result is plain data, so it can cross a process boundary or be
+    stored on disk and later re-created with import_slide() on the layout
+    of that name.
+    """
+    part = slide.part
+    images = {
+        rId: rel.target_part.blob
+        for rId, rel in part.rels.items()
+        if rel.reltype == RT.IMAGE and not rel.is_external
+    }
+    return part.blob, images, slide.slide_layout.name
+
+
+def relate_image(part, blob: bytes, image_parts: dict | None = None,
+                 sha1: str | None = None) -> str:
+    """Relate ``part`` to the package's image part for ``blob``; return the rId.
+
+    ``image_parts`` (sha1 → ImagePart) skips python-pptx's package-wide
+    search on repeat images; pass ``sha1`` when it's already known.
+    """
+    sha1 = sha1 or hashlib.sha1(blob).hexdigest()
+    image_part = image_parts.get(sha1) if image_parts is not None else None
+    if image_part is None:
+        image_part = part.package.get_or_add_image_part(io.BytesIO(blob))
+        if image_parts is not None:
+            image_parts[sha1] = image_part
+    return part.relate_to(image_part, RT.IMAGE)
+
+
+def remap_embeds(element, rId_map: dict) -> None:
+    """Rewrite every ``r:embed`` under ``element`` through ``rId_map``."""
+    for el in element.iter():
+        old_rId = el.get(R_EMBED)
+        if old_rId is not None and old_rId in rId_map:
+            el.set(R_EMBED, rId_map[old_rId])
+
+
+def blank_layout(prs):
+    """The first master's blank layout (the first one if it has none)."""
+    for layout in prs.slide_layouts:
+        if layout._element.get("type") == "blank":
+            return layout
+    return prs.slide_layouts[0]
+
+
+def remove_unused_layouts(prs, keep=()) -> int:
+    """Drop the layouts no slide uses, except those in ``keep``; return how many."""
+    removed = 0
+    for layout in list(prs.slide_layouts):
+        if layout not in keep and not layout.used_by_slides:
+            prs.slide_layouts.remove(layout)
+            removed += 1
+    return removed
+
+
+def add_slide_layout(prs, name: str, base=None):
+    """Add a slide layout named ``name`` to the first slide master; return it.
+
+    The layout starts as a copy of ``base`` (default: the blank layout),
+    which must not relate to anything but its master.
+    """
+    master = prs.slide_master
+    base = base if base is not None else blank_layout(prs)
+    package = master.part.package
+    element = copy.deepcopy(base._element)
+    element.cSld.set("name", name)
+    element.attrib.pop("type", None)  # a custom layout, not another "blank"
+    part = SlideLayoutPart(package.next_partname("/ppt/slideLayouts/slideLayout%d.xml"),
+                           CT.PML_SLIDE_LAYOUT, package, element)
+    part.relate_to(master.part, RT.SLIDE_MASTER)
+    rId = master.part.relate_to(part, RT.SLIDE_LAYOUT)
+
+    # Master and layout ids share one range, starting at 2^31
+    ids = [int(el.get("id")) for el in prs.part._element.iter(qn("p:sldMasterId"))]
+    for m in prs.slide_masters:
+        ids += [int(el.get("id")) for el in m._element.iter(qn("p:sldLayoutId"))]
+    sldLayoutId = add_layout_id(master)
+    sldLayoutId.set("id", str(max(ids, default=2147483647) + 1))
+    sldLayoutId.set(qn("r:id"), rId)
+    return part.slide_layout
+
+
+def import_slide(prs, slide_xml: bytes, images: dict[str, bytes], layout=None,
+                 image_parts: dict | None = None):
+    """Append a slide exported with export_slide() to ``prs``.
+
+    Image relationships are re-created on the new slide and every ``r:embed``
+    is rewritten to the new rIds. Identical images share one media part:
+    pass the same ``image_parts`` dict (sha1 → ImagePart) across calls to
+    skip python-pptx's package-wide search for each picture.
+    """
+    layout = layout if layout is not None else blank_layout(prs)
+    slide = prs.slides.add_slide(layout)
+    part = slide.part
+
+    new_sld = parse_xml(slide_xml)
+    rId_map = {old_rId: relate_image(part, blob, image_parts)
+               for old_rId, blob in images.items()}
+    remap_embeds(new_sld, rId_map)
+
+    # Swap content into the existing <p:sld> so the Slide proxy stays valid
+    sld = part._element
+    for key, value in new_sld.attrib.items():
+        sld.set(key, value)
+    sld[:] = list(new_sld)
+    return slide
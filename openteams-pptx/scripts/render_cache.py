@@ -0,0 +1,251 @@
+# Authored by Amelia Thurdekoos
+# Email: ameliathurdekoos@gmail.com
+#
+# Any cares, concerns, compliments, or enhancements are always welcome!
+
+"""
+Content-addressed on-disk cache of rendered slides.
+
+Many decks repeat the same cover, closing, team and case-study slides. The
+cache stores each rendered slide under the same content hash that
+--incremental uses (slide spec + theme/brand + renderer code, see
+incremental.slide_key), so any deck, worker process or CI node pointed at
+the same directory can reuse it:
+
+  <dir>/slides/ab/<key>.json    slide XML + {rId: media sha1} + layout name
+  <dir>/media/cd/<sha1>         image blobs, stored once
+  <dir>/.lock                   held while evicting or updating .written
+  <dir>/.written                bytes stored by all processes since the last eviction
+
+Files are written to a temp file and renamed into place, so readers never
+see a partial entry. Reads touch the file's mtime; when the cache grows
+past ``max_bytes`` the least recently used files are deleted. An entry
+whose media was evicted is simply a miss.
+
+The size cap holds across processes: each one adds what it stored to the
+shared .written tally (in small steps, under the lock), and whichever
+process takes the tally past the slack evicts for everyone. The cache can
+overshoot ``max_bytes`` by at most one step per process writing to it.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: eviction runs unlocked, which is still safe
+    fcntl = None
+
+log = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 512 << 20
+# After eviction the cache is trimmed to this fraction of max_bytes, so a
+# full cache doesn't rescan the directory on every store.
+_LOW_WATER = 0.9
+# A process reports its writes to the shared tally once they reach this
+# fraction of the slack (max_bytes * (1 - _LOW_WATER))
+_TALLY_STEP = 1 / 16
+_STALE_TMP_SECONDS = 3600
+
+
+class RenderCache:
+    """Shared slide cache in ``directory``, capped at ``max_bytes``.
+
+    Picklable, so it can be handed to pool initializers; each process then
+    keeps its own hit/miss counters.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = os.path.abspath(directory)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self._since_evict = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses,
+                "stores": self.stores, "evictions": self.evictions}
+
+    def add_stats(self, stats: Dict[str, int]) -> None:
+        """Fold in counters reported by another process using the same cache."""
+        for name, value in stats.items():
+            setattr(self, name, getattr(self, name) + value)
+
+    # --- paths ---
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.directory, "slides", key[:2], f"{key}.json")
+
+    def _media_path(self, sha1: str) -> str:
+        return os.path.join(self.directory, "media", sha1[:2], sha1)
+
+    @staticmethod
+    def _read(path: str) -> bytes:
+        with open(path, "rb") as f:
+            data = f.read()
+        os.utime(path)  # mark as recently used
+        return data
+
+    def _write_atomic(self, path: str, data: bytes) -> None:
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+        self._since_evict += len(data)
+
+    # --- lookup / store ---
+
+    def get(self, key: str) -> Optional[Tuple[bytes, Dict[str, bytes], Optional[str]]]:
+        """Return ``(slide_xml, {rId: image_blob}, layout_name)`` for ``key``, or None."""
+        try:
+            entry = json.loads(self._read(self._entry_path(key)))
+            images = {rId: self._read(self._media_path(sha1))
+                      for rId, sha1 in entry["images"].items()}
+        except (OSError, ValueError, KeyError):
+            # Missing, evicted mid-read or corrupt: render it again
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry["xml"].encode("utf-8"), images, entry.get("layout")
+
+    def put(self, key: str, slide_xml: bytes, images: Dict[str, bytes],
+            layout: Optional[str] = None) -> None:
+        """Store a rendered slide (as returned by pptx_helpers.export_slide)."""
+        refs = {}
+        try:
+            for rId, blob in images.items():
+                sha1 = hashlib.sha1(blob).hexdigest()
+                path = self._media_path(sha1)
+                if not os.path.exists(path):
+                    self._write_atomic(path, blob)
+                refs[rId] = sha1
+            entry = json.dumps({"xml": slide_xml.decode("utf-8"), "images": refs,
+                                "layout": layout})
+            self._write_atomic(self._entry_path(key), entry.encode("utf-8"))
+        except OSError as e:
+            # A full or read-only cache must never fail the render
+            log.warning("Render cache write failed: %s", e)
+            return
+        self.stores += 1
+        if self._since_evict > self.max_bytes * (1 - _LOW_WATER) * _TALLY_STEP:
+            self._report_written()
+
+    # --- eviction ---
+
+    def _scan(self):
+        now = time.time()
+        files = []
+        for sub in ("slides", "media"):
+            for root, _dirs, names in os.walk(os.path.join(self.directory, sub)):
+                for name in names:
+                    path = os.path.join(root, name)
+                    try:
+                        st = os.stat(path)
+                    except OSError:
+                        continue
+                    if name.startswith(".tmp-"):
+                        # Left behind by a killed writer
+                        if now - st.st_mtime > _STALE_TMP_SECONDS:
+                            _unlink_quietly(path)
+                        continue
+                    files.append((st.st_mtime, st.st_size, path))
+        return files
+
+    @contextmanager
+    def _locked(self, blocking: bool):
+        """Hold the directory's lock; yields False if ``blocking`` is off and
+        another process has it."""
+        os.makedirs(self.directory, exist_ok=True)
+        with open(os.path.join(self.directory, ".lock"), "a") as lock:
+            held = True
+            if fcntl is not None:
+                try:
+                    fcntl.flock(lock, fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+                except BlockingIOError:
+                    held = False
+            yield held
+
+    def _tally(self):
+        """Open the shared .written tally for update (lock held)."""
+        fd = os.open(os.path.join(self.directory, ".written"), os.O_RDWR | os.O_CREAT, 0o644)
+        return os.fdopen(fd, "r+")
+
+    @staticmethod
+    def _set_tally(f, written: int) -> None:
+        # Fixed width, rewritten in place: truncating the file can force a
+        # flush to disk on some filesystems, which would cost more than the store
+        f.seek(0)
+        f.write(f"{written:020d}")
+
+    def _report_written(self) -> None:
+        """Add this process's writes to the shared tally; evict once every
+        process together has stored more than the slack."""
+        written, self._since_evict = self._since_evict, 0
+        try:
+            with self._locked(blocking=True), self._tally() as f:
+                try:
+                    written += int(f.read() or 0)
+                except ValueError:
+                    pass
+                if written > self.max_bytes * (1 - _LOW_WATER):
+                    self._evict_locked()
+                    written = 0
+                self._set_tally(f, written)
+        except OSError as e:
+            log.warning("Render cache size tally failed: %s", e)
+
+    def evict(self) -> int:
+        """Delete least recently used files until under the size cap.
+
+        Only one process evicts at a time; if another holds the lock this
+        returns straight away. Returns the number of files removed.
+        """
+        self._since_evict = 0
+        with self._locked(blocking=False) as held:
+            if not held:
+                return 0
+            removed = self._evict_locked()
+            with self._tally() as f:
+                self._set_tally(f, 0)
+        return removed
+
+    def _evict_locked(self) -> int:
+        files = self._scan()
+        total = sum(size for _mtime, size, _path in files)
+        if total <= self.max_bytes:
+            return 0
+        target = self.max_bytes * _LOW_WATER
+        removed = 0
+        for _mtime, size, path in sorted(files):
+            if total <= target:
+                break
+            if _unlink_quietly(path):
+                total -= size
+                removed += 1
+        self.evictions += removed
+        log.debug("Render cache: evicted %d files, %d bytes left", removed, total)
+        return removed
+
+
+def _unlink_quietly(path: str) -> bool:
+    try:
+        os.unlink(path)
+        return True
+    except OSError:
+        return False
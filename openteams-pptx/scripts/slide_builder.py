@@ -6,33 +6,183 @@
 """
 SlideBuilder — high-level helpers for building branded slides.
 Extracted from slide_renderers.py for maintainability.
+
+Shared chrome (backgrounds, logos, accent bars, footers) lives in branded
+slide layouts: slide_renderers registers one build function per slide-type
+family with @slide_layout, SlideBuilder.layout() adds that layout to the
+deck's master on first use, and slides only carry their own content.
+
+Brand colors and the headline/body fonts are written as references to the
+theme's color and font schemes (ThemeConfig.color_ref, MAJOR_FONT /
+MINOR_FONT), which new_presentation fills in from the brand. Helpers match
+every color they are given against the palette, so a hex equal to a brand
+color becomes that scheme slot. The one exception is a spec's section
+bg_color, which add_section_header keeps literal (ThemeConfig.rgb).
 """
 from __future__ import annotations
 
+import copy
 import datetime
+import hashlib
+import io
 import os
-from typing import List, Optional
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
 
 from pptx import Presentation
 from pptx.util import Inches, Pt, Emu
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN
 from pptx.enum.shapes import MSO_SHAPE
+from pptx.oxml.ns import qn
 from lxml import etree
 
 from pptx_helpers import (
-    hex_to_rgbcolor, luminance, contrast_ratio, auto_text_color,
+    luminance, contrast_ratio, auto_text_color,
     set_shape_fill, set_shape_rounded_rect_radius, set_no_border,
     add_slide_bg_color, make_gradient_rect, set_shape_alpha, get_spPr,
+    import_slide, relate_image, remap_embeds, add_slide_layout, blank_layout,
+    paragraph_template, run_template, list_style, fill_text_frame, fill_run_list,
+    set_color, MAJOR_FONT, MINOR_FONT, P_NS, R_EMBED,
 )
+from pptx_compat import next_shape_id, set_background
 from brand_engine import ThemeConfig
+from tracing import traced
 
 _CURRENT_YEAR = datetime.date.today().year
+_SHAPE_TAGS = tuple(qn(f"p:{t}") for t in ("sp", "pic", "grpSp", "graphicFrame", "cxnSp"))
+_PIC_TAG = qn("p:pic")
+
+
+_CNVPR_TAGS = {f"{{{P_NS}}}cNvPr"}
+
+
+@dataclass
+class _LayoutChrome:
+    """A branded layout's decoration, built once per theme and deep-copied
+    into each deck's layout."""
+    bg: Optional[etree._Element] = None                 # <p:bg> if the chrome sets it
+    shapes: List[etree._Element] = field(default_factory=list)
+    images: Dict[str, tuple] = field(default_factory=dict)  # rId -> (blob, sha1)
+
+
+@dataclass
+class _MediaAsset:
+    """An image file read once: bytes and pixel size."""
+    blob: bytes
+    px_size: tuple
+
+
+@dataclass
+class _ThemeAssets:
+    """Per-theme caches shared by every SlideBuilder (and every deck in a batch)."""
+    layouts: Dict[str, _LayoutChrome] = field(default_factory=dict)  # layout name -> its chrome
+    media: Dict[str, Optional[_MediaAsset]] = field(default_factory=dict)
+    scratch: Optional["SlideBuilder"] = None    # where layout chrome gets built
+
+
+# incremental.theme_key -> _ThemeAssets. Keyed on the theme's values, so a
+# ThemeConfig rebuilt from the same brand.json reuses them; bounded, since
+# each entry holds a scratch presentation.
+_THEME_ASSETS: Dict[str, _ThemeAssets] = {}
+_MAX_THEME_ASSETS = 4
+_SCRATCH_LOCK = threading.Lock()
+
+
+def _theme_assets(theme: ThemeConfig) -> _ThemeAssets:
+    from incremental import theme_key
+
+    key = theme_key(theme)
+    assets = _THEME_ASSETS.get(key)
+    if assets is None:
+        if len(_THEME_ASSETS) >= _MAX_THEME_ASSETS:
+            del _THEME_ASSETS[next(iter(_THEME_ASSETS))]  # oldest
+        assets = _THEME_ASSETS[key] = _ThemeAssets()
+    return assets
+
+
+def default_text_style(theme: ThemeConfig) -> tuple:
+    """``(size_pt, color, font)`` of the deck's default text: the body role.
+
+    new_presentation writes it into the package (set_default_text_style);
+    text boxes then only state how their role differs from it.
+    """
+    return theme.body_size, theme.color_ref(theme.gray), MINOR_FONT
+
+
+# ---------------------------------------------------------------------------
+# Branded slide layouts
+# ---------------------------------------------------------------------------
+
+def _record_chrome(slide, build: Callable) -> _LayoutChrome:
+    """Run ``build(slide)`` and capture the background and shapes it added."""
+    cSld = slide._element.cSld
+    spTree = cSld.spTree
+    bg_before = etree.tostring(cSld.bg) if cSld.bg is not None else None
+    n_before = len(spTree)
 
-try:
-    from PIL import Image
-except ImportError:
-    Image = None
+    build(slide)
+
+    chrome = _LayoutChrome()
+    if cSld.bg is not None and etree.tostring(cSld.bg) != bg_before:
+        chrome.bg = copy.deepcopy(cSld.bg)
+    rels = slide.part.rels
+    for el in spTree[n_before:]:
+        chrome.shapes.append(copy.deepcopy(el))
+        for node in el.iter():
+            rId = node.get(R_EMBED)
+            if rId is not None and rId not in chrome.images:
+                blob = rels[rId].target_part.blob
+                chrome.images[rId] = (blob, hashlib.sha1(blob).hexdigest())
+    return chrome
+
+
+def _clone_chrome(layout, chrome: _LayoutChrome, image_parts: dict) -> None:
+    """Deep-copy recorded chrome into a slide layout with fresh shape ids and rIds."""
+    cSld = layout._element.cSld
+    if chrome.bg is not None:
+        set_background(cSld, copy.deepcopy(chrome.bg))
+    if not chrome.shapes:
+        return
+
+    rId_map = {rId: relate_image(layout.part, blob, image_parts, sha1)
+               for rId, (blob, sha1) in chrome.images.items()}
+    spTree = cSld.spTree
+    next_id = next_shape_id(layout.shapes)
+    for proto in chrome.shapes:
+        el = copy.deepcopy(proto)
+        for cNvPr in el.iter(*_CNVPR_TAGS):
+            # python-pptx names shapes "<Kind> <id - 1>"; keep that in step
+            old_id = int(cNvPr.get("id"))
+            cNvPr.set("id", str(next_id))
+            cNvPr.set("name", re.sub(rf" {old_id - 1}$", f" {next_id - 1}", cNvPr.get("name", "")))
+            next_id += 1
+        remap_embeds(el, rId_map)
+        spTree.append(el)
+
+
+# Layout name -> build(sb, slide) drawing its chrome; filled by slide_renderers
+LAYOUT_BUILDERS: Dict[str, Callable] = {}
+
+
+def slide_layout(name: str):
+    """Decorator registering ``build(sb, slide)`` as the chrome of layout ``name``.
+
+    ``build`` must not depend on slide data: it runs once per theme, on a
+    scratch slide, and the result is copied into each deck's layout.
+    """
+    def register(build: Callable) -> Callable:
+        LAYOUT_BUILDERS[name] = build
+        return build
+    return register
+
+
+def _layout_builder(name: str) -> Optional[Callable]:
+    if name not in LAYOUT_BUILDERS:
+        import slide_renderers  # noqa: F401 — registers the branded layouts
+    return LAYOUT_BUILDERS.get(name)
 
 
 class SlideBuilder:
@@ -46,127 +196,187 @@ class SlideBuilder:
         self.theme = theme
         self.c = theme  # color shortcuts via theme
         self.t = theme  # typography shortcuts via theme
-        self.W = Inches(theme.slide_width_inches)
-        self.H = Inches(theme.slide_height_inches)
-        self.M = Inches(theme.margin_inches)
-        self.G = Inches(theme.gutter_inches)
+        self.W = theme.slide_width_emu
+        self.H = theme.slide_height_emu
+        self.M = theme.margin_emu
+        self.G = theme.gutter_emu
         self.ACCENT_ROTATION = [
             theme.day_blue, theme.night_navy, theme.yellow, theme.salmon,
         ]
-
-    def new_slide(self):
-        """Add a blank slide."""
-        layout = self.prs.slide_layouts[6]  # blank layout
-        return self.prs.slides.add_slide(layout)
+        self._image_parts = {}  # sha1 -> ImagePart in this deck
+        self._layouts = {}      # layout name -> SlideLayout in this deck
+        self._text_defaults = default_text_style(theme)
+        self._assets = _theme_assets(theme)
+
+    @traced
+    def new_slide(self, layout: Optional[str] = None):
+        """Add a slide on the branded layout ``layout`` (see slide_layout),
+        or on the plain blank layout."""
+        return self.prs.slides.add_slide(self.layout(layout))
+
+    def layout(self, name: Optional[str]):
+        """This deck's SlideLayout ``name``, added to the master on first use.
+
+        Its chrome is built once per theme on a scratch presentation and
+        then copied into every deck. None (or a name that isn't a branded
+        layout) is the plain blank layout.
+        """
+        layout = self._layouts.get(name)
+        if layout is not None:
+            return layout
+        build = _layout_builder(name) if name else None
+        if build is None:
+            blank = self._layouts.get(None)
+            if blank is None:
+                blank = self._layouts[None] = blank_layout(self.prs)
+            return blank
+        chrome = self._assets.layouts.get(name)
+        if chrome is None:
+            # Own package, so the scratch slides' images stay out of this deck.
+            # Decks rendering in other threads share it, hence the lock.
+            with _SCRATCH_LOCK:
+                chrome = self._assets.layouts.get(name)
+                if chrome is None:
+                    scratch = self._assets.scratch
+                    if scratch is None:
+                        scratch = self._assets.scratch = SlideBuilder(Presentation(), self.theme)
+                    chrome = self._assets.layouts[name] = _record_chrome(
+                        scratch.new_slide(), lambda s: build(scratch, s))
+        layout = self._layouts[name] = add_slide_layout(self.prs, name)
+        _clone_chrome(layout, chrome, self._image_parts)
+        return layout
+
+    @traced
+    def add_exported_slide(self, slide_xml: bytes, images: dict, layout: Optional[str] = None):
+        """Add a previously rendered slide (pptx_helpers.export_slide format)."""
+        return import_slide(self.prs, slide_xml, images, layout=self.layout(layout),
+                            image_parts=self._image_parts)
+
+    @staticmethod
+    def shape_counts(slide) -> tuple:
+        """``(shapes, pictures)`` at the top level of ``slide``'s shape tree."""
+        shapes = pictures = 0
+        for el in slide.shapes._spTree.iterchildren(*_SHAPE_TAGS):
+            shapes += 1
+            if el.tag == _PIC_TAG:
+                pictures += 1
+        return shapes, pictures
+
+    # --- Media ---
+
+    def media_asset(self, path: str) -> Optional[_MediaAsset]:
+        """Read an image file once per theme; None if it doesn't exist."""
+        media = self._assets.media
+        if path not in media:
+            asset = None
+            if path and os.path.exists(path):
+                with open(path, "rb") as f:
+                    blob = f.read()
+                try:
+                    from PIL import Image  # imported on first use, not at module load
+                except ImportError:
+                    px_size = (1841, 483)
+                else:
+                    with Image.open(io.BytesIO(blob)) as im:
+                        px_size = im.size
+                asset = _MediaAsset(blob, px_size)
+            media[path] = asset
+        return media[path]
+
+    @traced
+    def add_image(self, slide, path: str, x, y, w=None, h=None):
+        """add_picture() for a brand asset read once per theme (see media_asset).
+
+        python-pptx matches the bytes to an existing image part by SHA1, so
+        repeat pictures share one part.
+        """
+        asset = self.media_asset(path)
+        if asset is None:
+            return None
+        return slide.shapes.add_picture(io.BytesIO(asset.blob), x, y, w, h)
 
     # --- Text helpers ---
 
+    @traced
     def add_title(self, slide, text: str, x=None, y=None, w=None, h=None,
                   font_size=None, color=None, bold=True, align=PP_ALIGN.LEFT):
         x = x if x is not None else self.M
         y = y if y is not None else self.M
-        w = w if w is not None else (self.W - 2 * self.M)
+        w = w if w is not None else self.theme.content_width_emu
         h = h if h is not None else Inches(1.0)
         font_size = font_size or self.theme.h1_size
         color = color or self.theme.night_navy
 
         txBox = slide.shapes.add_textbox(x, y, w, h)
-        tf = txBox.text_frame
-        tf.word_wrap = True
-        p = tf.paragraphs[0]
-        p.text = text
-        p.font.size = Pt(font_size)
-        p.font.bold = bold
-        p.font.color.rgb = hex_to_rgbcolor(color)
-        p.font.name = self.theme.headline_font
-        p.alignment = align
+        fill_text_frame(txBox, [text], paragraph_template(), self._list_style(
+            font_size, bold, color, MAJOR_FONT, align))
         return txBox
 
+    @traced
     def add_subtitle(self, slide, text: str, x=None, y=None, w=None, h=None,
                      font_size=None, color=None):
         x = x if x is not None else self.M
         y = y if y is not None else Inches(1.6)
-        w = w if w is not None else (self.W - 2 * self.M)
+        w = w if w is not None else self.theme.content_width_emu
         h = h if h is not None else Inches(0.8)
         font_size = font_size or self.theme.h3_size
         color = color or self.theme.day_blue
 
         txBox = slide.shapes.add_textbox(x, y, w, h)
-        tf = txBox.text_frame
-        tf.word_wrap = True
-        p = tf.paragraphs[0]
-        p.text = text
-        p.font.size = Pt(font_size)
-        p.font.bold = False
-        p.font.color.rgb = hex_to_rgbcolor(color)
-        p.font.name = self.theme.body_font
-        p.alignment = PP_ALIGN.LEFT
+        fill_text_frame(txBox, [text], paragraph_template(), self._list_style(
+            font_size, False, color, MINOR_FONT, PP_ALIGN.LEFT))
         return txBox
 
+    @traced
     def add_body(self, slide, text: str, x=None, y=None, w=None, h=None,
                  font_size=None, color=None, bold=False, align=PP_ALIGN.LEFT,
                  line_spacing=1.4):
         x = x if x is not None else self.M
         y = y if y is not None else Inches(2.5)
-        w = w if w is not None else (self.W - 2 * self.M)
+        w = w if w is not None else self.theme.content_width_emu
         h = h if h is not None else Inches(3.0)
         font_size = font_size or self.theme.body_size
         color = color or self.theme.gray
 
         txBox = slide.shapes.add_textbox(x, y, w, h)
-        tf = txBox.text_frame
-        tf.word_wrap = True
-
-        for i, line in enumerate(text.split("\n")):
-            if i == 0:
-                p = tf.paragraphs[0]
-            else:
-                p = tf.add_paragraph()
-            p.text = line
-            p.font.size = Pt(font_size)
-            p.font.bold = bold
-            p.font.color.rgb = hex_to_rgbcolor(color)
-            p.font.name = self.theme.body_font
-            p.alignment = align
-            p.space_after = Pt(font_size * (line_spacing - 1))
+        fill_text_frame(txBox, text.split("\n"), paragraph_template(), self._list_style(
+            font_size, bold, color, MINOR_FONT, align, font_size * (line_spacing - 1)))
         return txBox
 
+    @traced
     def add_bullet_list(self, slide, items: List[str], x=None, y=None, w=None, h=None,
                         font_size=None, color=None, bullet_color=None):
         x = x if x is not None else self.M
         y = y if y is not None else Inches(2.5)
-        w = w if w is not None else (self.W - 2 * self.M)
+        w = w if w is not None else self.theme.content_width_emu
         h = h if h is not None else Inches(3.5)
         font_size = font_size or self.theme.body_size
         color = color or self.theme.gray
         bullet_color = bullet_color or self.theme.day_blue
 
         txBox = slide.shapes.add_textbox(x, y, w, h)
-        tf = txBox.text_frame
-        tf.word_wrap = True
-
-        for i, item in enumerate(items):
-            if i == 0:
-                p = tf.paragraphs[0]
-            else:
-                p = tf.add_paragraph()
-            run_bullet = p.add_run()
-            run_bullet.text = "●  "
-            run_bullet.font.size = Pt(font_size - 2)
-            run_bullet.font.color.rgb = hex_to_rgbcolor(bullet_color)
-            run_bullet.font.name = self.theme.body_font
-
-            run_text = p.add_run()
-            run_text.text = item
-            run_text.font.size = Pt(font_size)
-            run_text.font.color.rgb = hex_to_rgbcolor(color)
-            run_text.font.name = self.theme.body_font
-
-            p.space_after = Pt(8)
+        # The list style is the item text; the bullet glyph run deviates from it
+        bullet_ref = self.theme.color_ref(bullet_color)
+        bullet = run_template(font_size - 2,
+                              None if bullet_ref == self.theme.color_ref(color) else bullet_ref)
+        fill_run_list(txBox, [[(bullet, "●  "), (run_template(), item)] for item in items],
+                      paragraph_template(), self._list_style(
+                          font_size, None, color, MINOR_FONT, None, 8))
         return txBox
 
+    def _list_style(self, size_pt, bold, color, font, align, space_after_pt=None):
+        """list_style for a text box, minus what the default text style already says."""
+        size, color_ref, default_font = self._text_defaults
+        color = self.theme.color_ref(color)
+        return list_style(None if size_pt == size else size_pt, bold or None,
+                          None if color == color_ref else color,
+                          None if font == default_font else font,
+                          None if align == PP_ALIGN.LEFT else align,
+                          space_after_pt or None)
+
     # --- Logo helper ---
 
+    @traced
     def add_logo(self, slide, variant: str = "colored", position: str = "upper-left",
                  max_width_inches: float = 2.0, max_height_inches: float = 0.6):
         allowed = self.theme.brand.logo_rules.get("allowed_placements",
@@ -181,14 +391,11 @@ class SlideBuilder:
             "favicon": self.theme.favicon_colored,
         }
         logo_path = logo_map.get(variant, "")
-        if not logo_path or not os.path.exists(logo_path):
+        asset = self.media_asset(logo_path)
+        if asset is None:
             return None
 
-        if Image:
-            with Image.open(logo_path) as im:
-                nat_w, nat_h = im.size
-        else:
-            nat_w, nat_h = 1841, 483
+        nat_w, nat_h = asset.px_size
 
         aspect = nat_w / nat_h
         w = Inches(max_width_inches)
@@ -214,27 +421,26 @@ class SlideBuilder:
         else:
             x, y = M, M * 0.6
 
-        pic = slide.shapes.add_picture(logo_path, int(x), int(y), int(w), int(h))
-        return pic
+        return self.add_image(slide, logo_path, int(x), int(y), int(w), int(h))
 
     # --- Decorative elements ---
 
     def add_accent_bar(self, slide, x, y, w, h, color=None):
         color = color or self.theme.day_blue
         shape = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, x, y, w, h)
-        set_shape_fill(shape, color)
+        set_shape_fill(shape, self.theme.color_ref(color))
         set_no_border(shape)
         return shape
 
+    @traced
     def add_card(self, slide, x, y, w, h, fill_color="#FFFFFF",
                  border_color=None, shadow=True):
         shape = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, x, y, w, h)
-        set_shape_fill(shape, fill_color)
-        radius_emu = Pt(self.theme.card_radius_pt)
-        set_shape_rounded_rect_radius(shape, radius_emu)
+        set_shape_fill(shape, self.theme.color_ref(fill_color))
+        set_shape_rounded_rect_radius(shape, self.theme.card_radius_emu)
 
         if border_color:
-            shape.line.color.rgb = hex_to_rgbcolor(border_color)
+            set_color(shape.line.color, self.theme.color_ref(border_color))
             shape.line.width = Pt(1)
         else:
             set_no_border(shape)
@@ -255,6 +461,7 @@ class SlideBuilder:
                 alpha.set('val', f'{self.theme.card_shadow_alpha * 1000}')
         return shape
 
+    @traced
     def add_button(self, slide, text: str, x, y, w=None, h=None,
                    fill_color=None, text_color=None):
         fill_color = fill_color or self.theme.button_fill_color
@@ -263,7 +470,7 @@ class SlideBuilder:
         h = h or Inches(0.55)
 
         shape = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, x, y, w, h)
-        set_shape_fill(shape, fill_color)
+        set_shape_fill(shape, self.theme.color_ref(fill_color))
         set_no_border(shape)
         set_shape_rounded_rect_radius(shape, int(h / 2))
 
@@ -273,8 +480,7 @@ class SlideBuilder:
         p.text = text
         p.font.size = Pt(13)
         p.font.bold = True
-        p.font.color.rgb = hex_to_rgbcolor(text_color)
-        p.font.name = self.theme.body_font
+        set_color(p.font.color, self.theme.color_ref(text_color))
         p.alignment = PP_ALIGN.CENTER
         p.space_before = Pt(0)
         p.space_after = Pt(0)
@@ -283,6 +489,7 @@ class SlideBuilder:
             txBody.set('anchor', 'ctr')
         return shape
 
+    @traced
     def add_placeholder_image(self, slide, x, y, w, h, label="Image",
                               fill_color=None):
         fill_color = fill_color or "#E8EDFB"
@@ -292,7 +499,7 @@ class SlideBuilder:
         p = tf.paragraphs[0]
         p.text = f"[ {label} ]"
         p.font.size = Pt(12)
-        p.font.color.rgb = hex_to_rgbcolor(self.theme.day_blue)
+        set_color(p.font.color, self.theme.color_ref(self.theme.day_blue))
         p.font.name = self.theme.utility_font
         p.alignment = PP_ALIGN.CENTER
         txBody = shape._element.find('.//{http://schemas.openxmlformats.org/drawingml/2006/main}bodyPr')
@@ -300,14 +507,15 @@ class SlideBuilder:
             txBody.set('anchor', 'ctr')
         return shape
 
+    @traced
     def add_footer(self, slide, text: str = f"© {_CURRENT_YEAR} OpenTeams  |  openteams.com",
                    show_logo: bool = True, bg_color: str = None):
-        footer_h = Inches(0.5)
+        footer_h = self.theme.footer_h_emu
         y = self.H - footer_h
 
         if bg_color:
             bar = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, 0, y, self.W, footer_h)
-            set_shape_fill(bar, bg_color)
+            set_shape_fill(bar, self.theme.color_ref(bg_color))
             set_no_border(bar)
 
         text_color = auto_text_color(bg_color or "#FFFFFF")
@@ -316,28 +524,35 @@ class SlideBuilder:
         tf = txBox.text_frame
         p = tf.paragraphs[0]
         p.text = text
-        p.font.size = Pt(self.theme.caption_size)
-        p.font.color.rgb = hex_to_rgbcolor(text_color)
+        p.font.size = self.theme.caption_emu
+        set_color(p.font.color, self.theme.color_ref(text_color))
         p.font.name = self.theme.utility_font
         p.alignment = PP_ALIGN.LEFT
 
         if show_logo and self.theme.favicon_colored and os.path.exists(self.theme.favicon_colored):
             icon_size = Inches(0.3)
-            slide.shapes.add_picture(
-                self.theme.favicon_colored,
+            self.add_image(
+                slide, self.theme.favicon_colored,
                 int(self.W - self.M - icon_size),
                 int(y + (footer_h - icon_size) / 2),
                 int(icon_size), int(icon_size)
             )
 
+    @traced
     def add_section_header(self, slide, title: str, subtitle: str = "",
                            bg_color: str = None):
-        bg_color = bg_color or self.theme.night_navy
-        add_slide_bg_color(slide, bg_color)
+        # A spec's bg_color is an explicit override: keep it literal, so a
+        # re-themed deck doesn't recolor it. The default follows the scheme.
+        if bg_color:
+            add_slide_bg_color(slide, self.theme.rgb(bg_color))
+        else:
+            bg_color = self.theme.night_navy
+            add_slide_bg_color(slide, self.theme.color_ref(bg_color))
         text_color = auto_text_color(bg_color)
 
-        self.add_accent_bar(slide, self.M, Inches(2.8), Inches(0.8), Inches(0.06),
-                           color=self.theme.day_blue if bg_color != self.theme.day_blue else self.theme.yellow)
+        self.add_accent_bar(slide, self.M, Inches(2.8),
+                            self.theme.accent_bar_w_emu, self.theme.accent_bar_h_emu,
+                            color=self.theme.day_blue if bg_color != self.theme.day_blue else self.theme.yellow)
 
         self.add_title(slide, title, y=Inches(3.0), font_size=self.theme.h1_size,
                       color=text_color)
@@ -349,35 +564,22 @@ class SlideBuilder:
             self.add_body(slide, subtitle, y=Inches(4.2), font_size=self.theme.h3_size,
                          color=sub_color)
 
+    @traced
     def add_metric_card(self, slide, x, y, w, h, value: str, label: str,
                         accent_color: str = None):
         accent_color = accent_color or self.theme.day_blue
         self.add_card(slide, x, y, w, h)
 
-        bar_h = Inches(0.06)
-        bar = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, x, y, w, bar_h)
-        set_shape_fill(bar, accent_color)
+        bar = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, x, y, w, self.theme.accent_bar_h_emu)
+        set_shape_fill(bar, self.theme.color_ref(accent_color))
         set_no_border(bar)
 
         val_box = slide.shapes.add_textbox(x + Inches(0.2), y + Inches(0.3),
                                             w - Inches(0.4), Inches(0.8))
-        tf = val_box.text_frame
-        tf.word_wrap = True
-        p = tf.paragraphs[0]
-        p.text = value
-        p.font.size = Pt(36)
-        p.font.bold = True
-        p.font.color.rgb = hex_to_rgbcolor(self.theme.night_navy)
-        p.font.name = self.theme.headline_font
-        p.alignment = PP_ALIGN.LEFT
+        fill_text_frame(val_box, [value], paragraph_template(), self._list_style(
+            36, True, self.theme.night_navy, MAJOR_FONT, PP_ALIGN.LEFT))
 
         lbl_box = slide.shapes.add_textbox(x + Inches(0.2), y + Inches(1.0),
                                             w - Inches(0.4), Inches(0.5))
-        tf2 = lbl_box.text_frame
-        tf2.word_wrap = True
-        p2 = tf2.paragraphs[0]
-        p2.text = label
-        p2.font.size = Pt(12)
-        p2.font.color.rgb = hex_to_rgbcolor(self.theme.gray)
-        p2.font.name = self.theme.body_font
-        p2.alignment = PP_ALIGN.LEFT
+        fill_text_frame(lbl_box, [label], paragraph_template(), self._list_style(
+            12, None, self.theme.gray, MINOR_FONT, PP_ALIGN.LEFT))
@@ -0,0 +1,378 @@
+# Authored by Amelia Thurdekoos
+# Email: ameliathurdekoos@gmail.com
+#
+# Any cares, concerns, compliments, or enhancements are always welcome!
+
+"""
+Typed slide models and the spec schema.
+
+Every slide type is a frozen, slotted dataclass whose fields are the spec
+keys its renderer reads, with the renderer's defaults. From these models
+the module builds, once at import:
+
+  - a converter per type that checks a raw slide dict and returns the model
+    (parse_spec / parse_slide collect *every* error instead of stopping at
+    the first), and
+  - a JSON Schema for the whole spec (spec_schema(), or
+    ``generate_deck.py --schema``) for editors and other tools.
+
+Renderers receive the models, so a string where a list belongs or a number
+where text belongs is reported up front instead of failing mid-render.
+Keys a model doesn't know are ignored. Standard library only, so
+--validate-only doesn't import the renderer stack.
+"""
+from __future__ import annotations
+
+import typing
+from dataclasses import dataclass, fields, MISSING
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, Union
+
+_SCHEMA_URI = "https://json-schema.org/draft/2020-12/schema"
+
+
+# ---------------------------------------------------------------------------
+# Models
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True, slots=True)
+class Metric:
+    value: str = "—"
+    label: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class TeamMember:
+    name: Optional[str] = None          # None = "Team Member <n>"
+    role: str = "Role / Title"
+    bio: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class CoverSlide:
+    type: ClassVar[str] = "cover"
+    REQUIRED: ClassVar[Tuple[str, ...]] = ("title",)
+    title: str = "Presentation Title"
+    subtitle: str = ""
+    date: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class SectionDividerSlide:
+    type: ClassVar[str] = "section_divider"
+    REQUIRED: ClassVar[Tuple[str, ...]] = ("title",)
+    title: str = "Section Title"
+    subtitle: str = ""
+    bg_color: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class AgendaSlide:
+    type: ClassVar[str] = "agenda"
+    REQUIRED: ClassVar[Tuple[str, ...]] = ("items",)
+    items: Tuple[str, ...] = ("Topic 1", "Topic 2", "Topic 3")
+
+
+@dataclass(frozen=True, slots=True)
+class ContentSlide:
+    type: ClassVar[str] = "content"
+    REQUIRED: ClassVar[Tuple[str, ...]] = ("title",)
+    title: str = "Content Slide Title"
+    body: str = ""
+    bullet_items: Tuple[str, ...] = ()
+    image_placeholder: str = "Visual / Image"
+
+
+@dataclass(frozen=True, slots=True)
+class TwoColumnSlide:
+    type: ClassVar[str] = "two_column"
+    REQUIRED: ClassVar[Tuple[str, ...]] = ("title", "left_title", "right_title")
+    title: str = "Two-Column Layout"
+    left_title: str = "Left Column"
+    left_body: str = ""
+    right_title: str = "Right Column"
+    right_body: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class QuoteSlide:
+    type: ClassVar[str] = "quote"
+    REQUIRED: ClassVar[Tuple[str, ...]] = ("text",)
+    text: str = "A bold statement that captures\nyour key message in one line."
+    attribution: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class MetricsSlide:
+    type: ClassVar[str] = "metrics"
+    REQUIRED: ClassVar[Tuple[str, ...]] = ("title", "metrics")
+    title: str = "Key Metrics"
+    metrics: Tuple[Metric, ...] = (Metric("98%", "Metric 1"), Metric("3.5x", "Metric 2"),
+                                   Metric("500+", "Metric 3"), Metric("24/7", "Metric 4"))
+
+
+@dataclass(frozen=True, slots=True)
+class TeamSlide:
+    type: ClassVar[str] = "team"
+    REQUIRED: ClassVar[Tuple[str, ...]] = ("title", "members")
+    title: str = "Our Team"
+    members: Tuple[TeamMember, ...] = tuple(
+        TeamMember(f"Team Member {i + 1}", "Role / Title", "Brief bio.") for i in range(4))
+
+
+@dataclass(frozen=True, slots=True)
+class CaseStudySlide:
+    type: ClassVar[str] = "case_study"
+    REQUIRED: ClassVar[Tuple[str, ...]] = ("title", "challenge", "solution", "results")
+    title: str = "Case Study: Client Name"
+    challenge: str = "Describe the challenge."
+    solution: str = "Describe the solution."
+    results: str = "Describe the results."
+
+
+@dataclass(frozen=True, slots=True)
+class ClosingSlide:
+    type: ClassVar[str] = "closing"
+    REQUIRED: ClassVar[Tuple[str, ...]] = ("title",)
+    title: str = "Thank You"
+    subtitle: str = "Questions? Let's discuss."
+    cta_text: str = "Contact Us"
+    contact: str = "hello@openteams.com  |  openteams.com"
+
+
+@dataclass(frozen=True, slots=True)
+class BlankSlide:
+    type: ClassVar[str] = "blank"
+    REQUIRED: ClassVar[Tuple[str, ...]] = ()
+
+
+# Any slide model (for annotations)
+Slide = Union[CoverSlide, SectionDividerSlide, AgendaSlide, ContentSlide, TwoColumnSlide,
+              QuoteSlide, MetricsSlide, TeamSlide, CaseStudySlide, ClosingSlide, BlankSlide]
+
+SLIDE_MODELS: Dict[str, type] = {m.type: m for m in typing.get_args(Slide)}
+
+
+def slide_to_dict(slide: Slide) -> Dict[str, Any]:
+    """Plain JSON data, every field included (what the render cache hashes)."""
+    data = {"type": slide.type}
+    for f in fields(slide):
+        data[f.name] = _plain(getattr(slide, f.name))
+    return data
+
+
+def _plain(value):
+    if isinstance(value, tuple):
+        return [_plain(v) for v in value]
+    if hasattr(value, "__dataclass_fields__"):
+        return {f.name: _plain(getattr(value, f.name)) for f in fields(value)}
+    return value
+
+
+# ---------------------------------------------------------------------------
+# Compiled converters
+# ---------------------------------------------------------------------------
+#
+# Each model compiles to a tuple of (name, check) pairs. A check takes the
+# raw value and returns (converted value, error or None); the error is the
+# part after "'<field>' ", so nested paths read "'metrics[2].value' must be
+# a string, not number." Plain string fields have no check (None): the
+# loops test ``type(value) is str`` inline, which keeps a 10k-slide spec at
+# a few milliseconds.
+
+_JSON_TYPES = {str: "string", bool: "boolean", int: "number", float: "number",
+               list: "array", dict: "object", type(None): "null"}
+
+
+def _json_type(value) -> str:
+    return _JSON_TYPES.get(type(value), type(value).__name__)
+
+
+def _check_str(value):
+    if type(value) is str:
+        return value, None
+    return None, f"must be a string, not {_json_type(value)}"
+
+
+def _check_optional_str(value):
+    if value is None or type(value) is str:
+        return value, None
+    return None, f"must be a string or null, not {_json_type(value)}"
+
+
+def _check_str_list(value):
+    if type(value) is list:
+        for j, item in enumerate(value):
+            if type(item) is not str:
+                return None, f"[{j}]' must be a string, not {_json_type(item)}"
+        return tuple(value), None
+    return None, f"must be an array of strings, not {_json_type(value)}"
+
+
+def _model_list_check(model):
+    plan = _compile(model)
+
+    def check(value):
+        if type(value) is not list:
+            return None, f"must be an array of objects, not {_json_type(value)}"
+        items = []
+        for j, item in enumerate(value):
+            if type(item) is not dict:
+                return None, f"[{j}]' must be an object, not {_json_type(item)}"
+            kwargs = {}
+            for name, field_check in plan:
+                raw = item.get(name, MISSING)
+                if raw is MISSING:
+                    continue
+                if field_check is None and type(raw) is str:
+                    kwargs[name] = raw
+                    continue
+                converted, err = (field_check or _check_str)(raw)
+                if err is not None:
+                    return None, f"[{j}].{name}{_after_name(err)}"
+                kwargs[name] = converted
+            items.append(model(**kwargs))
+        return tuple(items), None
+    return check
+
+
+def _after_name(err: str) -> str:
+    # "must be ..." continues after the closing quote; "[j]' ..." already has one
+    return err if err.startswith("[") else f"' {err}"
+
+
+def _check_for(hint):
+    if hint is str:
+        return None
+    if hint == Optional[str]:
+        return _check_optional_str
+    if typing.get_origin(hint) is tuple:
+        item = typing.get_args(hint)[0]
+        return _check_str_list if item is str else _model_list_check(item)
+    raise TypeError(f"No check for field type {hint!r}")
+
+
+_PLANS: Dict[type, tuple] = {}
+
+
+def _compile(model) -> tuple:
+    plan = _PLANS.get(model)
+    if plan is None:
+        hints = typing.get_type_hints(model)
+        plan = _PLANS[model] = tuple((f.name, _check_for(hints[f.name])) for f in fields(model))
+    return plan
+
+
+_CONVERTERS = {stype: (model, _compile(model)) for stype, model in SLIDE_MODELS.items()}
+REQUIRED_FIELDS: Dict[str, List[str]] = {stype: list(m.REQUIRED)
+                                         for stype, m in SLIDE_MODELS.items()}
+
+
+# ---------------------------------------------------------------------------
+# Parsing
+# ---------------------------------------------------------------------------
+
+def parse_slide(i: int, raw) -> Tuple[Optional[Slide], List[str]]:
+    """Check one raw slide (``i`` is its 1-based position, for messages).
+
+    Returns ``(model, [])``, or ``(None, errors)`` with every problem found.
+    """
+    if type(raw) is not dict:
+        return None, [f"Slide {i}: must be a JSON object."]
+    stype = raw.get("type")
+    if not stype:
+        return None, [f"Slide {i}: missing 'type' field."]
+    entry = _CONVERTERS.get(stype) if type(stype) is str else None
+    if entry is None:
+        return None, [f"Slide {i}: unknown type '{stype}'. "
+                      f"Valid types: {', '.join(SLIDE_MODELS)}"]
+    model, plan = entry
+    kwargs, errors = {}, None
+    for name, check in plan:
+        value = raw.get(name, MISSING)
+        if value is MISSING:
+            if name in model.REQUIRED:
+                errors = errors or []
+                errors.append(f"Slide {i} ({stype}): missing required field '{name}'.")
+            continue
+        if check is None and type(value) is str:
+            kwargs[name] = value
+            continue
+        converted, err = (check or _check_str)(value)
+        if err is None:
+            kwargs[name] = converted
+        else:
+            errors = errors or []
+            errors.append(f"Slide {i} ({stype}): '{name}{_after_name(err)}.")
+    if errors:
+        return None, errors
+    return model(**kwargs), []
+
+
+def parse_spec(spec) -> Tuple[Optional[List[Slide]], List[str]]:
+    """Check a whole spec. Returns ``(slides, [])`` or ``(None, every error)``."""
+    if type(spec) is not dict or type(spec.get("slides")) is not list:
+        return None, ["Spec must contain a 'slides' array."]
+    errors = []
+    title = spec.get("title")
+    if title is not None and type(title) is not str:
+        errors.append(f"Spec 'title' must be a string, not {_json_type(title)}.")
+    slides = []
+    for i, raw in enumerate(spec["slides"], 1):
+        slide, slide_errors = parse_slide(i, raw)
+        if slide_errors:
+            errors.extend(slide_errors)
+        elif not errors:
+            slides.append(slide)
+    return (None, errors) if errors else (slides, [])
+
+
+# ---------------------------------------------------------------------------
+# JSON Schema
+# ---------------------------------------------------------------------------
+
+def _schema_for(hint, default=MISSING) -> dict:
+    if hint is str:
+        schema = {"type": "string"}
+    elif hint == Optional[str]:
+        schema = {"type": ["string", "null"]}
+    else:
+        item = typing.get_args(hint)[0]
+        schema = {"type": "array",
+                  "items": {"type": "string"} if item is str
+                  else {"$ref": f"#/$defs/{item.__name__}"}}
+    if default is not MISSING and not isinstance(default, tuple):
+        schema["default"] = default
+    return schema
+
+
+def _object_schema(model, const_type: Optional[str] = None) -> dict:
+    hints = typing.get_type_hints(model)
+    props = {}
+    if const_type is not None:
+        props["type"] = {"const": const_type}
+    for f in fields(model):
+        props[f.name] = _schema_for(hints[f.name], f.default)
+    required = (["type"] if const_type is not None else []) + list(getattr(model, "REQUIRED", ()))
+    schema = {"type": "object", "properties": props}
+    if required:
+        schema["required"] = required
+    return schema
+
+
+def spec_schema() -> dict:
+    """JSON Schema (draft 2020-12) for a slide spec, generated from the models."""
+    defs = {m.__name__: _object_schema(m) for m in (Metric, TeamMember)}
+    for stype, model in SLIDE_MODELS.items():
+        defs[stype] = _object_schema(model, stype)
+    return {
+        "$schema": _SCHEMA_URI,
+        "title": "OpenTeams PPTX slide spec",
+        "type": "object",
+        "required": ["slides"],
+        "properties": {
+            "title": {"type": "string"},
+            "slides": {"type": "array",
+                       "items": {"oneOf": [{"$ref": f"#/$defs/{t}"} for t in SLIDE_MODELS]}},
+        },
+        "$defs": defs,
+    }
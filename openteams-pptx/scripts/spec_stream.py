@@ -0,0 +1,138 @@
+# Authored by Amelia Thurdekoos
+# Email: ameliathurdekoos@gmail.com
+#
+# Any cares, concerns, compliments, or enhancements are always welcome!
+
+"""
+Streaming spec input — yield slide specs one at a time instead of json.load().
+
+Two formats:
+  jsonl  one slide object per line (no deck wrapper)
+  json   a normal {"slides": [...]} document, parsed incrementally so only
+         the slide currently being decoded is held in memory
+
+Standard library only. Both iterators raise ValueError on malformed input.
+"""
+from __future__ import annotations
+
+import json
+from typing import IO, Iterator, Optional
+
+_WHITESPACE = " \t\r\n"
+_DECODER = json.JSONDecoder()
+# A value cut off by the end of the buffer fails within this many characters
+# of it (the longest partial token: "-Infinity", a surrogate-pair escape)
+_TRUNCATION_SLACK = 32
+
+
+def iter_jsonl_slides(fp: IO[str]) -> Iterator[dict]:
+    """Yield one slide spec per non-empty line of ``fp``."""
+    for lineno, line in enumerate(fp, 1):
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError as e:
+            raise ValueError(f"Line {lineno}: invalid JSON: {e}") from None
+
+
+class _IncrementalReader:
+    """Rolling text buffer over ``fp`` that decodes one JSON value at a time."""
+
+    def __init__(self, fp: IO[str], chunk_size: int):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self, at_least: int = 0) -> bool:
+        """Append more input, dropping what's already consumed. False at EOF."""
+        data = self.fp.read(max(self.chunk_size, at_least))
+        self.buf = self.buf[self.pos:] + data
+        self.pos = 0
+        if not data:
+            self.eof = True
+        return bool(data)
+
+    def peek(self) -> str:
+        """Next non-whitespace character without consuming it ('' at EOF)."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        ch = self.peek()
+        if not ch or ch not in chars:
+            found = repr(ch) if ch else "end of input"
+            raise ValueError(f"Invalid spec JSON: expected {' or '.join(map(repr, chars))}, "
+                             f"found {found}")
+        self.pos += 1
+        return ch
+
+    def decode(self):
+        """Decode the next complete JSON value, reading more input as needed."""
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError as e:
+                # More input can't fix an error well before the end, except a
+                # string that is still open (reported where it starts)
+                if self.eof or (e.pos < len(self.buf) - _TRUNCATION_SLACK
+                                and not e.msg.startswith("Unterminated string")):
+                    raise
+                # Grow geometrically so a huge value is re-scanned O(log n) times
+                self._fill(len(self.buf) - self.pos)
+                continue
+            # A number at the end of the buffer may continue in the next chunk,
+            # including one cut after its "." or "e"/"e-" ("-1." decodes as -1)
+            if (end >= len(self.buf) - 2 and not self.eof
+                    and isinstance(value, (int, float)) and not isinstance(value, bool)):
+                self._fill()
+                continue
+            self.pos = end
+            return value
+
+
+def iter_json_slides(fp: IO[str], meta: Optional[dict] = None,
+                     chunk_size: int = 1 << 16) -> Iterator[dict]:
+    """Yield the elements of the top-level ``slides`` array as they are parsed.
+
+    Other top-level keys (e.g. "title") are decoded in full and stored in
+    ``meta`` when a dict is passed. Raises ValueError if the document has no
+    ``slides`` array.
+    """
+    r = _IncrementalReader(fp, chunk_size)
+    found = False
+    r.expect("{")
+    if r.peek() == "}":
+        r.expect("}")
+    else:
+        while True:
+            key = r.decode()
+            if not isinstance(key, str):
+                raise ValueError("Invalid spec JSON: object keys must be strings")
+            r.expect(":")
+            if key == "slides" and r.peek() == "[":
+                found = True
+                r.expect("[")
+                if r.peek() == "]":
+                    r.expect("]")
+                else:
+                    while True:
+                        yield r.decode()
+                        if r.expect(",]") == "]":
+                            break
+            else:
+                value = r.decode()
+                if meta is not None:
+                    meta[key] = value
+            if r.expect(",}") == "}":
+                break
+    if not found:
+        raise ValueError("Spec must contain a 'slides' array.")
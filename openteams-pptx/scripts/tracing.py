@@ -0,0 +1,157 @@
+# Authored by Amelia Thurdekoos
+# Email: ameliathurdekoos@gmail.com
+#
+# Any cares, concerns, compliments, or enhancements are always welcome!
+
+"""
+Timing traces (--trace) and cProfile runs (--profile) for generate_deck.
+
+With a trace active, spans are recorded as Chrome trace events ("X" complete
+events), so the JSON opens in chrome://tracing or ui.perfetto.dev: spec and
+brand loading, every slide's renderer, the SlideBuilder helpers nested
+inside it, and the save. Events inside a slide carry its index and type.
+
+Tracing is off unless session() / start() turned it on. When off, span()
+returns a shared no-op context manager and @traced helpers make one global
+check before calling straight through.
+
+Only the calling process is traced: with --slide-workers or batch
+--workers the renders happen in workers and only the merge shows up.
+"""
+from __future__ import annotations
+
+import contextlib
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+log = logging.getLogger(__name__)
+
+_tracer: Optional["Tracer"] = None
+_OFF = contextlib.nullcontext()
+
+
+class Tracer:
+    """Collects complete events in memory until write()."""
+
+    def __init__(self):
+        self.events: List[dict] = []
+        self.context: Dict[str, object] = {}   # args added to every event (slide, type)
+        self._origin = time.perf_counter_ns()
+        self._pid = os.getpid()
+
+    def add(self, name: str, cat: str, start_ns: int, end_ns: int, args: Optional[dict]) -> None:
+        if self.context:
+            args = {**self.context, **args} if args else dict(self.context)
+        event = {"name": name, "cat": cat, "ph": "X", "pid": self._pid,
+                 "tid": threading.get_native_id(),
+                 "ts": (start_ns - self._origin) / 1000, "dur": (end_ns - start_ns) / 1000}
+        if args:
+            event["args"] = args
+        self.events.append(event)
+
+    def write(self, path: str) -> None:
+        with open(path, "w") as f:
+            json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, f)
+        log.info(f"Trace: {len(self.events)} events → {path}")
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "cat", "args", "start", "saved")
+
+    def __init__(self, tracer: Tracer, name: str, cat: str, args: Optional[dict],
+                 slide_context: bool = False):
+        self.tracer, self.name, self.cat, self.args = tracer, name, cat, args
+        self.saved = tracer.context if slide_context else None
+
+    def __enter__(self):
+        if self.saved is not None:
+            self.tracer.context = self.args
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter_ns()
+        if self.saved is not None:
+            self.tracer.context = self.saved
+        self.tracer.add(self.name, self.cat, self.start, end, self.args)
+        return False
+
+
+# ---------------------------------------------------------------------------
+# Instrumentation points
+# ---------------------------------------------------------------------------
+
+def span(name: str, cat: str = "generate", **args):
+    """Time the ``with`` block as one event (a no-op while tracing is off)."""
+    if _tracer is None:
+        return _OFF
+    return _Span(_tracer, name, cat, args or None)
+
+
+def slide_span(name: str, index: int, stype: str):
+    """Span for one slide; events nested inside are tagged with its index and type."""
+    if _tracer is None:
+        return _OFF
+    return _Span(_tracer, name, "renderer", {"slide": index, "type": stype},
+                 slide_context=True)
+
+
+def traced(fn):
+    """Decorator: record each call of ``fn`` as a "helper" event while tracing."""
+    name = fn.__qualname__
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        tracer = _tracer
+        if tracer is None:
+            return fn(*args, **kwargs)
+        start = time.perf_counter_ns()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            tracer.add(name, "helper", start, time.perf_counter_ns(), None)
+    return wrapper
+
+
+# ---------------------------------------------------------------------------
+# Sessions
+# ---------------------------------------------------------------------------
+
+def start() -> Tracer:
+    global _tracer
+    _tracer = Tracer()
+    return _tracer
+
+
+def stop() -> Optional[Tracer]:
+    global _tracer
+    tracer, _tracer = _tracer, None
+    return tracer
+
+
+@contextlib.contextmanager
+def session(trace_path: Optional[str] = None, profile_path: Optional[str] = None):
+    """Trace and/or cProfile the ``with`` block, writing the files on exit
+    (also when it fails, or exits through sys.exit)."""
+    profiler = None
+    if trace_path:
+        start()
+    if profile_path:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+    try:
+        yield
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(profile_path)
+            log.info(f"Profile → {profile_path} (python -m pstats {profile_path})")
+        tracer = stop() if trace_path else None
+        if tracer is not None:
+            tracer.write(trace_path)
@@ -49,6 +49,120 @@ class TestHexToRGBColor:
         c = hex_to_rgbcolor("")
         assert str(c) == "000000"
 
+    def test_invalid_color_warns_once(self, caplog):
+        with caplog.at_level("WARNING"):
+            for _ in range(3):
+                assert str(hex_to_rgbcolor("#nope12")) == "000000"
+        assert sum("#nope12" in r.message for r in caplog.records) == 1
+
+
+class TestColorTable:
+    @pytest.fixture
+    def theme(self):
+        from brand_engine import load_brand, build_theme
+        return build_theme(load_brand(BRAND_JSON))
+
+    def test_names_and_hex_resolve_to_shared_colors(self, theme):
+        assert theme.rgb("day_blue") is theme.rgb(theme.day_blue)
+        assert str(theme.rgb("light_bg")) == theme.brand.colors["light_bg"].lstrip("#").upper()
+        assert str(theme.rgb("#abcdef")) == "ABCDEF"  # not in the table: parsed
+
+    def test_table_is_read_only_and_picklable(self, theme):
+        import pickle
+        with pytest.raises(TypeError):
+            theme.color_table["day_blue"] = None
+        clone = pickle.loads(pickle.dumps(theme))
+        assert clone.color_table == theme.color_table
+        assert clone.rgb("day_blue") == theme.rgb("day_blue")
+
+
+class TestThemeConfig:
+    @pytest.fixture
+    def theme(self):
+        from brand_engine import load_brand, build_theme
+        return build_theme(load_brand(BRAND_JSON))
+
+    def test_frozen_with_precomputed_geometry(self, theme):
+        import dataclasses
+        from pptx.util import Inches, Pt
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            theme.margin_inches = 1.0
+        assert not hasattr(theme, "__dict__")
+        assert theme.margin_emu == Inches(theme.margin_inches)
+        assert theme.content_width_emu == Inches(theme.slide_width_inches) - 2 * theme.margin_emu
+        assert theme.h2_emu == Pt(theme.h2_size)
+
+    def test_replace_and_pickle_rebuild_derived_values(self, theme):
+        import dataclasses
+        import pickle
+        wide = dataclasses.replace(theme, margin_inches=1.0, day_blue="#123456")
+        assert wide.margin_emu == 914400
+        assert str(wide.rgb("day_blue")) == "123456"
+        clone = pickle.loads(pickle.dumps(theme))
+        assert clone == theme
+        assert clone.content_width_emu == theme.content_width_emu
+        assert clone.tokens() == theme.tokens()
+
+
+class TestTextFrames:
+    LINES = ["Plain", "", "tab\there", "soft\vbreak", "ctrl\x01char", "<&> \"quotes\""]
+
+    @pytest.fixture
+    def slide(self):
+        from pptx import Presentation
+        prs = Presentation()
+        return prs.slides.add_slide(prs.slide_layouts[6])
+
+    @staticmethod
+    def _xml(shape) -> bytes:
+        from lxml import etree
+        return etree.tostring(shape._element.txBody)
+
+    def test_fill_text_frame_matches_python_pptx(self, slide):
+        from pptx.util import Pt
+        from pptx.enum.text import PP_ALIGN
+        from pptx_helpers import fill_text_frame, paragraph_template
+
+        expected = slide.shapes.add_textbox(0, 0, 100, 100)
+        tf = expected.text_frame
+        tf.word_wrap = True
+        for i, line in enumerate(self.LINES):
+            p = tf.paragraphs[0] if i == 0 else tf.add_paragraph()
+            p.text = line
+            p.font.size = Pt(14)
+            p.font.bold = False
+            p.font.color.rgb = hex_to_rgbcolor("#4D75FE")
+            p.font.name = "Inter"
+            p.alignment = PP_ALIGN.CENTER
+            p.space_after = Pt(14 * 0.4)
+
+        fast = slide.shapes.add_textbox(0, 0, 100, 100)
+        fill_text_frame(fast, self.LINES, paragraph_template(
+            14, False, "#4D75FE", "Inter", PP_ALIGN.CENTER, 14 * 0.4))
+        assert self._xml(fast) == self._xml(expected)
+
+    def test_fill_run_list_matches_python_pptx(self, slide):
+        from pptx.util import Pt
+        from pptx_helpers import fill_run_list, paragraph_template, run_template
+
+        expected = slide.shapes.add_textbox(0, 0, 100, 100)
+        tf = expected.text_frame
+        tf.word_wrap = True
+        for i, line in enumerate(self.LINES):
+            p = tf.paragraphs[0] if i == 0 else tf.add_paragraph()
+            run = p.add_run()
+            run.text = line
+            run.font.size = Pt(12)
+            run.font.color.rgb = hex_to_rgbcolor("#000000")
+            run.font.name = "Inter"
+            p.space_after = Pt(8)
+
+        fast = slide.shapes.add_textbox(0, 0, 100, 100)
+        r = run_template(12, "#000000", "Inter")
+        fill_run_list(fast, [[(r, line)] for line in self.LINES],
+                      paragraph_template(space_after_pt=8))
+        assert self._xml(fast) == self._xml(expected)
+
 
 # ---------------------------------------------------------------------------
 # luminance & contrast_ratio
@@ -119,7 +233,7 @@ class TestValidateSpec:
         assert validate_spec(DEMO_SPEC) == []
 
     def test_all_slide_types_have_validation(self):
-        from generate_deck import REQUIRED_FIELDS
+        from spec_models import REQUIRED_FIELDS
         from slide_renderers import RENDERERS
         assert set(REQUIRED_FIELDS.keys()) == set(RENDERERS.keys())
 
@@ -127,6 +241,51 @@ class TestValidateSpec:
         spec = {"slides": [{"type": "blank"}]}
         assert validate_spec(spec) == []
 
+    def test_wrong_types_all_reported(self):
+        spec = {"slides": [
+            {"type": "metrics", "title": 5, "metrics": "lots"},
+            {"type": "agenda", "items": ["ok", 2]},
+            {"type": "team", "title": "T", "members": [{"name": "A", "bio": None}]},
+        ]}
+        assert validate_spec(spec) == [
+            "Slide 1 (metrics): 'title' must be a string, not number.",
+            "Slide 1 (metrics): 'metrics' must be an array of objects, not string.",
+            "Slide 2 (agenda): 'items[1]' must be a string, not number.",
+            "Slide 3 (team): 'members[0].bio' must be a string, not null.",
+        ]
+
+
+class TestSpecModels:
+    def test_slides_convert_to_typed_models_with_defaults(self):
+        from spec_models import parse_spec, MetricsSlide, Metric, ClosingSlide
+        slides, errors = parse_spec({"slides": [
+            {"type": "metrics", "title": "KPIs", "metrics": [{"value": "9"}], "extra": 1},
+            {"type": "closing", "title": "Bye"},
+        ]})
+        assert errors == []
+        assert slides[0] == MetricsSlide(title="KPIs", metrics=(Metric(value="9", label=""),))
+        assert slides[1].contact == ClosingSlide().contact
+        assert not hasattr(slides[0], "__dict__")
+
+    def test_schema_covers_every_type(self):
+        from spec_models import spec_schema
+        from slide_renderers import RENDERERS
+        schema = spec_schema()
+        json.dumps(schema)
+        refs = {ref["$ref"].rsplit("/", 1)[1]
+                for ref in schema["properties"]["slides"]["items"]["oneOf"]}
+        assert refs == set(RENDERERS)
+        quote = schema["$defs"]["quote"]
+        assert quote["required"] == ["type", "text"]
+        assert quote["properties"]["attribution"] == {"type": "string", "default": ""}
+
+    def test_large_spec_validates_fast(self):
+        import time
+        spec = {"slides": DEMO_SPEC["slides"] * 1000}
+        start = time.perf_counter()
+        assert validate_spec(spec) == []
+        assert time.perf_counter() - start < 0.5
+
 
 # ---------------------------------------------------------------------------
 # Smoke test: generate demo deck without errors
@@ -184,3 +343,1089 @@ class TestGeneration:
             assert os.path.exists(out_path)
         finally:
             os.unlink(out_path)
+
+
+# ---------------------------------------------------------------------------
+# Batch mode: many specs, one brand/theme
+# ---------------------------------------------------------------------------
+
+class TestBatch:
+    def test_render_deck_raises_instead_of_exiting(self):
+        from generate_deck import render_deck, SpecValidationError
+        with pytest.raises(SpecValidationError) as exc:
+            render_deck({"slides": [{"type": "quote"}]}, None, "unused.pptx")
+        assert any("text" in e for e in exc.value.errors)
+
+    def test_batch_reports_each_deck(self, tmp_path):
+        from batch import DeckJob, generate_batch
+        jobs = [
+            DeckJob("good", {"slides": [{"type": "cover", "title": "A"}]}),
+            DeckJob("bad", {"slides": [{"type": "quote"}]}),
+            DeckJob("broken", error="Could not load broken.json"),
+            DeckJob("also_good", {"slides": [{"type": "closing", "title": "Bye"}]}),
+        ]
+        results = generate_batch(jobs, BRAND_JSON, str(tmp_path))
+        assert [r.name for r in results] == ["good", "bad", "broken", "also_good"]
+        assert [r.ok for r in results] == [True, False, False, True]
+        assert results[0].slides == 1
+        assert (tmp_path / "good.pptx").exists()
+        assert not (tmp_path / "bad.pptx").exists()
+
+    def test_jsonl_names_and_bad_lines(self, tmp_path):
+        from batch import iter_spec_jsonl
+        path = tmp_path / "specs.jsonl"
+        path.write_text(
+            '{"title": "Q1 Review", "slides": []}\n'
+            '\n'
+            'not json\n'
+            '{"title": "Q1 Review", "slides": []}\n'
+            '{"slides": []}\n'
+        )
+        jobs = list(iter_spec_jsonl(str(path)))
+        assert [j.name for j in jobs] == ["Q1_Review", "deck-00003", "Q1_Review-2", "deck-00005"]
+        assert jobs[1].error and jobs[1].spec is None
+
+    def test_spec_dir_names_that_clash_are_deduplicated(self, tmp_path):
+        from batch import iter_spec_dir
+        for fname in ("a b.json", "a_b.json", "a_b-2.json", "notes.txt"):
+            (tmp_path / fname).write_text('{"slides": []}')
+        names = [j.name for j in iter_spec_dir(str(tmp_path))]
+        assert sorted(names) == ["a_b", "a_b-2", "a_b-3"]
+
+    def test_generate_many_keeps_order_and_isolates_failures(self, tmp_path):
+        from batch import DeckJob, generate_many
+        jobs = [
+            DeckJob(f"deck{i}", {"slides": [{"type": "cover", "title": f"D{i}"}]})
+            for i in range(5)
+        ]
+        jobs.insert(2, DeckJob("bad", {"slides": [{"type": "quote"}]}))
+        results = generate_many(jobs, BRAND_JSON, str(tmp_path), workers=2)
+        assert [r.name for r in results] == [j.name for j in jobs]
+        assert [r.ok for r in results] == [True, True, False, True, True, True]
+
+    def test_generate_many_timeout(self, tmp_path):
+        from batch import DeckJob, generate_many
+        big = {"slides": [{"type": "team", "title": "T", "members": [
+            {"name": "N", "role": "R"}] * 6}] * 200}
+        results = generate_many([DeckJob("slow", big)], BRAND_JSON, str(tmp_path),
+                                workers=1, timeout=0.001)
+        assert not results[0].ok
+        assert "Timed out" in results[0].error
+
+    def test_generate_batch_timeout_leaves_no_partial_file(self, tmp_path):
+        from batch import DeckJob, generate_batch
+        big = {"slides": [{"type": "team", "title": "T", "members": [
+            {"name": "N", "role": "R"}] * 6}] * 200}
+        results = generate_batch([DeckJob("slow", big)], BRAND_JSON, str(tmp_path), timeout=0.001)
+        assert "Timed out" in results[0].error
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="needs SIGALRM")
+    def test_deadline_passing_during_rename_is_not_a_timeout(self, tmp_path, monkeypatch):
+        import time
+        from batch import DeckJob, generate_batch
+        replace = os.replace
+
+        def slow_replace(src, dst):
+            time.sleep(1.2)
+            replace(src, dst)
+
+        monkeypatch.setattr(os, "replace", slow_replace)
+        results = generate_batch([DeckJob("a", {"slides": [{"type": "blank"}]})],
+                                 BRAND_JSON, str(tmp_path), timeout=1)
+        assert results[0].ok, results[0].error
+        assert [p.name for p in tmp_path.iterdir()] == ["a.pptx"]
+
+    @pytest.mark.skipif(sys.platform != "linux", reason="workers must be forked")
+    def test_generate_many_fails_only_the_deck_that_kills_its_worker(self, tmp_path, monkeypatch):
+        import batch
+        render_job = batch.render_job
+
+        def crashing_render_job(job, *args, **kwargs):
+            if job.name == "crash":
+                os._exit(1)
+            return render_job(job, *args, **kwargs)
+
+        monkeypatch.setattr(batch, "render_job", crashing_render_job)  # inherited by forked workers
+        jobs = [batch.DeckJob(f"deck{i}", {"slides": [{"type": "cover", "title": f"D{i}"}]})
+                for i in range(5)]
+        jobs.insert(1, batch.DeckJob("crash", {"slides": [{"type": "blank"}]}))
+        results = batch.generate_many(jobs, BRAND_JSON, str(tmp_path), workers=2)
+        assert [r.name for r in results] == [j.name for j in jobs]
+        assert [r.ok for r in results] == [True, False, True, True, True, True]
+        assert results[1].error == "Worker process died."
+
+    def test_generate_many_bad_brand_fails_before_the_pool(self, tmp_path, monkeypatch):
+        import batch
+        monkeypatch.setattr(batch, "ProcessPoolExecutor", None)  # must not be reached
+        with pytest.raises(FileNotFoundError):
+            batch.generate_many([batch.DeckJob("a", {"slides": []})],
+                                str(tmp_path / "missing.json"), str(tmp_path), workers=2)
+
+    def test_init_worker_warms_the_render_stack(self):
+        import batch
+        from brand_engine import load_brand, build_theme
+        from slide_builder import LAYOUT_BUILDERS, _theme_assets
+        theme = build_theme(load_brand(BRAND_JSON))
+        batch._init_worker(theme)
+        assert LAYOUT_BUILDERS
+        assert set(_theme_assets(theme).layouts) == set(LAYOUT_BUILDERS)
+
+    def test_default_workers_is_positive(self):
+        from cpu_limits import default_workers
+        assert default_workers() >= 1
+
+
+# ---------------------------------------------------------------------------
+# Intra-deck parallel rendering + XML-part merge
+# ---------------------------------------------------------------------------
+
+class TestParallelSlides:
+    def test_merged_deck_matches_serial_order_and_dedups_media(self, tmp_path):
+        from pptx import Presentation
+        from brand_engine import load_brand, build_theme
+        from parallel_slides import render_deck_parallel
+
+        theme = build_theme(load_brand(BRAND_JSON))
+        spec = {"slides": DEMO_SPEC["slides"] * 3}
+        out = tmp_path / "merged.pptx"
+        count = render_deck_parallel(spec, theme, str(out), workers=2, chunk_size=4)
+        assert count == len(spec["slides"])
+
+        prs = Presentation(str(out))
+        assert len(prs.slides) == count
+        # Slide order survives the merge: every cover lands where the spec put it
+        covers = [i for i, s in enumerate(spec["slides"]) if s["type"] == "cover"]
+        for i in covers:
+            texts = [sh.text_frame.text for sh in prs.slides[i].shapes if sh.has_text_frame]
+            assert "Presentation Title" in texts
+        # Every picture resolves, and identical logos share one media part
+        image_parts = set()
+        for slide in [*prs.slides, *prs.slide_layouts]:
+            for sh in slide.shapes:
+                if sh.shape_type == 13:  # PICTURE
+                    image_parts.add(sh.image.sha1)
+        media = [n for n in prs.part.package.iter_parts() if "/media/" in str(n.partname)]
+        assert len(media) == len(image_parts)
+
+
+# ---------------------------------------------------------------------------
+# Render daemon
+# ---------------------------------------------------------------------------
+
+class TestDeckServer:
+    @pytest.fixture
+    def server(self):
+        import threading
+        from deck_server import RenderService, make_server
+        service = RenderService(BRAND_JSON, workers=1, queue_depth=0, timeout=30)
+        service.warm()
+        srv = make_server(service, port=0)
+        thread = threading.Thread(target=srv.serve_forever, daemon=True)
+        thread.start()
+        yield srv
+        srv.shutdown()
+        srv.server_close()
+        service.close()
+
+    def _request(self, srv, method, path, body=None, headers=None):
+        import http.client
+        conn = http.client.HTTPConnection(*srv.server_address[:2], timeout=30)
+        conn.request(method, path, body=body, headers=headers or {})
+        resp = conn.getresponse()
+        return resp.status, resp.getheader("Content-Type"), resp.read()
+
+    def test_render_returns_pptx_bytes(self, server):
+        body = json.dumps({"slides": [{"type": "cover", "title": "Hi"}]})
+        status, ctype, data = self._request(server, "POST", "/render", body)
+        assert status == 200
+        assert ctype.endswith("presentationml.presentation")
+        assert data[:2] == b"PK"
+
+    def test_invalid_spec_is_rejected_without_a_worker(self, server):
+        status, _, data = self._request(server, "POST", "/render",
+                                        json.dumps({"slides": [{"type": "quote"}]}))
+        assert status == 400
+        assert any("text" in e for e in json.loads(data)["errors"])
+
+    def test_negative_content_length_is_rejected(self, server):
+        status, _, data = self._request(server, "POST", "/render", "{}",
+                                        {"Content-Length": "-1"})
+        assert status == 400
+        assert "Content-Length" in json.loads(data)["error"]
+
+    def test_health(self, server):
+        status, _, data = self._request(server, "GET", "/healthz")
+        health = json.loads(data)
+        assert status == 200 and health["status"] == "ok" and health["workers"] == 1
+
+    def test_only_loopback_hosts(self):
+        from deck_server import is_loopback, make_server
+        assert all(map(is_loopback, ["127.0.0.1", "127.1.2.3", "::1", "localhost"]))
+        assert not any(map(is_loopback, ["0.0.0.0", "::", "192.168.1.10", "example.com"]))
+        with pytest.raises(ValueError, match="localhost-only"):
+            make_server(None, host="0.0.0.0")
+
+    def test_warm_starts_every_worker(self):
+        from deck_server import RenderService
+        service = RenderService(BRAND_JSON, workers=2, queue_depth=0)
+        try:
+            assert len(set(service.warm())) == 2
+        finally:
+            service.close()
+
+    def test_over_capacity_is_busy(self, server):
+        from batch import ServiceBusy
+        service = server.service
+        assert service._admit.acquire(blocking=False)  # occupy the only slot
+        try:
+            with pytest.raises(ServiceBusy, match="1 concurrent renders and 0 queued"):
+                service.render({"slides": [{"type": "blank"}]})
+        finally:
+            service._admit.release()
+
+    @pytest.mark.skipif(sys.platform != "linux", reason="workers must be forked")
+    def test_broken_pool_is_replaced_once(self, monkeypatch, caplog):
+        import threading
+        import time
+        from concurrent.futures.process import BrokenProcessPool
+        import deck_server
+        import generate_deck
+        render_deck = generate_deck.render_deck
+
+        def crashing_render_deck(spec, *args, **kwargs):
+            if spec.get("title") == "crash":
+                time.sleep(0.3)  # let the other request reach the same pool
+                os._exit(1)
+            return render_deck(spec, *args, **kwargs)
+
+        monkeypatch.setattr(generate_deck, "render_deck", crashing_render_deck)  # forked workers
+        service = deck_server.RenderService(BRAND_JSON, workers=2, queue_depth=2, timeout=30)
+        errors = []
+
+        def crash():
+            try:
+                service.render({"title": "crash", "slides": []})
+            except BrokenProcessPool as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=crash) for _ in range(2)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        try:
+            assert len(errors) == 2
+            assert caplog.text.count("Worker pool broke") == 1
+            assert service.render({"slides": [{"type": "blank"}]})[:2] == b"PK"
+        finally:
+            service.close()
+
+
+class TestAsyncAPI:
+    def test_generate_async_returns_bytes(self):
+        import asyncio
+        import io
+        from pptx import Presentation
+        from async_api import generate_async
+        spec = {"slides": [{"type": "cover", "title": "Hi"}, {"type": "closing", "title": "Bye"}]}
+        data = asyncio.run(generate_async(spec, BRAND_JSON))
+        assert len(Presentation(io.BytesIO(data)).slides) == 2
+
+    def test_writes_to_async_output(self):
+        import asyncio
+        from async_api import AsyncDeckGenerator
+
+        class Sink:
+            def __init__(self):
+                self.data = b""
+
+            async def write(self, data):
+                self.data += data
+
+        async def run(sink):
+            async with AsyncDeckGenerator(BRAND_JSON, max_concurrency=2) as gen:
+                return await gen.generate({"slides": [{"type": "blank"}]}, output=sink)
+
+        sink = Sink()
+        assert asyncio.run(run(sink)) == len(sink.data)
+        assert sink.data[:2] == b"PK"
+
+    def test_over_capacity_is_busy(self):
+        import asyncio
+        from async_api import AsyncDeckGenerator
+        from batch import ServiceBusy
+        spec = {"slides": [{"type": "content", "title": f"S{i}"} for i in range(30)]}
+
+        async def run(gen):
+            first = asyncio.create_task(gen.generate(spec))
+            await asyncio.sleep(0)  # let it take the only slot
+            with pytest.raises(ServiceBusy, match="1 concurrent renders and 0 queued"):
+                await gen.generate(spec)
+            await first
+
+        async def main():
+            async with AsyncDeckGenerator(BRAND_JSON, max_concurrency=1, queue_depth=0) as gen:
+                await run(gen)
+                return gen.stats()
+
+        stats = asyncio.run(main())
+        assert stats["rejected"] == 1 and stats["rendered"] == 1
+
+    def test_cancel_stops_between_slides(self):
+        import asyncio
+        from async_api import AsyncDeckGenerator
+        spec = {"slides": [{"type": "content", "title": f"S{i}"} for i in range(2000)]}
+
+        async def main():
+            async with AsyncDeckGenerator(BRAND_JSON, max_concurrency=1) as gen:
+                with pytest.raises(asyncio.TimeoutError):
+                    await asyncio.wait_for(gen.generate(spec), timeout=0.2)
+                return gen.stats()
+
+        stats = asyncio.run(main())
+        assert stats["cancelled"] == 1 and stats["rendered"] == 0 and stats["admitted"] == 0
+
+
+# ---------------------------------------------------------------------------
+# Streaming spec input
+# ---------------------------------------------------------------------------
+
+class TestSpecStream:
+    def test_incremental_json_matches_json_load(self):
+        import io
+        from spec_stream import iter_json_slides
+        spec = {
+            "title": "Deck ] with { tricky \" text",
+            "slides": [
+                {"type": "metrics", "title": "N", "metrics": [
+                    {"value": 1234567890.125, "label": "[x]"}]},
+                {"type": "quote", "text": "\u201cHi\u201d, \"she\" said"},
+                {"type": "blank"},
+            ],
+            "footer": {"n": 12345},
+        }
+        text = json.dumps(spec, indent=1)
+        for chunk in (1, 3, 7, 64, 1 << 16):
+            meta = {}
+            slides = list(iter_json_slides(io.StringIO(text), meta, chunk_size=chunk))
+            assert slides == spec["slides"]
+            assert meta == {"title": spec["title"], "footer": spec["footer"]}
+
+    def test_missing_slides_array(self):
+        import io
+        from spec_stream import iter_json_slides
+        with pytest.raises(ValueError, match="slides"):
+            list(iter_json_slides(io.StringIO('{"title": "x"}')))
+
+    def test_truncated_json_raises(self):
+        import io
+        from spec_stream import iter_json_slides
+        with pytest.raises(ValueError):
+            list(iter_json_slides(io.StringIO('{"slides": [{"type": "blank"}, {"type"')))
+
+    @pytest.mark.parametrize("chunk", [1, 2, 3])
+    def test_number_split_after_its_point(self, chunk):
+        import io
+        from spec_stream import iter_json_slides
+        meta = {}
+        slides = list(iter_json_slides(io.StringIO('{"title": -1.5e-07, "slides": [{"n": 2.5}]}'),
+                                       meta, chunk_size=chunk))
+        assert meta["title"] == -1.5e-07 and slides == [{"n": 2.5}]
+
+    def test_malformed_json_fails_without_reading_to_the_end(self):
+        import io
+        from spec_stream import iter_json_slides
+
+        class Source(io.StringIO):
+            reads = 0
+
+            def read(self, size=-1):
+                Source.reads += 1
+                return super().read(size)
+
+        body = ",".join(['{"type": "blank"}'] * 10_000)
+        fp = Source('{"slides": [{"type": "blank", oops}, ' + body + ']}')
+        with pytest.raises(ValueError):
+            list(iter_json_slides(fp, chunk_size=64))
+        assert Source.reads == 1
+
+    def test_stream_render_collects_all_errors(self, tmp_path):
+        import io
+        from brand_engine import load_brand, build_theme
+        from generate_deck import render_deck_stream, SpecValidationError
+        from spec_stream import iter_jsonl_slides
+        theme = build_theme(load_brand(BRAND_JSON))
+        good = io.StringIO('{"type": "cover", "title": "A"}\n\n{"type": "blank"}\n')
+        assert render_deck_stream(iter_jsonl_slides(good), theme, str(tmp_path / "a.pptx")) == 2
+
+        bad = io.StringIO('{"type": "quote"}\n{"type": "blank"}\n{"type": "unicorn"}\n')
+        with pytest.raises(SpecValidationError) as exc:
+            render_deck_stream(iter_jsonl_slides(bad), theme, str(tmp_path / "b.pptx"))
+        assert len(exc.value.errors) == 2
+        assert not (tmp_path / "b.pptx").exists()
+
+
+class TestStreamingWriter:
+    def test_stream_output_matches_normal_save(self, tmp_path):
+        import zipfile
+        from brand_engine import load_brand, build_theme
+        from generate_deck import render_deck
+        theme = build_theme(load_brand(BRAND_JSON))
+        normal, streamed = tmp_path / "a.pptx", tmp_path / "b.pptx"
+        assert render_deck(DEMO_SPEC, theme, str(normal)) == len(DEMO_SPEC["slides"])
+        assert render_deck(DEMO_SPEC, theme, str(streamed),
+                           stream_output=True) == len(DEMO_SPEC["slides"])
+        with zipfile.ZipFile(normal) as a, zipfile.ZipFile(streamed) as b:
+            assert sorted(a.namelist()) == sorted(b.namelist())
+            for name in a.namelist():
+                assert a.read(name) == b.read(name), name
+
+    def test_slides_released_as_they_are_written(self, tmp_path):
+        from pptx import Presentation
+        from brand_engine import load_brand, build_theme
+        from generate_deck import new_presentation, render_slides
+        from package_writer import StreamingPackageWriter
+        from slide_builder import SlideBuilder
+        theme = build_theme(load_brand(BRAND_JSON))
+        prs = new_presentation(theme)
+        sb = SlideBuilder(prs, theme)
+        slides = [{"type": "section_divider", "title": f"Part {i}"} for i in range(30)]
+        held = []
+        out = tmp_path / "big.pptx"
+        with StreamingPackageWriter(prs, str(out)) as writer:
+            render_slides(sb, slides,
+                          after_slide=lambda: (writer.flush(), held.append(len(prs.slides))))
+        assert set(held) == {0}
+        reopened = Presentation(str(out))
+        titles = [[sh.text_frame.text for sh in s.shapes
+                   if sh.has_text_frame and sh.text_frame.text.startswith("Part")]
+                  for s in reopened.slides]
+        assert titles == [[f"Part {i}"] for i in range(30)]
+
+    def test_failed_render_removes_partial_file(self, tmp_path):
+        from brand_engine import load_brand, build_theme
+        from generate_deck import new_presentation
+        from package_writer import StreamingPackageWriter
+        prs = new_presentation(build_theme(load_brand(BRAND_JSON)))
+        out = tmp_path / "partial.pptx"
+        with pytest.raises(RuntimeError):
+            with StreamingPackageWriter(prs, str(out)):
+                raise RuntimeError("boom")
+        assert not out.exists()
+
+
+class TestPptxCompat:
+    """Fails when a python-pptx upgrade removes an internal pptx_compat uses."""
+
+    def test_private_hooks_still_work(self):
+        from brand_engine import load_brand, build_theme
+        from generate_deck import new_presentation
+        from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+        from pptx_compat import content_types_xml, package_rels, slide_id_list
+        prs = new_presentation(build_theme(load_brand(BRAND_JSON)))
+        prs.slides.add_slide(prs.slide_layouts[0])
+        package = prs.part.package
+        assert b"presentationml.slide+xml" in content_types_xml(tuple(package.iter_parts()))
+        assert b"officeDocument" in package_rels(package).xml
+        sldIdLst = slide_id_list(prs)
+        assert [s.rId for s in sldIdLst] == [prs.part.relate_to(prs.slides[0].part, RT.SLIDE)]
+        assert callable(sldIdLst.add_sldId)
+
+    def test_layout_hooks_still_work(self):
+        from brand_engine import load_brand, build_theme
+        from generate_deck import new_presentation
+        from pptx.oxml import parse_xml
+        from pptx.oxml.ns import nsdecls
+        from pptx_compat import add_layout_id, next_shape_id, set_background
+        prs = new_presentation(build_theme(load_brand(BRAND_JSON)))
+        master = prs.slide_masters[0]
+        n_layouts = len(master.slide_layouts)
+        assert add_layout_id(master).tag.endswith("}sldLayoutId")
+        assert len(master._element.sldLayoutIdLst) == n_layouts + 1
+
+        layout = prs.slide_layouts[0]
+        shape_id = next_shape_id(layout.shapes)
+        assert shape_id > max((s.shape_id for s in layout.shapes), default=1)
+        cSld = layout._element.cSld
+        for color in ("FF0000", "00FF00"):
+            set_background(cSld, parse_xml(
+                f'<p:bg {nsdecls("p", "a")}><p:bgPr><a:solidFill>'
+                f'<a:srgbClr val="{color}"/></a:solidFill><a:effectLst/></p:bgPr></p:bg>'))
+        assert cSld[0] is cSld.bg  # <p:bg> comes before <p:spTree>
+        assert len(cSld.findall(cSld.bg.tag)) == 1
+        assert cSld.bg.xpath(".//a:srgbClr/@val") == ["00FF00"]
+
+    def test_text_hooks_still_work(self):
+        from pptx.oxml import parse_xml
+        from pptx.oxml.ns import nsdecls
+        from pptx.util import Pt
+        from pptx_compat import paragraph_proxy, run_element
+        p = parse_xml(f"<a:p {nsdecls('a')}/>")
+        run = paragraph_proxy(p).add_run()
+        run.font.size = Pt(12)
+        r = run_element(run)
+        assert r.getparent() is p
+        assert r.xpath("a:rPr/@sz") == ["1200"]
+
+
+class TestCompression:
+    def _deck(self):
+        from brand_engine import load_brand, build_theme
+        from generate_deck import new_presentation, render_slides
+        from slide_builder import SlideBuilder
+        theme = build_theme(load_brand(BRAND_JSON))
+        prs = new_presentation(theme)
+        render_slides(SlideBuilder(prs, theme), DEMO_SPEC["slides"])
+        return prs
+
+    @pytest.mark.parametrize("profile", ["store", "fast", "default", "max"])
+    def test_profiles_match_python_pptx_save(self, profile):
+        import io
+        import zipfile
+        from package_writer import save_presentation
+        prs = self._deck()
+        expected, actual = io.BytesIO(), io.BytesIO()
+        prs.save(expected)
+        save_presentation(prs, actual, profile, threads=4)
+        with zipfile.ZipFile(expected) as a, zipfile.ZipFile(actual) as b:
+            assert b.testzip() is None
+            assert a.namelist() == b.namelist()
+            for name in a.namelist():
+                assert a.read(name) == b.read(name), name
+            for info in b.infolist():
+                stored = profile == "store" or info.filename.endswith((".png", ".jpeg", ".jpg"))
+                assert (info.compress_type == zipfile.ZIP_STORED) == stored, info.filename
+
+    def test_stream_output_stores_media(self, tmp_path):
+        import zipfile
+        from brand_engine import load_brand, build_theme
+        from generate_deck import render_deck
+        theme = build_theme(load_brand(BRAND_JSON))
+        out = tmp_path / "fast.pptx"
+        render_deck(DEMO_SPEC, theme, str(out), stream_output=True, compression="fast")
+        with zipfile.ZipFile(out) as z:
+            types = {i.filename: i.compress_type for i in z.infolist()}
+        assert types["ppt/media/image1.png"] == zipfile.ZIP_STORED
+        assert types["ppt/slides/slide1.xml"] == zipfile.ZIP_DEFLATED
+
+    def test_unknown_profile_rejected(self):
+        import io
+        from package_writer import save_presentation
+        with pytest.raises(ValueError, match="Unknown compression profile"):
+            save_presentation(self._deck(), io.BytesIO(), "zstd")
+
+    def test_single_thread_in_worker_processes(self):
+        from concurrent.futures import ProcessPoolExecutor
+        from package_writer import _default_threads
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            assert pool.submit(_default_threads).result() == 1
+
+
+class TestIncremental:
+    def _slides_xml(self, path):
+        from pptx import Presentation
+        return [s.part.blob for s in Presentation(str(path)).slides]
+
+    def test_unchanged_slides_are_copied(self, tmp_path):
+        from brand_engine import load_brand, build_theme
+        from generate_deck import render_deck
+        from incremental import PreviousDeck
+        theme = build_theme(load_brand(BRAND_JSON))
+        first, second = tmp_path / "a.pptx", tmp_path / "b.pptx"
+        render_deck(DEMO_SPEC, theme, str(first))
+
+        edited = json.loads(json.dumps(DEMO_SPEC))
+        edited["slides"][3]["title"] = "Edited"
+        edited["slides"].insert(0, {"type": "blank"})
+        prev = PreviousDeck(str(first))
+        assert render_deck(edited, theme, str(second), previous=prev) == len(edited["slides"])
+        assert prev.reused == len(DEMO_SPEC["slides"]) - 1
+
+        # Same slides as a from-scratch render of the edited spec
+        fresh = tmp_path / "c.pptx"
+        render_deck(edited, theme, str(fresh))
+        assert self._slides_xml(second) == self._slides_xml(fresh)
+
+    def test_theme_change_invalidates(self, tmp_path):
+        from brand_engine import load_brand, build_theme
+        from generate_deck import render_deck
+        from incremental import PreviousDeck
+        first = tmp_path / "a.pptx"
+        render_deck(DEMO_SPEC, build_theme(load_brand(BRAND_JSON)), str(first))
+        import dataclasses
+        theme = dataclasses.replace(build_theme(load_brand(BRAND_JSON)), day_blue="#123456")
+        prev = PreviousDeck(str(first))
+        render_deck(DEMO_SPEC, theme, str(tmp_path / "b.pptx"), previous=prev)
+        assert prev.reused == 0
+
+    def test_rebuild_in_place(self, tmp_path):
+        out = str(tmp_path / "deck.pptx")
+        generate(DEMO_SPEC, BRAND_JSON, out)
+        before = self._slides_xml(out)
+        generate(DEMO_SPEC, BRAND_JSON, out, incremental=out)
+        assert self._slides_xml(out) == before
+
+
+class TestRenderCache:
+    def test_cached_render_matches_fresh(self, tmp_path):
+        import zipfile
+        from brand_engine import load_brand, build_theme
+        from generate_deck import render_deck
+        from render_cache import RenderCache
+        theme = build_theme(load_brand(BRAND_JSON))
+        cache = RenderCache(str(tmp_path / "cache"))
+        render_deck(DEMO_SPEC, theme, str(tmp_path / "a.pptx"), cache=cache)
+        n = len(DEMO_SPEC["slides"])
+        assert cache.stats() == {"hits": 0, "misses": n, "stores": n, "evictions": 0}
+
+        # A second process would start with fresh counters but the same directory
+        cache = RenderCache(str(tmp_path / "cache"))
+        render_deck(DEMO_SPEC, theme, str(tmp_path / "b.pptx"), cache=cache)
+        assert cache.hits == n and cache.misses == 0
+        with zipfile.ZipFile(tmp_path / "a.pptx") as a, zipfile.ZipFile(tmp_path / "b.pptx") as b:
+            for name in a.namelist():
+                assert a.read(name) == b.read(name), name
+
+    def test_lru_eviction(self, tmp_path):
+        from render_cache import RenderCache
+        cache = RenderCache(str(tmp_path), max_bytes=10_000)
+        xml = b"<p:sld/>" + b" " * 2000
+        for i in range(4):
+            cache.put(f"{i:040x}", xml, {})
+            os.utime(cache._entry_path(f"{i:040x}"), (1000 + i, 1000 + i))
+        assert cache.get(f"{0:040x}") is not None   # touch: now most recent
+        cache.put(f"{9:040x}", xml, {})
+        cache.put(f"{8:040x}", xml, {})
+        assert cache.evictions == 2          # keys 1 and 2, the least recently used
+        assert cache.get(f"{0:040x}") is not None
+        assert cache.get(f"{1:040x}") is None
+        assert cache.get(f"{8:040x}") is not None
+
+    def test_size_cap_holds_across_processes(self, tmp_path):
+        from render_cache import RenderCache
+        xml = b"<p:sld/>" + b" " * 900
+        # Twenty "processes", none writing enough on its own to trigger eviction
+        for i in range(20):
+            RenderCache(str(tmp_path), max_bytes=10_000).put(f"{i:040x}", xml, {})
+        sizes = [os.path.getsize(os.path.join(root, name))
+                 for root, _dirs, names in os.walk(tmp_path / "slides") for name in names]
+        assert sum(sizes) <= 10_000
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path):
+        from render_cache import RenderCache
+        cache = RenderCache(str(tmp_path))
+        key = "ab" * 20
+        os.makedirs(os.path.dirname(cache._entry_path(key)))
+        with open(cache._entry_path(key), "w") as f:
+            f.write("{not json")
+        assert cache.get(key) is None
+        assert cache.misses == 1
+
+
+class TestLayoutChrome:
+    def _render(self, spec):
+        from brand_engine import load_brand, build_theme
+        from generate_deck import new_presentation, render_slides
+        from slide_builder import SlideBuilder
+        theme = build_theme(load_brand(BRAND_JSON))
+        prs = new_presentation(theme)
+        render_slides(SlideBuilder(prs, theme), spec["slides"])
+        return prs
+
+    def test_cloned_shapes_get_unique_ids_and_images(self):
+        prs = self._render({"slides": [{"type": "content", "title": "A"}] * 3})
+        layout = prs.slides[0].slide_layout
+        for target in [*prs.slides, layout]:
+            ids = [sh.shape_id for sh in target.shapes]
+            assert len(ids) == len(set(ids))
+        pics = [sh for sh in layout.shapes if sh.shape_type == 13]
+        assert pics and all(p.image.blob for p in pics)
+
+
+class TestSlideLayouts:
+    def test_one_branded_layout_per_family(self, tmp_path):
+        from pptx import Presentation
+        out = tmp_path / "deck.pptx"
+        generate({"slides": DEMO_SPEC["slides"] * 2}, BRAND_JSON, str(out))
+        prs = Presentation(str(out))
+        names = [l.name for l in prs.slide_layouts if l.name.startswith("OpenTeams")]
+        assert len(names) == len(set(names)) == 8
+        assert {s.slide_layout.name for s in prs.slides} == set(names)
+        # Chrome (logos, footers) lives in the layouts, not on the slides
+        assert not [sh for s in prs.slides for sh in s.shapes if sh.shape_type == 13]
+
+    def test_decks_carry_only_the_layouts_they_use(self, tmp_path):
+        from pptx import Presentation
+        from pptx.util import Inches
+        out = tmp_path / "deck.pptx"
+        generate({"slides": [{"type": "content", "title": "A"}] * 2}, BRAND_JSON, str(out))
+        prs = Presentation(str(out))
+        assert [l.name for l in prs.slide_layouts] == ["Blank", "OpenTeams Content"]
+        assert prs.slide_width == Inches(13.333)
+
+    def test_base_template_built_once_per_theme(self):
+        from brand_engine import load_brand, build_theme
+        from generate_deck import base_template, new_presentation
+        theme = build_theme(load_brand(BRAND_JSON))
+        assert base_template(theme) is base_template(theme)
+        assert len(new_presentation(theme).slide_layouts) == 1
+
+    def test_repeated_generate_does_not_grow_theme_caches(self, tmp_path):
+        import generate_deck
+        import slide_builder
+        spec = {"slides": [{"type": "cover", "title": "Hi"}]}
+        generate(spec, BRAND_JSON, str(tmp_path / "a.pptx"))
+        sizes = len(generate_deck._BASE_TEMPLATES), len(slide_builder._THEME_ASSETS)
+        generate(spec, BRAND_JSON, str(tmp_path / "b.pptx"))
+        generate(spec, BRAND_JSON, str(tmp_path / "c.pptx"))
+        assert (len(generate_deck._BASE_TEMPLATES), len(slide_builder._THEME_ASSETS)) == sizes
+
+    def test_cached_slides_keep_their_layout(self, tmp_path):
+        from pptx import Presentation
+        from render_cache import RenderCache
+        cache = RenderCache(str(tmp_path / "cache"))
+        spec = {"slides": [{"type": "quote", "text": "Hi"}, {"type": "blank"}]}
+        for name in ("a", "b"):
+            generate(spec, BRAND_JSON, str(tmp_path / f"{name}.pptx"), cache=cache)
+        assert cache.hits == 2
+        layouts = [s.slide_layout.name for s in Presentation(str(tmp_path / "b.pptx")).slides]
+        assert layouts == ["OpenTeams Quote", "OpenTeams Logo Only"]
+
+
+class TestThemeScheme:
+    def _render(self, theme):
+        from generate_deck import new_presentation, render_slides
+        from slide_builder import SlideBuilder
+        prs = new_presentation(theme)
+        render_slides(SlideBuilder(prs, theme), DEMO_SPEC["slides"])
+        return prs
+
+    def _theme_xml(self, prs):
+        from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+        return prs.slide_master.part.part_related_by(RT.THEME).blob.decode()
+
+    def test_theme_part_carries_brand_palette_and_fonts(self):
+        from brand_engine import load_brand, build_theme
+        from generate_deck import new_presentation
+        theme = build_theme(load_brand(BRAND_JSON))
+        xml = self._theme_xml(new_presentation(theme))
+        assert '<a:accent1><a:srgbClr val="4D75FE"/></a:accent1>' in xml
+        assert '<a:dk2><a:srgbClr val="022791"/></a:dk2>' in xml
+        assert xml.count(f'<a:latin typeface="{theme.headline_font}"/>') == 2
+
+    def test_slides_reference_the_scheme(self):
+        from brand_engine import load_brand, build_theme
+        from pptx.enum.dml import MSO_THEME_COLOR
+        theme = build_theme(load_brand(BRAND_JSON))
+        assert theme.color_ref("day_blue") == MSO_THEME_COLOR.ACCENT_1
+        assert theme.color_ref("#FFFFFF") == MSO_THEME_COLOR.BACKGROUND_1
+        assert str(theme.color_ref("#123456")) == "123456"
+        xml = b"".join(s.part.blob for s in self._render(theme).slides).decode()
+        assert '<a:schemeClr val="accent1"/>' in xml and "4D75FE" not in xml
+        assert 'typeface="+mj-lt"' in xml
+        assert f'typeface="{theme.headline_font}"' not in xml
+
+    def test_spec_color_overrides_stay_literal(self):
+        from brand_engine import load_brand, build_theme
+        from generate_deck import new_presentation, render_slides
+        from slide_builder import SlideBuilder
+        theme = build_theme(load_brand(BRAND_JSON))
+        prs = new_presentation(theme)
+        render_slides(SlideBuilder(prs, theme), [
+            {"type": "section_divider", "title": "Brand hex", "bg_color": theme.day_blue},
+            {"type": "section_divider", "title": "Default"}])
+        override, default = (s.background._cSld.bg.xml for s in prs.slides)
+        assert '<a:srgbClr val="4D75FE"/>' in override
+        assert '<a:schemeClr val="tx2"/>' in default
+
+    def test_helper_colors_matching_the_palette_use_the_scheme(self):
+        from pptx import Presentation
+        from brand_engine import load_brand, build_theme
+        from slide_builder import SlideBuilder
+        theme = build_theme(load_brand(BRAND_JSON))
+        prs = Presentation()
+        sb = SlideBuilder(prs, theme)
+        slide = sb.new_slide()
+        card = sb.add_card(slide, 0, 0, 100, 100, fill_color="#FFFFFF", shadow=False)
+        other = sb.add_card(slide, 0, 0, 100, 100, fill_color="#123456", shadow=False)
+        assert '<a:schemeClr val="bg1"/>' in card._element.xml
+        assert '<a:srgbClr val="123456"/>' in other._element.xml
+
+    def test_retheme_changes_only_the_theme_part(self):
+        import dataclasses
+        import re
+        from brand_engine import load_brand, build_theme
+        brand = load_brand(BRAND_JSON)
+        theme = build_theme(brand)
+        # New accents with the same auto_text_color as the brand's
+        other = build_theme(dataclasses.replace(
+            brand, colors={**brand.colors, "day_blue": "#00AA55", "salmon": "#FF9966"}))
+        a, b = self._render(theme), self._render(other)
+        # Slides differ only in the render stamp, which hashes the theme
+        unstamped = lambda prs: [re.sub(rb"<p:extLst>.*</p:extLst>", b"", s.part.blob)
+                                 for s in prs.slides]
+        assert unstamped(a) == unstamped(b)
+        assert [l.part.blob for l in a.slide_layouts] == [l.part.blob for l in b.slide_layouts]
+        assert self._theme_xml(a) != self._theme_xml(b)
+        assert '<a:accent1><a:srgbClr val="00AA55"/></a:accent1>' in self._theme_xml(b)
+
+
+class TestTextStyles:
+    def _builder(self):
+        from brand_engine import load_brand, build_theme
+        from generate_deck import new_presentation
+        from slide_builder import SlideBuilder
+        theme = build_theme(load_brand(BRAND_JSON))
+        return SlideBuilder(new_presentation(theme), theme)
+
+    def test_presentation_defaults_to_the_body_style(self):
+        sb = self._builder()
+        xml = sb.prs.part.blob.decode()
+        default = xml[xml.index("<p:defaultTextStyle>"):xml.index("</a:lvl1pPr>")]
+        assert f'sz="{sb.theme.body_size * 100}"' in default
+        assert '<a:schemeClr val="accent4"/>' in default and "+mn-lt" in default
+
+    def test_paragraphs_and_runs_carry_only_deviations(self):
+        from lxml import etree
+        from pptx.oxml.ns import qn
+        sb = self._builder()
+        slide = sb.new_slide()
+        body = sb.add_body(slide, "one\ntwo\nthree")
+        bullets = sb.add_bullet_list(slide, ["a", "b"], font_size=16)
+        for box in (body, bullets):
+            txBody = box._element.txBody
+            assert len(txBody.find(qn("a:lstStyle"))) == 1
+            assert not txBody.findall(f"{qn('a:p')}/{qn('a:pPr')}")
+        glyph, item = bullets._element.txBody.p_lst[0].r_lst
+        assert item.find(qn("a:rPr")) is None
+        assert etree.tostring(glyph.find(qn("a:rPr"))).count(b"<a:") == 3  # size + color only
+        assert [p.text for p in body.text_frame.paragraphs] == ["one", "two", "three"]
+
+
+class TestMediaAssets:
+    def test_assets_read_once_per_theme(self, monkeypatch):
+        import builtins
+        import slide_builder
+        from pptx.package import Package
+        from brand_engine import load_brand, build_theme
+        from generate_deck import new_presentation, render_slides
+
+        reads, searches = [], []
+        real_open = builtins.open
+        monkeypatch.setattr(slide_builder, "open",
+                            lambda path, *a, **k: reads.append(path) or real_open(path, *a, **k),
+                            raising=False)
+        real_search = Package.get_or_add_image_part
+        monkeypatch.setattr(Package, "get_or_add_image_part",
+                            lambda self, f: searches.append(1) or real_search(self, f))
+
+        theme = build_theme(load_brand(BRAND_JSON))
+        for _ in range(2):  # two decks sharing one theme, as in batch mode
+            prs = new_presentation(theme)
+            render_slides(slide_builder.SlideBuilder(prs, theme), DEMO_SPEC["slides"] * 3)
+        assert len(reads) == len(set(reads)) <= 4
+        # Once per distinct image per deck (plus the scratch deck the
+        # layouts are drawn on), not once per picture
+        assert len(searches) <= 3 * 3
+
+
+class TestValidateOnly:
+    GENERATE = os.path.join(SCRIPTS_DIR, "generate_deck.py")
+    # Generous for slow CI machines; a stdlib-only run measures ~20ms locally
+    IMPORT_BUDGET_MS = 150
+
+    def _run(self, *args, stdin=None):
+        import subprocess
+        return subprocess.run([sys.executable, *args], input=stdin, capture_output=True,
+                              text=True, timeout=60)
+
+    def test_stdlib_only_within_import_budget(self, tmp_path):
+        spec = tmp_path / "spec.json"
+        spec.write_text(json.dumps(DEMO_SPEC))
+        proc = self._run("-X", "importtime", self.GENERATE, "--validate-only",
+                         "--spec", str(spec))
+        assert proc.returncode == 0, proc.stderr
+        modules, total_us = set(), 0
+        for line in proc.stderr.splitlines():
+            if not line.startswith("import time:") or "self [us]" in line:
+                continue
+            self_us, _cumulative, name = line[len("import time:"):].split("|")
+            modules.add(name.strip())
+            total_us += int(self_us)
+        assert not {m for m in modules if m.split(".")[0] in ("pptx", "lxml", "PIL")}
+        assert total_us / 1000 < self.IMPORT_BUDGET_MS
+
+    def test_reports_errors_without_brand_or_out(self):
+        bad = json.dumps({"slides": [{"type": "quote"}, {"type": "unicorn"}]})
+        proc = self._run(self.GENERATE, "--validate-only", stdin=bad)
+        assert proc.returncode == 1
+        assert "'text'" in proc.stderr and "unicorn" in proc.stderr
+
+    def test_stream_and_batch_validation(self, tmp_path):
+        proc = self._run(self.GENERATE, "--validate-only", "--stream", "jsonl",
+                         stdin='{"type": "cover", "title": "A"}\n{"type": "blank"}\n')
+        assert proc.returncode == 0, proc.stderr
+        jsonl = tmp_path / "specs.jsonl"
+        jsonl.write_text(json.dumps(DEMO_SPEC) + "\n" + '{"slides": [{"type": "quote"}]}\n')
+        proc = self._run(self.GENERATE, "--validate-only", "--spec-jsonl", str(jsonl))
+        assert proc.returncode == 1
+        assert "✓" in proc.stderr and "❌" in proc.stderr
+
+
+# ---------------------------------------------------------------------------
+# Benchmark result comparison
+# ---------------------------------------------------------------------------
+
+class TestBenchCompare:
+    @pytest.fixture(autouse=True)
+    def _bench(self):
+        sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "benchmarks"))
+        import bench
+        self.bench = bench
+
+    def test_compare_and_fail_over(self, capsys):
+        old = {"micro": {"hex": {"median_us": 2.0}, "gone": {"median_us": 1.0}},
+               "macro": {"generate_10": {"wall_s": 1.0, "peak_rss_mb": None,
+                                         "output_bytes": 1000}}}
+        new = {"micro": {"hex": {"median_us": 3.0}},
+               "macro": {"generate_10": {"wall_s": 0.5, "peak_rss_mb": 60.0,
+                                         "output_bytes": 1000}}}
+        rows = {(r["benchmark"], r["metric"]): r["change_pct"]
+                for r in self.bench.compare(old, new)}
+        assert rows == {("hex", "median_us"): 50.0, ("generate_10", "wall_s"): -50.0,
+                        ("generate_10", "output_bytes"): 0.0}
+        assert self.bench.print_comparison(self.bench.compare(old, new), 60) == 0
+        assert self.bench.print_comparison(self.bench.compare(old, new), 10) == 1
+        assert "1 metric(s) regressed" in capsys.readouterr().out
+
+
+# ---------------------------------------------------------------------------
+# Synthetic specs + scalability fit
+# ---------------------------------------------------------------------------
+
+class TestScalability:
+    @pytest.fixture(autouse=True)
+    def _bench(self):
+        sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "benchmarks"))
+
+    def test_synthetic_spec_is_valid_and_deterministic(self):
+        from synthetic import synthetic_spec, SLIDE_TYPES
+        spec = synthetic_spec(3 * len(SLIDE_TYPES), items=30, body_lines=20, seed=7)
+        assert validate_spec(spec) == []
+        assert spec == synthetic_spec(3 * len(SLIDE_TYPES), items=30, body_lines=20, seed=7)
+        assert {s["type"] for s in spec["slides"]} == set(SLIDE_TYPES)
+        agenda = next(s for s in spec["slides"] if s["type"] == "agenda")
+        assert len(agenda["items"]) == 30
+
+    def test_mix_weights(self):
+        from synthetic import synthetic_spec
+        types = [s["type"] for s in synthetic_spec(40, mix={"agenda": 3, "quote": 1})["slides"]]
+        assert types.count("agenda") == 30 and types.count("quote") == 10
+        with pytest.raises(ValueError):
+            synthetic_spec(1, mix={"unicorn": 1})
+
+    def test_growth_exponent(self):
+        from scalability import growth_exponent, fit
+        sizes = [100, 200, 400, 800]
+        # Fixed cost + linear work fits as linear; quadratic work does not
+        assert growth_exponent(sizes, [5 + 0.01 * n for n in sizes]) == pytest.approx(1.0)
+        assert growth_exponent(sizes, [5 + 1e-4 * n * n for n in sizes]) > 1.5
+        points = [{"n": n, "wall_s": 1e-4 * n * n, "memory_mb": 1.0} for n in sizes]
+        wall, memory = fit(points, tolerance=0.2)
+        assert not wall.ok and memory.ok and memory.exponent is None
+
+
+# ---------------------------------------------------------------------------
+# Tracing / profiling
+# ---------------------------------------------------------------------------
+
+class TestTracing:
+    def test_trace_events_nest_under_slides(self, tmp_path):
+        import tracing
+        trace = tmp_path / "trace.json"
+        profile = tmp_path / "run.pstats"
+        with tracing.session(str(trace), str(profile)):
+            generate(DEMO_SPEC, BRAND_JSON, str(tmp_path / "deck.pptx"))
+        events = json.loads(trace.read_text())["traceEvents"]
+        assert all(e["ph"] == "X" and e["dur"] >= 0 for e in events)
+        names = {e["name"] for e in events}
+        assert {"load brand", "save", "render_cover", "SlideBuilder.add_body"} <= names
+
+        renders = [e for e in events if e["cat"] == "renderer"]
+        assert [e["args"]["slide"] for e in renders] == list(range(1, 11))
+        team = next(e for e in renders if e["args"]["type"] == "team")
+        inside = [e for e in events if e["cat"] == "helper"
+                  and team["ts"] <= e["ts"] <= team["ts"] + team["dur"]]
+        assert inside and all(e["args"] == {"slide": team["args"]["slide"], "type": "team"}
+                              for e in inside)
+
+        import pstats
+        assert pstats.Stats(str(profile)).total_calls > 0
+
+    def test_off_by_default(self):
+        import tracing
+        assert tracing._tracer is None
+        assert tracing.span("x") is tracing.span("y", slide=1)
+
+
+# ---------------------------------------------------------------------------
+# Generation metrics
+# ---------------------------------------------------------------------------
+
+class TestMetrics:
+    @pytest.fixture(autouse=True)
+    def _reset(self):
+        import metrics
+        metrics.REGISTRY.reset()
+        yield
+        metrics.REGISTRY.reset()
+
+    def test_exposition_format_and_merge(self, tmp_path):
+        from metrics import Registry
+        reg = Registry()
+        c = reg.counter("t_total", "Things.", ("kind",))
+        h = reg.histogram("t_seconds", "Time.", buckets=(0.1, 1.0))
+        c.inc(kind='a"b')
+        h.observe(0.05)
+        h.observe(5)
+        other = Registry()
+        other.counter("t_total", "Things.", ("kind",)).inc(2, kind='a"b')
+        reg.merge(other.drain())
+        assert other.snapshot() == {}
+
+        path = tmp_path / "m.prom"
+        reg.write_textfile(str(path))
+        text = path.read_text()
+        assert "# TYPE t_total counter" in text
+        assert 't_total{kind="a\\"b"} 3' in text
+        assert 't_seconds_bucket{le="0.1"} 1' in text
+        assert 't_seconds_bucket{le="1"} 1' in text
+        assert 't_seconds_bucket{le="+Inf"} 2' in text
+        assert "t_seconds_count 2" in text
+        assert not [p for p in os.listdir(tmp_path) if p != "m.prom"]
+
+    def test_generate_records_slides_and_failures(self, tmp_path):
+        import metrics
+        from generate_deck import render_deck, SpecValidationError
+        out = tmp_path / "deck.pptx"
+        generate(DEMO_SPEC, BRAND_JSON, str(out))
+        assert metrics.DECKS.value() == 1
+        assert metrics.BYTES_WRITTEN.value() == out.stat().st_size
+        assert metrics.SLIDES.value(type="team", source="rendered") == 1
+        assert metrics.SHAPES.value(type="team") > 4
+        assert metrics.PICTURES.value(type="cover") == 0  # logos live in the layout
+        assert metrics.RENDER_SECONDS.count(renderer="render_metrics") == 1
+        with pytest.raises(SpecValidationError):
+            render_deck({"slides": [{"type": "quote"}]}, None, str(out))
+        assert metrics.VALIDATION_FAILURES.value() == 1
+
+    def test_worker_metrics_reach_the_parent(self, tmp_path):
+        import metrics
+        from batch import DeckJob, generate_many
+        jobs = [DeckJob(f"d{i}", {"slides": [{"type": "cover", "title": "A"},
+                                             {"type": "blank"}]}) for i in range(3)]
+        generate_many(jobs, BRAND_JSON, str(tmp_path), workers=2)
+        assert metrics.DECKS.value() == 3
+        assert metrics.SLIDES.value(type="cover", source="rendered") == 3
+        assert metrics.SLIDES.value(type="blank", source="rendered") == 3